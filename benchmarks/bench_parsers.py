@@ -0,0 +1,76 @@
+"""
+Benchmark the job card parser backends against a recorded LinkedIn search page.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_parsers [--iterations 50] [--json]
+"""
+import argparse
+import json
+import os
+import time
+from typing import Dict, List
+
+from job_card_parser import JobCardParser, PARSER_BACKENDS, LXML_AVAILABLE
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+SEARCH_FIXTURE = os.path.join(FIXTURES_DIR, 'linkedin_search.html')
+
+
+def load_fixture(path: str = SEARCH_FIXTURE) -> bytes:
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def bench_backend(backend: str, content: bytes, iterations: int) -> Dict:
+    """Parse the page `iterations` times and report throughput."""
+    parser = JobCardParser(backend)
+    jobs, card_count = parser.parse(content)  # warm-up
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        parser.parse(content)
+    elapsed = time.perf_counter() - start
+
+    return {
+        'backend': backend,
+        'cards_per_page': card_count,
+        'pages_per_second': iterations / elapsed,
+        'cards_per_second': iterations * card_count / elapsed,
+        'ms_per_page': elapsed / iterations * 1000,
+        'jobs': jobs
+    }
+
+
+def run(iterations: int = 50) -> List[Dict]:
+    content = load_fixture()
+    backends = [b for b in PARSER_BACKENDS if b != 'lxml' or LXML_AVAILABLE]
+    results = [bench_backend(backend, content, iterations) for backend in backends]
+
+    # Every backend must agree with the reference html.parser output
+    reference = results[-1]['jobs']
+    for result in results:
+        result['matches_reference'] = result.pop('jobs') == reference
+    return results
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--iterations', type=int, default=50)
+    arg_parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = arg_parser.parse_args()
+
+    results = run(args.iterations)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    if not LXML_AVAILABLE:
+        print("lxml is not installed; skipping the lxml backend\n")
+    print(f"{'backend':<12} {'cards/s':>10} {'ms/page':>9}  same output")
+    for r in results:
+        print(f"{r['backend']:<12} {r['cards_per_second']:>10.0f} {r['ms_per_page']:>9.2f}  {r['matches_reference']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark HTMLGenerator: render time and peak Python memory by job count.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_render [--sizes 100 10000 100000] [--fragment-cache] [--json]
+
+With --fragment-cache, each size is rendered twice through a fresh fragment
+cache: once cold (every card rendered) and once warm (every card reused).
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, List
+
+from fragment_cache import FragmentCache
+from html_generator import HTMLGenerator
+
+PRIORITIES = ('HIGH', 'MED', 'LOW')
+
+
+def make_jobs(count: int) -> List[Dict]:
+    """Scored jobs with realistic field lengths."""
+    return [
+        {
+            'title': f'Junior Software Engineer #{i}',
+            'company': f'Company {i % 500}',
+            'location': 'Tel Aviv, Israel',
+            'url': f'https://www.linkedin.com/jobs/view/{3790000000 + i}/',
+            'description': 'We are looking for a motivated engineer to join our platform team. ' * 4,
+            'priority': PRIORITIES[i % 3],
+            'reasoning': 'Good match with the required Python and React skills, with some gaps in cloud experience.'
+        }
+        for i in range(count)
+    ]
+
+
+def timed_generate(generator: HTMLGenerator, jobs: List[Dict]) -> tuple[float, int]:
+    """Render time in seconds and peak traced memory in bytes."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    generator.generate(jobs)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def bench_size(count: int, output_dir: str, use_fragment_cache: bool = False) -> Dict:
+    jobs = make_jobs(count)
+    output_path = os.path.join(output_dir, f'jobs_{count}.html')
+    fragment_cache = None
+    if use_fragment_cache:
+        fragment_cache = FragmentCache(os.path.join(output_dir, f'fragments_{count}.sqlite3'))
+    generator = HTMLGenerator(output_path, fragment_cache=fragment_cache)
+
+    elapsed, peak = timed_generate(generator, jobs)
+    result = {
+        'jobs': count,
+        'seconds': elapsed,
+        'jobs_per_second': count / elapsed if elapsed else 0.0,
+        'peak_memory_mb': peak / 1024 / 1024,
+        'output_mb': os.path.getsize(output_path) / 1024 / 1024
+    }
+    if fragment_cache is not None:
+        result['warm_seconds'], _ = timed_generate(generator, jobs)
+        fragment_cache.close()
+    return result
+
+
+def run(sizes: List[int], use_fragment_cache: bool = False) -> List[Dict]:
+    with tempfile.TemporaryDirectory() as output_dir:
+        return [bench_size(count, output_dir, use_fragment_cache) for count in sizes]
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--sizes', type=int, nargs='+', default=[100, 10000, 100000])
+    arg_parser.add_argument('--fragment-cache', action='store_true', help='Also time a warm fragment-cache render')
+    arg_parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = arg_parser.parse_args()
+
+    results = run(args.sizes, args.fragment_cache)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    warm = ' warm s' if args.fragment_cache else ''
+    print(f"{'jobs':>8} {'seconds':>9} {'jobs/s':>10} {'peak MB':>9} {'page MB':>9}{warm}")
+    for r in results:
+        warm = f" {r['warm_seconds']:>6.3f}" if 'warm_seconds' in r else ''
+        print(f"{r['jobs']:>8} {r['seconds']:>9.3f} {r['jobs_per_second']:>10.0f} "
+              f"{r['peak_memory_mb']:>9.2f} {r['output_mb']:>9.2f}{warm}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,213 @@
+"""
+Offline end-to-end benchmark: fetch → enrich → score → render with no network.
+
+LinkedIn pages are replayed from benchmarks/fixtures/ through LinkedInJobFetcher,
+JobScorer talks to the local fake Anthropic server, and HTMLGenerator writes to a
+temporary directory. Each stage reports its wall time, throughput and request
+latency percentiles, so runs before and after a change can be compared.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_suite [--jobs 200] [--keywords 2] [--http-latency-ms 20]
+        [--llm-latency-ms 100] [--llm-error-rate 0.05] [--tokens-per-second 0]
+        [--concurrency 8] [--batch-size 1] [--response-mode full] [--pipeline] [--seed 1] [--output report.json] [--json]
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+from typing import Dict, List
+
+from benchmarks.fake_anthropic import FakeAnthropicServer
+from benchmarks.replay import ReplaySession
+from html_generator import HTMLGenerator
+from job_scorer import JobScorer, RESPONSE_MODES
+from linkedin_fetcher import LinkedInJobFetcher
+from metrics import RunMetrics, _percentile
+from pipeline import JobPipeline
+from rate_limiter import RateLimiter
+
+KEYWORDS = ('software engineer', 'python developer', 'react developer', 'backend engineer',
+            'full stack developer', 'data engineer', 'devops engineer', 'frontend engineer')
+
+PROFILE = {
+    'user_profile': 'Junior full-stack developer looking for a first role in a product company.',
+    'user_skills': 'Python, JavaScript, React, Node.js, SQL, Git',
+    'user_experience': '0-2'
+}
+
+# Histograms from RunMetrics reported for each stage
+STAGE_HISTOGRAMS = {
+    'fetch': ('http_request_seconds{kind="search"}', 'parse_seconds'),
+    'enrich': ('http_request_seconds{kind="detail"}',),
+    'score': ('llm_call_seconds', 'llm_time_to_priority_seconds'),
+    'render': ()
+}
+
+
+def latency_summary(values: List[float]) -> Dict:
+    """count, p50, p95 and max of a list of seconds, in milliseconds."""
+    if not values:
+        return {'count': 0}
+    values = sorted(values)
+    return {
+        'count': len(values),
+        'p50_ms': _percentile(values, 0.5) * 1000,
+        'p95_ms': _percentile(values, 0.95) * 1000,
+        'max_ms': values[-1] * 1000
+    }
+
+
+def stage_result(seconds: float, items: int) -> Dict:
+    return {'seconds': seconds, 'items': items, 'items_per_second': items / seconds if seconds else 0.0}
+
+
+def run(jobs: int = 200, keywords: int = 2, http_latency_ms: float = 20, http_error_rate: float = 0.0,
+        llm_latency_ms: float = 100, llm_error_rate: float = 0.0, tokens_per_second: float = 0,
+        concurrency: int = 8, batch_size: int = 1, response_mode: str = 'full', detail_workers: int = 8,
+        pipeline: bool = False, seed: int = 1) -> Dict:
+    metrics = RunMetrics()
+    session = ReplaySession(latency_ms=http_latency_ms, error_rate=http_error_rate, seed=seed)
+    fetcher = LinkedInJobFetcher(
+        keywords=list(KEYWORDS[:max(1, keywords)]),
+        location='Israel',
+        limit=jobs,
+        max_workers=keywords,
+        # Fast enough that the replayed latency, not the limiter, sets the pace
+        rate_limiter=RateLimiter(rate_per_second=1000, burst=100),
+        session=session,
+        detail_workers=detail_workers,
+        metrics=metrics
+    )
+
+    with FakeAnthropicServer(latency_ms=llm_latency_ms, error_rate=llm_error_rate,
+                             output_tokens_per_second=tokens_per_second, seed=seed) as server, \
+            tempfile.TemporaryDirectory() as output_dir:
+        scorer = JobScorer(
+            api_key='fake',
+            base_url=server.base_url,
+            max_concurrency=concurrency,
+            retry_base_delay=0.05,
+            retry_max_delay=0.5,
+            metrics=metrics,
+            response_mode=response_mode,
+            **PROFILE
+        )
+        generator = HTMLGenerator(os.path.join(output_dir, 'jobs_output.html'))
+
+        def score(page: List[Dict]):
+            if batch_size > 1:
+                scorer.batch_score_jobs(page, batch_size=batch_size)
+            else:
+                scorer.score_jobs(page)
+
+        stage_seconds = {}
+        start = time.perf_counter()
+        if pipeline:
+            job_pipeline = JobPipeline(fetcher.iter_pages(), score, enrich=fetcher.enrich_jobs)
+            scored_jobs = job_pipeline.run()
+            # Stages overlap, so these are busy times and add up to more than the total
+            for name in ('fetch', 'enrich', 'score'):
+                stage_seconds[name] = job_pipeline.stage_seconds[name]
+        else:
+            scored_jobs = fetcher.fetch_jobs()
+            stage_seconds['fetch'] = time.perf_counter() - start
+            for name, work in (('enrich', fetcher.enrich_jobs), ('score', score)):
+                stage_start = time.perf_counter()
+                work(scored_jobs)
+                stage_seconds[name] = time.perf_counter() - stage_start
+
+        render_start = time.perf_counter()
+        generator.generate(scored_jobs)
+        stage_seconds['render'] = time.perf_counter() - render_start
+        total_seconds = time.perf_counter() - start
+        llm_requests, llm_errors = server.requests, server.errors
+        llm_output_tokens, llm_streams_cancelled = server.output_tokens, server.streams_cancelled
+
+    report = metrics.report()
+    stages = {}
+    for name, seconds in stage_seconds.items():
+        stage = stage_result(seconds, len(scored_jobs))
+        for histogram in STAGE_HISTOGRAMS[name]:
+            summary = report['histograms'].get(histogram)
+            stage[histogram] = {
+                'count': summary['count'],
+                'p50_ms': summary['p50'] * 1000,
+                'p95_ms': summary['p95'] * 1000,
+                'max_ms': summary['max'] * 1000
+            } if summary else {'count': 0}
+        stages[name] = stage
+    stages['score']['job_latency'] = latency_summary(
+        [job['scoring_latency_ms'] / 1000 for job in scored_jobs if 'scoring_latency_ms' in job]
+    )
+
+    return {
+        'config': {
+            'jobs': jobs, 'keywords': keywords, 'http_latency_ms': http_latency_ms,
+            'http_error_rate': http_error_rate, 'llm_latency_ms': llm_latency_ms,
+            'llm_error_rate': llm_error_rate, 'tokens_per_second': tokens_per_second,
+            'concurrency': concurrency, 'batch_size': batch_size, 'response_mode': response_mode,
+            'detail_workers': detail_workers, 'pipeline': pipeline, 'seed': seed
+        },
+        'total': stage_result(total_seconds, len(scored_jobs)),
+        'stages': stages,
+        'requests': {
+            'http': session.requests, 'http_throttled': session.throttled,
+            'llm': llm_requests, 'llm_errors': llm_errors,
+            'llm_output_tokens': llm_output_tokens, 'llm_streams_cancelled': llm_streams_cancelled
+        },
+        'counters': report['counters']
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--jobs', type=int, default=200)
+    arg_parser.add_argument('--keywords', type=int, default=2, help=f'Keyword workers (1-{len(KEYWORDS)})')
+    arg_parser.add_argument('--http-latency-ms', type=float, default=20)
+    arg_parser.add_argument('--http-error-rate', type=float, default=0.0, help='Share of LinkedIn requests answered 429')
+    arg_parser.add_argument('--llm-latency-ms', type=float, default=100)
+    arg_parser.add_argument('--llm-error-rate', type=float, default=0.0, help='Share of LLM requests answered 429/529')
+    arg_parser.add_argument('--tokens-per-second', type=float, default=0,
+                            help='Fake LLM output speed (0 = replies arrive at once)')
+    arg_parser.add_argument('--concurrency', type=int, default=8, help='Concurrent LLM requests')
+    arg_parser.add_argument('--batch-size', type=int, default=1, help='Jobs per LLM prompt')
+    arg_parser.add_argument('--response-mode', choices=RESPONSE_MODES, default='full')
+    arg_parser.add_argument('--detail-workers', type=int, default=8)
+    arg_parser.add_argument('--pipeline', action='store_true', help='Run fetch, enrich and score as a pipeline')
+    arg_parser.add_argument('--seed', type=int, default=1)
+    arg_parser.add_argument('--output', help='Also write the JSON report to this file')
+    arg_parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = arg_parser.parse_args()
+
+    result = run(
+        jobs=args.jobs, keywords=min(max(1, args.keywords), len(KEYWORDS)),
+        http_latency_ms=args.http_latency_ms, http_error_rate=args.http_error_rate,
+        llm_latency_ms=args.llm_latency_ms, llm_error_rate=args.llm_error_rate,
+        tokens_per_second=args.tokens_per_second, concurrency=args.concurrency,
+        batch_size=args.batch_size, response_mode=args.response_mode,
+        detail_workers=args.detail_workers, pipeline=args.pipeline, seed=args.seed
+    )
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+
+    print(f"\n{'stage':<8} {'seconds':>9} {'jobs/s':>9}   latency (p50 / p95 ms)")
+    for name, stage in result['stages'].items():
+        latencies = [f"{key.split('{')[0]} {value['p50_ms']:.1f} / {value['p95_ms']:.1f}"
+                     for key, value in stage.items() if isinstance(value, dict) and value.get('count')]
+        print(f"{name:<8} {stage['seconds']:>9.3f} {stage['items_per_second']:>9.1f}   {', '.join(latencies)}")
+    total = result['total']
+    print(f"{'total':<8} {total['seconds']:>9.3f} {total['items_per_second']:>9.1f}")
+    requests = result['requests']
+    print(f"HTTP requests: {requests['http']} ({requests['http_throttled']} throttled); "
+          f"LLM requests: {requests['llm']} ({requests['llm_errors']} errors, "
+          f"{requests['llm_output_tokens']} output tokens, {requests['llm_streams_cancelled']} streams cancelled)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,392 @@
+"""
+A local stand-in for the Anthropic Messages API.
+
+Answers POST /v1/messages with a deterministic PRIORITY/REASONING reply,
+after a configurable latency, and fails a configurable share of requests
+with 429 (rate limited) or 529 (overloaded), or any of `error_statuses`,
+so retry logic can be exercised.
+With `output_tokens_per_second` set, replies take as long to generate as a
+real model's would, and `"stream": true` requests get the reply as server-sent
+events token by token; a client that disconnects early stops generation.
+`max_tokens` and `stop_sequences` are honored. Also implements the Message
+Batches endpoints; a batch ends `batch_processing_s` seconds after it is created.
+
+Usage (from the repository root):
+    python -m benchmarks.fake_anthropic [--port 8765] [--latency-ms 200] [--error-rate 0.1]
+        [--tokens-per-second 80]
+
+then point the scorer at it with ANTHROPIC_BASE_URL=http://127.0.0.1:8765
+"""
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+from llm_usage import min_cacheable_tokens
+
+PRIORITIES = ('HIGH', 'MED', 'LOW')
+
+# Error type and message sent with each injected status
+ERRORS = {
+    400: ('invalid_request_error', 'Fake invalid request'),
+    401: ('authentication_error', 'Fake authentication failure'),
+    429: ('rate_limit_error', 'Fake rate limit'),
+    500: ('api_error', 'Fake internal error'),
+    529: ('overloaded_error', 'Fake overload'),
+}
+
+# Job and profile markers used by JobScorer's batch and MultiProfileScorer's prompts
+BATCH_JOB_ID = re.compile(r'\[(?:JOB|PROFILE) ID: ([^\]]+)\]')
+
+
+def _prompt_text(body: Dict) -> str:
+    """Flatten system and message content blocks into one string."""
+    parts = []
+    system = body.get('system')
+    if isinstance(system, str):
+        parts.append(system)
+    elif isinstance(system, list):
+        parts.extend(block.get('text', '') for block in system)
+    for message in body.get('messages', []):
+        content = message.get('content')
+        if isinstance(content, str):
+            parts.append(content)
+        else:
+            parts.extend(block.get('text', '') for block in content or [])
+    return '\n'.join(parts)
+
+
+def _fake_priority(text: str) -> str:
+    return PRIORITIES[int(hashlib.sha256(text.encode('utf-8')).hexdigest(), 16) % 3]
+
+
+def fake_reply(prompt: str) -> str:
+    """
+    Deterministic reply for a prompt, so repeated runs give the same scores.
+    Multi-job and multi-profile prompts get an ID-keyed JSON reply, without reasoning when the
+    prompt doesn't ask for it.
+    """
+    job_ids = BATCH_JOB_ID.findall(prompt)
+    if job_ids:
+        with_reasoning = '"reasoning"' in prompt
+        return json.dumps({
+            job_id: {'priority': _fake_priority(prompt + job_id),
+                     **({'reasoning': 'Fake batch assessment for benchmarking.'} if with_reasoning else {})}
+            for job_id in job_ids
+        })
+
+    priority = _fake_priority(prompt)
+    return (f"PRIORITY: {priority}\n"
+            f"REASONING: Fake assessment for benchmarking. The posting was rated {priority} "
+            f"by the local fake Anthropic server. The required skills overlap partly with the "
+            f"profile, and the seniority level is a reasonable fit. Growth potential and the day-to-day "
+            f"responsibilities were weighed against the gaps in the stack.")
+
+
+def _split_tokens(text: str) -> list:
+    """Split text into ~4-character pieces, one per simulated output token."""
+    return [text[i:i + 4] for i in range(0, len(text), 4)]
+
+
+def _sse(event: str, data: Dict) -> bytes:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n".encode('utf-8')
+
+
+class FakeAnthropicServer:
+    """
+    Threaded fake Anthropic endpoint. Use as a context manager:
+
+        with FakeAnthropicServer(latency_ms=100, error_rate=0.1) as server:
+            scorer = JobScorer(..., base_url=server.base_url)
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, latency_ms: float = 0,
+                 error_rate: float = 0.0, seed: Optional[int] = None, batch_processing_s: float = 0,
+                 output_tokens_per_second: float = 0, error_statuses: tuple = (429, 529)):
+        self.latency_ms = latency_ms
+        self.error_rate = error_rate
+        self.error_statuses = error_statuses
+        self.batch_processing_s = batch_processing_s
+        self.output_tokens_per_second = output_tokens_per_second
+        self.requests = 0
+        self.errors = 0
+        # Output tokens actually generated, and streams the client closed before the end
+        self.output_tokens = 0
+        self.streams_cancelled = 0
+        self.batches: Dict[str, Dict] = {}
+        self._cached_prefixes = set()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'FakeAnthropicServer':
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """Serve in the calling thread until interrupted."""
+        self._httpd.serve_forever()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> 'FakeAnthropicServer':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _next_failure(self) -> Optional[int]:
+        with self._lock:
+            self.requests += 1
+            if self._random.random() < self.error_rate:
+                self.errors += 1
+                return self._random.choice(self.error_statuses)
+        return None
+
+    def _cache_usage(self, body: Dict) -> tuple[int, int]:
+        """
+        Simulate prompt caching of system blocks marked with cache_control. Like the
+        real API, prefixes below the model's minimum cacheable length are not cached.
+        """
+        system = body.get('system')
+        if not isinstance(system, list):
+            return 0, 0
+        cached_text = ''.join(block.get('text', '') for block in system if block.get('cache_control'))
+        tokens = len(cached_text) // 4
+        if not cached_text or tokens < min_cacheable_tokens(body.get('model', '')):
+            return 0, 0
+        with self._lock:
+            if cached_text in self._cached_prefixes:
+                return 0, tokens
+            self._cached_prefixes.add(cached_text)
+        return tokens, 0
+
+    def _generate(self, body: Dict) -> tuple[str, str, Optional[str]]:
+        """The reply text cut at the first stop sequence or max_tokens, with its stop reason."""
+        text = fake_reply(_prompt_text(body))
+        stops = [(text.find(stop), stop) for stop in body.get('stop_sequences') or [] if stop in text]
+        if stops:
+            index, stop = min(stops)
+            return text[:index], 'stop_sequence', stop
+        max_chars = body.get('max_tokens', 4096) * 4
+        if len(text) > max_chars:
+            return text[:max_chars], 'max_tokens', None
+        return text, 'end_turn', None
+
+    def _message(self, body: Dict, text: str, stop_reason: Optional[str], stop_sequence: Optional[str]) -> Dict:
+        prompt = _prompt_text(body)
+        cache_write, cache_read = self._cache_usage(body)
+        return {
+            'id': 'msg_fake_' + hashlib.sha1(prompt.encode('utf-8')).hexdigest()[:24],
+            'type': 'message',
+            'role': 'assistant',
+            'model': body.get('model', 'fake-model'),
+            'content': [{'type': 'text', 'text': text}] if text else [],
+            'stop_reason': stop_reason,
+            'stop_sequence': stop_sequence,
+            'usage': {
+                # Rough 4-characters-per-token estimate
+                'input_tokens': max(0, len(prompt) // 4 - cache_write - cache_read),
+                'output_tokens': len(_split_tokens(text)),
+                'cache_creation_input_tokens': cache_write,
+                'cache_read_input_tokens': cache_read
+            }
+        }
+
+    def _count_output(self, tokens: int):
+        with self._lock:
+            self.output_tokens += tokens
+
+    def handle_messages(self, body: Dict) -> Dict:
+        text, stop_reason, stop_sequence = self._generate(body)
+        tokens = len(_split_tokens(text))
+        if self.output_tokens_per_second:
+            time.sleep(tokens / self.output_tokens_per_second)
+        self._count_output(tokens)
+        return self._message(body, text, stop_reason, stop_sequence)
+
+    def stream_messages(self, body: Dict, write) -> None:
+        """Send the reply as Messages API stream events through `write(bytes)`."""
+        text, stop_reason, stop_sequence = self._generate(body)
+        start = self._message(body, '', None, None)
+        start['usage']['output_tokens'] = 1
+        write(_sse('message_start', {'type': 'message_start', 'message': start}))
+        write(_sse('content_block_start', {'type': 'content_block_start', 'index': 0,
+                                           'content_block': {'type': 'text', 'text': ''}}))
+        sent = 0
+        try:
+            for token in _split_tokens(text):
+                if self.output_tokens_per_second:
+                    time.sleep(1 / self.output_tokens_per_second)
+                write(_sse('content_block_delta', {'type': 'content_block_delta', 'index': 0,
+                                                   'delta': {'type': 'text_delta', 'text': token}}))
+                sent += 1
+            write(_sse('content_block_stop', {'type': 'content_block_stop', 'index': 0}))
+            write(_sse('message_delta', {'type': 'message_delta',
+                                         'delta': {'stop_reason': stop_reason, 'stop_sequence': stop_sequence},
+                                         'usage': {'output_tokens': sent}}))
+            write(_sse('message_stop', {'type': 'message_stop'}))
+        except (BrokenPipeError, ConnectionResetError):
+            with self._lock:
+                self.streams_cancelled += 1
+        finally:
+            self._count_output(sent)
+
+    def create_batch(self, body: Dict) -> Dict:
+        with self._lock:
+            batch_id = f"msgbatch_fake_{len(self.batches) + 1:06d}"
+            self.batches[batch_id] = {'created_at': time.time(), 'requests': body.get('requests', [])}
+        return self.batch_status(batch_id)
+
+    def batch_status(self, batch_id: str) -> Optional[Dict]:
+        batch = self.batches.get(batch_id)
+        if batch is None:
+            return None
+
+        ended = time.time() - batch['created_at'] >= self.batch_processing_s
+        count = len(batch['requests'])
+        created_at = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(batch['created_at']))
+        return {
+            'id': batch_id,
+            'type': 'message_batch',
+            'processing_status': 'ended' if ended else 'in_progress',
+            'request_counts': {'processing': 0 if ended else count, 'succeeded': count if ended else 0,
+                               'errored': 0, 'canceled': 0, 'expired': 0},
+            'created_at': created_at,
+            'expires_at': created_at,
+            'ended_at': created_at if ended else None,
+            'archived_at': None,
+            'cancel_initiated_at': None,
+            'results_url': f"{self.base_url}/v1/messages/batches/{batch_id}/results" if ended else None
+        }
+
+    def batch_results(self, batch_id: str) -> bytes:
+        lines = []
+        for request in self.batches[batch_id]['requests']:
+            lines.append(json.dumps({
+                'custom_id': request['custom_id'],
+                'result': {'type': 'succeeded',
+                           'message': self._message(request['params'], *self._generate(request['params']))}
+            }))
+        return ('\n'.join(lines) + '\n').encode('utf-8')
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def _send_json(self, status: int, payload: Dict, headers: Optional[Dict] = None):
+                data = json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _not_found(self):
+                self._send_json(404, {'type': 'error', 'error': {
+                    'type': 'not_found_error', 'message': f'Unknown path {self.path}'}})
+
+            def do_GET(self):
+                parts = self.path.split('?')[0].strip('/').split('/')
+                # v1/messages/batches/<id>[/results]
+                if len(parts) < 4 or parts[:3] != ['v1', 'messages', 'batches']:
+                    self._not_found()
+                    return
+
+                status = server.batch_status(parts[3])
+                if status is None:
+                    self._not_found()
+                elif len(parts) == 5 and parts[4] == 'results':
+                    data = server.batch_results(parts[3])
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'application/binary')
+                    self.send_header('Content-Length', str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                else:
+                    self._send_json(200, status)
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = json.loads(self.rfile.read(length) or b'{}')
+
+                path = self.path.split('?')[0]
+                if path == '/v1/messages/batches':
+                    self._send_json(200, server.create_batch(body))
+                    return
+                if path != '/v1/messages':
+                    self._not_found()
+                    return
+
+                if server.latency_ms:
+                    time.sleep(server.latency_ms / 1000)
+
+                status = server._next_failure()
+                if status is not None:
+                    error_type, message = ERRORS.get(status, ('api_error', f'Fake error {status}'))
+                    self._send_json(status, {'type': 'error', 'error': {'type': error_type, 'message': message}},
+                                    {'retry-after': '0'} if status == 429 else None)
+                    return
+
+                if not body.get('stream'):
+                    self._send_json(200, server.handle_messages(body))
+                    return
+
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/event-stream')
+                self.send_header('Cache-Control', 'no-cache')
+                self.end_headers()
+
+                def write(data: bytes):
+                    self.wfile.write(data)
+                    self.wfile.flush()
+
+                server.stream_messages(body, write)
+
+        return Handler
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--port', type=int, default=8765)
+    arg_parser.add_argument('--latency-ms', type=float, default=200)
+    arg_parser.add_argument('--error-rate', type=float, default=0.0)
+    arg_parser.add_argument('--seed', type=int, default=None)
+    arg_parser.add_argument('--batch-processing-s', type=float, default=5)
+    arg_parser.add_argument('--tokens-per-second', type=float, default=0,
+                            help='Output generation speed (0 = replies are instant)')
+    args = arg_parser.parse_args()
+
+    server = FakeAnthropicServer(port=args.port, latency_ms=args.latency_ms,
+                                 error_rate=args.error_rate, seed=args.seed,
+                                 batch_processing_s=args.batch_processing_s,
+                                 output_tokens_per_second=args.tokens_per_second)
+    print(f"Fake Anthropic API listening on {server.base_url} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""
+Replays recorded LinkedIn pages in place of the network.
+
+ReplaySession stands in for the requests.Session that LinkedInJobFetcher uses.
+Search requests get the recorded search page with job IDs rewritten per
+keyword and offset, so every page holds new postings, until `results_per_keyword`
+is reached. Job pages get the recorded posting page with a description that
+varies per job ID. A configurable latency and 429 rate exercise the fetcher's
+pacing and retry logic.
+"""
+import random
+import re
+import threading
+import time
+import zlib
+from typing import Dict, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from benchmarks.bench_parsers import FIXTURES_DIR, SEARCH_FIXTURE, load_fixture
+
+DETAIL_FIXTURE = f"{FIXTURES_DIR}/linkedin_job_detail.html"
+
+# The numeric job ID at the end of each job link in the search fixture
+_FIXTURE_JOB_ID = re.compile(rb'(/jobs/view/[^"?]*-)(\d+)')
+
+# Opening of the description markup in the detail fixture
+_DESCRIPTION_START = b'<div class="show-more-less-html__markup'
+
+_SKILL_LINES = (
+    b'Our stack: Python, FastAPI, PostgreSQL, Redis and AWS.',
+    b'Our stack: TypeScript, React, Node.js and GraphQL.',
+    b'Our stack: Java, Spring Boot, Kafka and Kubernetes.',
+    b'Our stack: Go, gRPC, Cassandra and GCP.',
+    b'Our stack: C++, Linux internals and embedded systems.',
+)
+
+
+class ReplaySession:
+    """
+    Drop-in for requests.Session.get that never touches the network.
+    Thread-safe; `requests` counts calls and `throttled` counts injected 429s.
+    """
+
+    def __init__(self, latency_ms: float = 0, error_rate: float = 0.0,
+                 results_per_keyword: int = 1000, seed: Optional[int] = None):
+        self.latency_ms = latency_ms
+        self.error_rate = error_rate
+        self.results_per_keyword = results_per_keyword
+        self.requests = 0
+        self.throttled = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+        # Split once so a page with new IDs is a join rather than a regex pass
+        search = load_fixture(SEARCH_FIXTURE)
+        self._search_parts = []
+        self._search_ids = []
+        last = 0
+        for match in _FIXTURE_JOB_ID.finditer(search):
+            self._search_parts.append(search[last:match.start(2)])
+            self._search_ids.append(int(match.group(2)))
+            last = match.end(2)
+        self._search_parts.append(search[last:])
+        self._cards_per_page = len(set(self._search_ids))
+        self._empty_page = b'<html><body><ul class="jobs-search__results-list"></ul></body></html>'
+
+        detail = load_fixture(DETAIL_FIXTURE)
+        split_at = detail.index(b'>', detail.index(_DESCRIPTION_START)) + 1
+        self._detail_head, self._detail_tail = detail[:split_at], detail[split_at:]
+
+    def get(self, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None,
+            timeout: Optional[float] = None) -> requests.Response:
+        with self._lock:
+            self.requests += 1
+            throttled = self._random.random() < self.error_rate
+            if throttled:
+                self.throttled += 1
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+
+        if throttled:
+            return self._response(url, 429, b'', {'Retry-After': '0'})
+        if params and 'keywords' in params:
+            return self._response(url, 200, self._search_page(params['keywords'], int(params.get('start', 0))))
+        return self._response(url, 200, self._detail_page(url))
+
+    def close(self):
+        pass
+
+    def _search_page(self, keyword: str, start: int) -> bytes:
+        if start >= self.results_per_keyword:
+            return self._empty_page
+        # Distinct, stable ID ranges per keyword and offset
+        base = 4_000_000_000 + (zlib.crc32(keyword.encode('utf-8')) % 100_000) * 10_000 + start
+        first_id = self._search_ids[0]
+        parts = [self._search_parts[0]]
+        for job_id, part in zip(self._search_ids, self._search_parts[1:]):
+            parts.append(str(base + (job_id - first_id) % self._cards_per_page).encode('ascii'))
+            parts.append(part)
+        return b''.join(parts)
+
+    def _detail_page(self, url: str) -> bytes:
+        job_id = int(re.sub(r'\D', '', url)[-10:] or 0)
+        intro = (b'<p>Posting ' + str(job_id).encode('ascii') + b'. ' +
+                 _SKILL_LINES[job_id % len(_SKILL_LINES)] + b'</p>')
+        return self._detail_head + intro + self._detail_tail
+
+    @staticmethod
+    def _response(url: str, status: int, content: bytes, headers: Optional[Dict] = None) -> requests.Response:
+        response = requests.Response()
+        response.status_code = status
+        response._content = content
+        response.url = url
+        response.encoding = 'utf-8'
+        response.headers = CaseInsensitiveDict({'Content-Type': 'text/html; charset=utf-8', **(headers or {})})
+        return response
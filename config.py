@@ -6,6 +6,8 @@ load_dotenv()
 class Config:
     # API Keys
     ANTHROPIC_API_KEY = os.getenv('ANTHROPIC_API_KEY')
+    # Override to point at a proxy or the local fake server (benchmarks/fake_anthropic.py)
+    ANTHROPIC_BASE_URL = os.getenv('ANTHROPIC_BASE_URL') or None
 
     # LinkedIn Credentials
     LINKEDIN_EMAIL = os.getenv('LINKEDIN_EMAIL')
@@ -16,13 +18,118 @@ class Config:
     JOB_LOCATION = os.getenv('JOB_LOCATION', 'United States')
     JOB_LIMIT = int(os.getenv('JOB_LIMIT', '50'))
 
+    # Fetching / Rate Limiting
+    FETCH_WORKERS = int(os.getenv('FETCH_WORKERS', '4'))
+    FETCH_RATE_PER_SECOND = float(os.getenv('FETCH_RATE_PER_SECOND', '0.5'))
+    FETCH_MAX_RATE_PER_SECOND = float(os.getenv('FETCH_MAX_RATE_PER_SECOND', '2'))
+    FETCH_BURST = float(os.getenv('FETCH_BURST', '2'))
+    # One of: auto, lxml, strainer, html.parser
+    PARSER_BACKEND = os.getenv('PARSER_BACKEND', 'auto')
+
+    # Job Detail Enrichment
+    ENRICH_DETAILS = os.getenv('ENRICH_DETAILS', 'true').lower() == 'true'
+    DETAIL_WORKERS = int(os.getenv('DETAIL_WORKERS', '4'))
+    DESCRIPTION_CACHE_PATH = os.getenv('DESCRIPTION_CACHE_PATH', '.cache/descriptions.sqlite3')
+
+    # HTTP Connection Pool / Page Cache
+    HTTP_POOL_SIZE = int(os.getenv('HTTP_POOL_SIZE', '10'))
+    HTTP_CACHE_ENABLED = os.getenv('HTTP_CACHE_ENABLED', 'true').lower() == 'true'
+    HTTP_CACHE_DIR = os.getenv('HTTP_CACHE_DIR', '.cache/http')
+    HTTP_CACHE_TTL_HOURS = float(os.getenv('HTTP_CACHE_TTL_HOURS', '12'))
+    HTTP_CACHE_MAX_AGE_HOURS = float(os.getenv('HTTP_CACHE_MAX_AGE_HOURS', str(HTTP_CACHE_TTL_HOURS * 4)))
+
     # User Profile for Matching
     YOUR_SKILLS = os.getenv('YOUR_SKILLS', '')
     YOUR_EXPERIENCE_YEARS = os.getenv('YOUR_EXPERIENCE_YEARS', '0')
     YOUR_PROFILE = os.getenv('YOUR_PROFILE', '')
+    # JSON list of profiles to score one shared fetch against, one page each (replaces the YOUR_* profile)
+    PROFILES_PATH = os.getenv('PROFILES_PATH', '')
+
+    # Seen Index (skip jobs already shown in earlier runs)
+    SEEN_INDEX_ENABLED = os.getenv('SEEN_INDEX_ENABLED', 'false').lower() == 'true'
+    SEEN_INDEX_PATH = os.getenv('SEEN_INDEX_PATH', '.cache/seen_jobs.bloom')
+    SEEN_INDEX_CAPACITY = int(os.getenv('SEEN_INDEX_CAPACITY', '1000000'))
+
+    # Near-duplicate Detection (reposted jobs)
+    NEAR_DUP_ENABLED = os.getenv('NEAR_DUP_ENABLED', 'true').lower() == 'true'
+    NEAR_DUP_THRESHOLD = float(os.getenv('NEAR_DUP_THRESHOLD', '0.8'))
+
+    # Persistent Job Store (incremental runs)
+    JOB_STORE_ENABLED = os.getenv('JOB_STORE_ENABLED', 'true').lower() == 'true'
+    JOB_STORE_PATH = os.getenv('JOB_STORE_PATH', '.cache/jobs.sqlite3')
+
+    # LLM Scoring
+    SCORING_MODEL = os.getenv('SCORING_MODEL', 'claude-sonnet-4-5-20250929')
+    SCORING_CONCURRENCY = int(os.getenv('SCORING_CONCURRENCY', '4'))
+    SCORING_MAX_RETRIES = int(os.getenv('SCORING_MAX_RETRIES', '4'))
+    # Jobs packed into one scoring prompt (1 = one request per job)
+    SCORING_BATCH_SIZE = int(os.getenv('SCORING_BATCH_SIZE', '1'))
+    # One of: full, stream (stop reading once priority and reasoning are in), priority (no reasoning)
+    SCORING_RESPONSE_MODE = os.getenv('SCORING_RESPONSE_MODE', 'full')
+    SCORING_MAX_OUTPUT_TOKENS = int(os.getenv('SCORING_MAX_OUTPUT_TOKENS', '300'))
+    SCORING_REASONING_SENTENCES = int(os.getenv('SCORING_REASONING_SENTENCES', '2'))
+    # Offline scoring through the Message Batches API (for nightly runs)
+    USE_MESSAGE_BATCHES = os.getenv('USE_MESSAGE_BATCHES', 'false').lower() == 'true'
+    MESSAGE_BATCH_STATE_PATH = os.getenv('MESSAGE_BATCH_STATE_PATH', '.cache/message_batch.json')
+    MESSAGE_BATCH_POLL_SECONDS = float(os.getenv('MESSAGE_BATCH_POLL_SECONDS', '60'))
+    MESSAGE_BATCH_MAX_WAIT_MINUTES = float(os.getenv('MESSAGE_BATCH_MAX_WAIT_MINUTES', '120'))
+    # One of: disk, memory, none
+    SCORE_CACHE_BACKEND = os.getenv('SCORE_CACHE_BACKEND', 'disk')
+    SCORE_CACHE_PATH = os.getenv('SCORE_CACHE_PATH', '.cache/scores.sqlite3')
+    SCORE_CACHE_MAX_ENTRIES = int(os.getenv('SCORE_CACHE_MAX_ENTRIES', '10000'))
+    # Token usage and estimated cost of every LLM call, kept across runs
+    USAGE_LEDGER_ENABLED = os.getenv('USAGE_LEDGER_ENABLED', 'true').lower() == 'true'
+    USAGE_LEDGER_PATH = os.getenv('USAGE_LEDGER_PATH', '.cache/llm_usage.sqlite3')
+    # Per-run scoring budget (0 = no cap); best skill matches are scored first, the rest left unscored
+    SCORING_BUDGET_TOKENS = int(os.getenv('SCORING_BUDGET_TOKENS', '0'))
+    SCORING_BUDGET_USD = float(os.getenv('SCORING_BUDGET_USD', '0'))
+
+    # Local Pre-filter (skips the LLM for obvious mismatches)
+    PREFILTER_ENABLED = os.getenv('PREFILTER_ENABLED', 'true').lower() == 'true'
+    PREFILTER_MIN_SCORE = float(os.getenv('PREFILTER_MIN_SCORE', '0.01'))
+    # Send only the K best pre-filtered jobs to the LLM (0 = no cap)
+    PREFILTER_TOP_K = int(os.getenv('PREFILTER_TOP_K', '0'))
+
+    # Pipelined run: fetch, enrich, score and render pages concurrently through bounded queues
+    PIPELINE_ENABLED = os.getenv('PIPELINE_ENABLED', 'true').lower() == 'true'
+    PIPELINE_QUEUE_SIZE = int(os.getenv('PIPELINE_QUEUE_SIZE', '4'))
+    # Re-render the page with partial results while the pipeline runs
+    PIPELINE_PROGRESSIVE_RENDER = os.getenv('PIPELINE_PROGRESSIVE_RENDER', 'false').lower() == 'true'
+    PIPELINE_RENDER_INTERVAL_SECONDS = float(os.getenv('PIPELINE_RENDER_INTERVAL_SECONDS', '10'))
+
+    # Run metrics: JSON run report and Prometheus textfile (empty path = don't write)
+    METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'true').lower() == 'true'
+    METRICS_JSON_PATH = os.getenv('METRICS_JSON_PATH', 'run_report.json')
+    METRICS_PROMETHEUS_PATH = os.getenv('METRICS_PROMETHEUS_PATH', 'job_search.prom')
+
+    # Load testing with synthetic jobs (python main.py --load-test [COUNT])
+    LOAD_TEST_JOBS = int(os.getenv('LOAD_TEST_JOBS', '10000'))
+    LOAD_TEST_SEED = int(os.getenv('LOAD_TEST_SEED', '42'))
+    # Share of postings that are reposts of an earlier one
+    LOAD_TEST_DUPLICATE_RATE = float(os.getenv('LOAD_TEST_DUPLICATE_RATE', '0.05'))
+    # Median description length in words (log-normally distributed)
+    LOAD_TEST_DESCRIPTION_WORDS = int(os.getenv('LOAD_TEST_DESCRIPTION_WORDS', '150'))
+    # Comma-separated skill vocabulary for the postings (empty = built-in list)
+    LOAD_TEST_SKILLS = [skill.strip() for skill in os.getenv('LOAD_TEST_SKILLS', '').split(',') if skill.strip()]
+    # Per-stage memory via tracemalloc (slows allocation-heavy stages down)
+    LOAD_TEST_TRACE_MEMORY = os.getenv('LOAD_TEST_TRACE_MEMORY', 'true').lower() == 'true'
+    LOAD_TEST_OUTPUT_PATH = os.getenv('LOAD_TEST_OUTPUT_PATH', 'load_test_output.html')
+    LOAD_TEST_REPORT_PATH = os.getenv('LOAD_TEST_REPORT_PATH', 'load_test_report.json')
 
     # Output
     OUTPUT_HTML_PATH = 'jobs_output.html'
+    # 'static' (every card in one page) or 'paged' (data chunks + a windowed page, for large result sets)
+    HTML_OUTPUT_MODE = os.getenv('HTML_OUTPUT_MODE', 'static')
+    HTML_CHUNK_SIZE = int(os.getenv('HTML_CHUNK_SIZE', '500'))
+    HTML_PAGE_SIZE = int(os.getenv('HTML_PAGE_SIZE', '50'))
+    # Reuse rendered job cards across runs (static mode)
+    FRAGMENT_CACHE_ENABLED = os.getenv('FRAGMENT_CACHE_ENABLED', 'false').lower() == 'true'
+    FRAGMENT_CACHE_PATH = os.getenv('FRAGMENT_CACHE_PATH', '.cache/fragments.sqlite3')
+    FRAGMENT_CACHE_MAX_AGE_DAYS = float(os.getenv('FRAGMENT_CACHE_MAX_AGE_DAYS', '30'))
+    # Write the stylesheet and script as separate content-hashed files instead of inlining them
+    HTML_SPLIT_ASSETS = os.getenv('HTML_SPLIT_ASSETS', 'false').lower() == 'true'
+    # Comma-separated precompressed copies to write next to each output file: gzip, br
+    HTML_PRECOMPRESS = [fmt.strip() for fmt in os.getenv('HTML_PRECOMPRESS', '').split(',') if fmt.strip()]
 
     # Scheduling
     UPDATE_INTERVAL_HOURS = 24
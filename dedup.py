@@ -0,0 +1,135 @@
+import zlib
+from typing import Dict, List
+
+import numpy as np
+
+from prefilter import PLACEHOLDER_DESCRIPTIONS, tokenize
+
+# Mersenne prime for the universal hash family; keeps a * x + b within uint64
+_PRIME = (1 << 31) - 1
+
+
+def normalize_job_text(job: Dict) -> List[str]:
+    """Tokens of the title, company and description that identify a posting."""
+    return tokenize(' '.join((job.get('title', ''), job.get('company', ''), job.get('description', ''))))
+
+
+def shingles(tokens: List[str], size: int = 3) -> set:
+    """Word n-grams of a token list (the whole list if it is shorter than `size`)."""
+    if len(tokens) <= size:
+        return {' '.join(tokens)}
+    return {' '.join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+
+
+class NearDuplicateDetector:
+    """
+    Clusters reposted or re-tracked postings with MinHash + LSH banding.
+
+    Each posting gets a MinHash signature of its word shingles. Signatures are cut
+    into bands; postings sharing any band are candidates and are merged when their
+    estimated Jaccard similarity reaches `threshold`. Each candidate is compared
+    only with the first posting in its bucket, so the work stays linear in the
+    number of postings.
+    """
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 64, bands: int = 8, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, _PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, _PRIME, size=num_perm, dtype=np.uint64)
+        # State for `add`: representatives seen so far and the LSH buckets they lead
+        self._representatives = []
+        self._buckets = {}
+        self.merged_count = 0
+
+    def signature(self, job: Dict) -> np.ndarray:
+        """MinHash signature of a posting's shingles."""
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode('utf-8')) % _PRIME for s in shingles(normalize_job_text(job))),
+            dtype=np.uint64
+        )
+        return ((np.outer(self._a, hashes) + self._b[:, None]) % _PRIME).min(axis=1)
+
+    def cluster(self, jobs: List[Dict]) -> List[List[int]]:
+        """
+        Group job indexes into near-duplicate clusters, each in input order.
+        Jobs without a real description are never merged.
+        """
+        parent = list(range(len(jobs)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        signatures = {}
+        buckets = {}
+        for i, job in enumerate(jobs):
+            if job.get('description') in PLACEHOLDER_DESCRIPTIONS:
+                continue
+            signature = self.signature(job)
+            signatures[i] = signature
+
+            for key in self._band_keys(signature):
+                leader = buckets.setdefault(key, i)
+                if leader == i or find(leader) == find(i):
+                    continue
+                if np.mean(signatures[leader] == signature) >= self.threshold:
+                    parent[find(i)] = find(leader)
+
+        clusters = {}
+        for i in range(len(jobs)):
+            clusters.setdefault(find(i), []).append(i)
+        return sorted(clusters.values(), key=lambda members: members[0])
+
+    def _band_keys(self, signature: np.ndarray) -> List[tuple]:
+        return [(band, signature[band * self.rows:(band + 1) * self.rows].tobytes()) for band in range(self.bands)]
+
+    def add(self, job: Dict) -> bool:
+        """
+        Streaming counterpart of `deduplicate`. Returns True if the job is new, or
+        False after listing its URL under the earlier posting it duplicates.
+        Unlike `cluster`, postings already accepted are never merged afterwards.
+        """
+        if job.get('description') in PLACEHOLDER_DESCRIPTIONS:
+            return True
+
+        signature = self.signature(job)
+        keys = self._band_keys(signature)
+        for key in keys:
+            leader = self._buckets.get(key)
+            if leader is None:
+                continue
+            representative, leader_signature = self._representatives[leader]
+            if np.mean(leader_signature == signature) >= self.threshold:
+                representative.setdefault('duplicate_urls', []).append(job.get('url'))
+                self.merged_count += 1
+                return False
+
+        self._representatives.append((job, signature))
+        for key in keys:
+            self._buckets.setdefault(key, len(self._representatives) - 1)
+        return True
+
+    def deduplicate(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Keep one representative (the first seen) per near-duplicate cluster.
+        The representative lists the other postings' URLs under 'duplicate_urls'.
+        """
+        unique_jobs = []
+        for members in self.cluster(jobs):
+            representative = jobs[members[0]]
+            if len(members) > 1:
+                representative['duplicate_urls'] = [jobs[i].get('url') for i in members[1:]]
+            unique_jobs.append(representative)
+
+        removed = len(jobs) - len(unique_jobs)
+        if removed:
+            print(f"Near-duplicate detection: merged {removed} reposted jobs into {len(unique_jobs)} unique postings")
+        return unique_jobs
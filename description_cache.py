@@ -0,0 +1,63 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+
+class DescriptionCache:
+    """
+    Persistent job-description cache keyed by LinkedIn job ID.
+    A posting's full description is downloaded once and reused on every later run.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS descriptions (
+                job_id TEXT PRIMARY KEY,
+                description TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+    def get_many(self, job_ids: Iterable[str]) -> Dict[str, str]:
+        """Return cached descriptions for the given job IDs (missing IDs are omitted)."""
+        job_ids = list(job_ids)
+        found = {}
+        with self._lock:
+            # Stay well under SQLite's bound-parameter limit
+            for i in range(0, len(job_ids), 500):
+                chunk = job_ids[i:i + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT job_id, description FROM descriptions WHERE job_id IN ({placeholders})", chunk
+                )
+                found.update(rows)
+            self.hits += len(found)
+            self.misses += len(job_ids) - len(found)
+        return found
+
+    def get(self, job_id: str) -> Optional[str]:
+        return self.get_many([job_id]).get(job_id)
+
+    def put(self, job_id: str, description: str):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO descriptions (job_id, description, fetched_at) VALUES (?, ?, ?)",
+                (job_id, description, time.time())
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,97 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable
+
+# Bump when the job card markup in HTMLGenerator changes, so stale fragments are not reused
+CARD_TEMPLATE_VERSION = '1'
+
+# Job fields that appear in a rendered card
+CARD_FIELDS = ('title', 'company', 'location', 'description', 'priority', 'reasoning', 'url')
+
+
+def fragment_key(job: Dict) -> str:
+    """Content address of a job card: same rendered fields, same markup."""
+    digest = hashlib.sha256(CARD_TEMPLATE_VERSION.encode('utf-8'))
+    for field in CARD_FIELDS:
+        digest.update(b'\x00')
+        digest.update(str(job.get(field) or '').encode('utf-8'))
+    return digest.hexdigest()
+
+
+class FragmentCache:
+    """
+    Persistent cache of rendered job card markup keyed by `fragment_key`.
+    Cards whose fields did not change since the last run are copied instead of re-rendered.
+    Fragments are pruned by when they were last used, so cards shown on every run stay cached.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS fragments (
+                fragment_key TEXT PRIMARY KEY,
+                html TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL
+            )
+        """)
+        # Caches created before last_used existed: count each fragment as used when it was created
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(fragments)")}
+        if 'last_used' not in columns:
+            self._conn.execute("ALTER TABLE fragments ADD COLUMN last_used REAL")
+            self._conn.execute("UPDATE fragments SET last_used = created_at")
+        self._conn.commit()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        """Return cached markup for the given keys (missing keys are omitted) and mark it as used."""
+        keys = list(keys)
+        found = {}
+        now = time.time()
+        with self._lock:
+            # Stay well under SQLite's bound-parameter limit
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT fragment_key, html FROM fragments WHERE fragment_key IN ({placeholders})", chunk
+                )
+                found.update(rows)
+            self._conn.executemany("UPDATE fragments SET last_used = ? WHERE fragment_key = ?",
+                                   ((now, key) for key in found))
+            self._conn.commit()
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, fragments: Dict[str, str]):
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO fragments (fragment_key, html, created_at, last_used) VALUES (?, ?, ?, ?)",
+                ((key, html, now, now) for key, html in fragments.items())
+            )
+            self._conn.commit()
+
+    def prune(self, max_age_seconds: float) -> int:
+        """Delete fragments not used for `max_age_seconds`; returns how many were removed."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM fragments WHERE last_used < ?", (time.time() - max_age_seconds,)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,410 @@
+"""
+Stylesheets and scripts for the pages HTMLGenerator writes.
+
+They are inlined into the page by default, or written once as separate,
+content-hashed files when the generator splits assets.
+"""
+
+# Styles shared by the static and paged pages
+PAGE_CSS = """\
+        * {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }
+
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            min-height: 100vh;
+            padding: 20px;
+        }
+
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+        }
+
+        .header {
+            background: white;
+            border-radius: 15px;
+            padding: 30px;
+            margin-bottom: 30px;
+            box-shadow: 0 10px 30px rgba(0,0,0,0.2);
+        }
+
+        .header h1 {
+            color: #667eea;
+            font-size: 2.5em;
+            margin-bottom: 10px;
+        }
+
+        .header .subtitle {
+            color: #666;
+            font-size: 1.1em;
+            margin-bottom: 20px;
+        }
+
+        .stats {
+            display: flex;
+            gap: 20px;
+            margin-top: 20px;
+        }
+
+        .stat-card {
+            flex: 1;
+            padding: 15px;
+            border-radius: 10px;
+            text-align: center;
+        }
+
+        .stat-card.high {
+            background: #d4edda;
+            border: 2px solid #28a745;
+        }
+
+        .stat-card.med {
+            background: #fff3cd;
+            border: 2px solid #ffc107;
+        }
+
+        .stat-card.low {
+            background: #f8d7da;
+            border: 2px solid #dc3545;
+        }
+
+        .stat-card .number {
+            font-size: 2em;
+            font-weight: bold;
+            margin-bottom: 5px;
+        }
+
+        .stat-card .label {
+            font-size: 0.9em;
+            color: #666;
+        }
+
+        .jobs-container {
+            display: flex;
+            flex-direction: column;
+            gap: 20px;
+        }
+
+        .job-card {
+            background: white;
+            border-radius: 15px;
+            padding: 25px;
+            box-shadow: 0 5px 15px rgba(0,0,0,0.1);
+            transition: transform 0.2s, box-shadow 0.2s;
+            border-left: 5px solid #ccc;
+        }
+
+        .job-card:hover {
+            transform: translateY(-5px);
+            box-shadow: 0 10px 25px rgba(0,0,0,0.15);
+        }
+
+        .job-card.priority-HIGH {
+            border-left-color: #28a745;
+        }
+
+        .job-card.priority-MED {
+            border-left-color: #ffc107;
+        }
+
+        .job-card.priority-LOW {
+            border-left-color: #dc3545;
+        }
+
+        .job-header {
+            display: flex;
+            justify-content: space-between;
+            align-items: start;
+            margin-bottom: 15px;
+        }
+
+        .job-title {
+            font-size: 1.5em;
+            font-weight: bold;
+            color: #333;
+            margin-bottom: 5px;
+        }
+
+        .job-company {
+            color: #666;
+            font-size: 1.1em;
+        }
+
+        .priority-badge {
+            padding: 8px 16px;
+            border-radius: 20px;
+            font-weight: bold;
+            font-size: 0.9em;
+            white-space: nowrap;
+        }
+
+        .priority-badge.HIGH {
+            background: #28a745;
+            color: white;
+        }
+
+        .priority-badge.MED {
+            background: #ffc107;
+            color: #333;
+        }
+
+        .priority-badge.LOW {
+            background: #dc3545;
+            color: white;
+        }
+
+        .job-location {
+            color: #888;
+            margin-bottom: 15px;
+            font-size: 0.95em;
+        }
+
+        .job-description {
+            color: #555;
+            line-height: 1.6;
+            margin-bottom: 15px;
+            border-left: 3px solid #e0e0e0;
+            padding-left: 15px;
+        }
+
+        .job-reasoning {
+            background: #f8f9fa;
+            padding: 15px;
+            border-radius: 10px;
+            margin-bottom: 15px;
+            font-style: italic;
+            color: #555;
+        }
+
+        .job-reasoning strong {
+            color: #333;
+            font-style: normal;
+        }
+
+        .job-link {
+            display: inline-block;
+            padding: 10px 20px;
+            background: #667eea;
+            color: white;
+            text-decoration: none;
+            border-radius: 8px;
+            font-weight: 500;
+            transition: background 0.2s;
+        }
+
+        .job-link:hover {
+            background: #764ba2;
+        }
+
+        .last-updated {
+            text-align: center;
+            color: white;
+            margin-top: 30px;
+            font-size: 0.9em;
+        }
+
+        .filter-buttons {
+            display: flex;
+            gap: 10px;
+            margin-top: 20px;
+            flex-wrap: wrap;
+        }
+
+        .filter-btn {
+            padding: 10px 20px;
+            border: 2px solid #667eea;
+            background: white;
+            color: #667eea;
+            border-radius: 8px;
+            cursor: pointer;
+            font-weight: 500;
+            transition: all 0.2s;
+        }
+
+        .filter-btn:hover, .filter-btn.active {
+            background: #667eea;
+            color: white;
+        }
+
+        @media (max-width: 768px) {
+            .header h1 {
+                font-size: 1.8em;
+            }
+
+            .stats {
+                flex-direction: column;
+            }
+
+            .job-header {
+                flex-direction: column;
+            }
+
+            .priority-badge {
+                margin-top: 10px;
+            }
+        }
+"""
+
+# Priority filter for the static page, which has every card in the DOM
+FILTER_SCRIPT = """\
+        function filterJobs(priority) {
+            const cards = document.querySelectorAll('.job-card');
+            const buttons = document.querySelectorAll('.filter-btn');
+
+            // Update active button
+            buttons.forEach(btn => btn.classList.remove('active'));
+            event.target.classList.add('active');
+
+            // Filter cards
+            cards.forEach(card => {
+                if (priority === 'ALL' || card.dataset.priority === priority) {
+                    card.style.display = 'block';
+                } else {
+                    card.style.display = 'none';
+                }
+            });
+        }
+"""
+
+# Extra styles for the paged page's pager
+PAGER_CSS = """\
+        .pager {
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            gap: 20px;
+            margin-top: 30px;
+            color: white;
+        }
+
+        .pager .filter-btn:disabled {
+            opacity: 0.5;
+            cursor: default;
+        }
+"""
+
+# Loads data chunks and renders one window of cards; expects a global MANIFEST
+PAGED_SCRIPT = """\
+        const chunks = {};
+        const pendingChunks = {};
+        let currentFilter = 'ALL';
+        let currentPage = 0;
+
+        // Called by each data file as it loads
+        function registerJobChunk(index, rows) {
+            chunks[index] = rows;
+        }
+
+        function loadChunk(index) {
+            if (chunks[index]) {
+                return Promise.resolve();
+            }
+            if (!pendingChunks[index]) {
+                pendingChunks[index] = new Promise((resolve, reject) => {
+                    const script = document.createElement('script');
+                    script.src = MANIFEST.chunks[index];
+                    script.onload = () => {
+                        script.remove();
+                        delete pendingChunks[index];
+                        resolve();
+                    };
+                    script.onerror = () => {
+                        script.remove();
+                        delete pendingChunks[index];
+                        reject(new Error('Could not load ' + MANIFEST.chunks[index]));
+                    };
+                    document.head.appendChild(script);
+                });
+            }
+            return pendingChunks[index];
+        }
+
+        function element(tag, className, text) {
+            const node = document.createElement(tag);
+            node.className = className;
+            if (text !== undefined) {
+                node.textContent = text;
+            }
+            return node;
+        }
+
+        function renderCard(row) {
+            const [title, company, location, description, priority, reasoning, url] = row;
+            const card = element('div', 'job-card priority-' + priority);
+            card.dataset.priority = priority;
+
+            const header = element('div', 'job-header');
+            const heading = document.createElement('div');
+            heading.append(element('div', 'job-title', title), element('div', 'job-company', company));
+            header.append(heading, element('div', 'priority-badge ' + priority, priority + ' PRIORITY'));
+
+            const why = element('div', 'job-reasoning');
+            why.append(element('strong', '', 'Why this match:'), ' ' + reasoning);
+
+            const link = element('a', 'job-link', 'View Job on LinkedIn →');
+            link.href = url;
+            link.target = '_blank';
+
+            card.append(header, element('div', 'job-location', '📍 ' + location),
+                        element('div', 'job-description', description), why, link);
+            return card;
+        }
+
+        async function renderPage() {
+            const [start, end] = MANIFEST.ranges[currentFilter] || [0, 0];
+            const pages = Math.max(1, Math.ceil((end - start) / MANIFEST.pageSize));
+            currentPage = Math.min(Math.max(currentPage, 0), pages - 1);
+            const from = start + currentPage * MANIFEST.pageSize;
+            const to = Math.min(end, from + MANIFEST.pageSize);
+
+            const firstChunk = Math.floor(from / MANIFEST.chunkSize);
+            const lastChunk = Math.floor(Math.max(from, to - 1) / MANIFEST.chunkSize);
+            const needed = [];
+            for (let i = firstChunk; i <= lastChunk && from < to; i++) {
+                needed.push(i);
+            }
+            await Promise.all(needed.map(loadChunk));
+
+            // Only the chunks behind the visible window stay in memory
+            Object.keys(chunks).forEach(index => {
+                if (!needed.includes(Number(index))) {
+                    delete chunks[index];
+                }
+            });
+
+            const fragment = document.createDocumentFragment();
+            for (let i = from; i < to; i++) {
+                fragment.appendChild(renderCard(chunks[Math.floor(i / MANIFEST.chunkSize)][i % MANIFEST.chunkSize]));
+            }
+            document.getElementById('jobsContainer').replaceChildren(fragment);
+
+            document.getElementById('pageInfo').textContent =
+                to > from ? `${from - start + 1}–${to - start} of ${end - start}` : 'No jobs';
+            document.getElementById('prevPage').disabled = currentPage === 0;
+            document.getElementById('nextPage').disabled = currentPage >= pages - 1;
+        }
+
+        function changePage(step) {
+            currentPage += step;
+            renderPage().then(() => window.scrollTo(0, 0));
+        }
+
+        function filterJobs(priority) {
+            const buttons = document.querySelectorAll('.filter-buttons .filter-btn');
+
+            // Update active button
+            buttons.forEach(btn => btn.classList.remove('active'));
+            event.target.classList.add('active');
+
+            currentFilter = priority;
+            currentPage = 0;
+            renderPage();
+        }
+
+        renderPage();
+"""
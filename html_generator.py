@@ -1,13 +1,74 @@
-from typing import List, Dict
+from typing import Callable, List, Dict, Iterable, Optional, TextIO
 from datetime import datetime
+import glob
+import gzip
+import hashlib
+import io
+import json
+import os
+import tempfile
+
+from fragment_cache import FragmentCache, fragment_key
+from html_assets import FILTER_SCRIPT, PAGE_CSS, PAGED_SCRIPT, PAGER_CSS
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Buffer size for streaming the page to disk
+WRITE_BUFFER_SIZE = 1 << 16
+
+# 'static' puts every card in the page; 'paged' writes the jobs as data chunks
+# and a small page that renders one window of cards at a time
+HTML_OUTPUT_MODES = ('static', 'paged')
+
+# Precompressed copies written next to each output file, by format name
+PRECOMPRESS_EXTENSIONS = {'gzip': '.gz', 'br': '.br'}
 
 class HTMLGenerator:
     """
     Generates an HTML page displaying jobs sorted by priority.
+
+    In paged mode the jobs are written as compact JSON rows split into
+    `chunk_size`-job script files next to the page. The page loads only the
+    chunks behind the `page_size` cards it is showing, so its size, load time
+    and DOM stay the same however many jobs there are.
+
+    With a `fragment_cache`, static-mode cards whose fields are unchanged since
+    an earlier run are copied from the cache, so only new or changed jobs are
+    rendered.
+
+    With `split_assets`, the stylesheet and script are written once to
+    content-hashed files in a `_assets` directory instead of being inlined,
+    so browsers and servers can cache them indefinitely. `precompress` lists
+    formats ('gzip', 'br') to write alongside every output file for static
+    servers and attachments.
     """
 
-    def __init__(self, output_path: str):
+    def __init__(self, output_path: str, mode: str = 'static', chunk_size: int = 500, page_size: int = 50,
+                 fragment_cache: Optional[FragmentCache] = None, split_assets: bool = False,
+                 precompress: Iterable[str] = ()):
+        if mode not in HTML_OUTPUT_MODES:
+            raise ValueError(f"Unknown HTML output mode '{mode}', expected one of {', '.join(HTML_OUTPUT_MODES)}")
+        precompress = [fmt for fmt in precompress if fmt]
+        for fmt in precompress:
+            if fmt not in PRECOMPRESS_EXTENSIONS:
+                raise ValueError(f"Unknown precompression format '{fmt}', expected one of {', '.join(PRECOMPRESS_EXTENSIONS)}")
+        if 'br' in precompress and not BROTLI_AVAILABLE:
+            print("⚠ brotli is not installed. Skipping .br precompression...")
+            precompress.remove('br')
         self.output_path = output_path
+        self.mode = mode
+        self.chunk_size = max(1, chunk_size)
+        self.page_size = max(1, page_size)
+        self.data_dir = os.path.splitext(output_path)[0] + '_data'
+        self.fragment_cache = fragment_cache
+        self.split_assets = split_assets
+        self.assets_dir = os.path.splitext(output_path)[0] + '_assets'
+        self.precompress = precompress
+        self._asset_urls = None
 
     def generate(self, jobs: List[Dict]) -> str:
         """
@@ -18,272 +79,215 @@ class HTMLGenerator:
         priority_order = {"HIGH": 0, "MED": 1, "LOW": 2}
         sorted_jobs = sorted(jobs, key=lambda x: priority_order.get(x.get('priority', 'LOW'), 3))
 
-        html_content = self._create_html(sorted_jobs)
-
-        with open(self.output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        self._asset_urls = self._write_assets() if self.split_assets else None
+        if self.mode == 'paged':
+            self._write_paged(sorted_jobs)
+        else:
+            self._atomic_write(self.output_path, lambda f: self._write_html(f, sorted_jobs))
+        self._write_precompressed(self.output_path)
 
         print(f"HTML page generated: {self.output_path}")
         return self.output_path
 
+    def _atomic_write(self, path: str, write: Callable[[TextIO], None], binary: bool = False):
+        """
+        Stream content into a temp file next to `path`, then atomically swap it in,
+        so whoever serves the page never sees a half-written file.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path) + '.', suffix='.tmp')
+        try:
+            if binary:
+                f = io.open(fd, 'wb', buffering=WRITE_BUFFER_SIZE)
+            else:
+                f = io.open(fd, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE)
+            with f:
+                write(f)
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _write_precompressed(self, path: str) -> List[str]:
+        """
+        Write the configured compressed copies of `path` next to it and remove copies
+        in formats no longer configured. Returns the file names written.
+        The file is compressed in `WRITE_BUFFER_SIZE` pieces, never read whole.
+        """
+        written = []
+        for fmt, extension in PRECOMPRESS_EXTENSIONS.items():
+            compressed_path = path + extension
+            if fmt not in self.precompress:
+                if os.path.exists(compressed_path):
+                    os.remove(compressed_path)
+                continue
+            self._atomic_write(compressed_path, lambda f: self._compress_file(path, fmt, f), binary=True)
+            written.append(os.path.basename(compressed_path))
+        return written
+
+    def _compress_file(self, path: str, fmt: str, out):
+        with open(path, 'rb') as source:
+            if fmt == 'gzip':
+                # Fixed mtime and no file name so unchanged content compresses to identical bytes
+                with gzip.GzipFile(filename='', fileobj=out, mode='wb', compresslevel=9, mtime=0) as compressor:
+                    for piece in iter(lambda: source.read(WRITE_BUFFER_SIZE), b''):
+                        compressor.write(piece)
+            else:
+                compressor = brotli.Compressor(quality=11)
+                for piece in iter(lambda: source.read(WRITE_BUFFER_SIZE), b''):
+                    out.write(compressor.process(piece))
+                out.write(compressor.finish())
+
+    def _write_assets(self) -> Dict[str, str]:
+        """
+        Write the page's stylesheet and script to content-hashed files, skipping
+        ones that already exist. Returns their URLs relative to the page.
+        """
+        os.makedirs(self.assets_dir, exist_ok=True)
+        if self.mode == 'paged':
+            assets = (('style', 'css', PAGE_CSS + '\n' + PAGER_CSS), ('script', 'js', PAGED_SCRIPT))
+        else:
+            assets = (('style', 'css', PAGE_CSS), ('script', 'js', FILTER_SCRIPT))
+
+        urls = {}
+        written = set()
+        for stem, extension, content in assets:
+            digest = hashlib.sha256(content.encode('utf-8')).hexdigest()[:12]
+            name = f"{stem}.{digest}.{extension}"
+            path = os.path.join(self.assets_dir, name)
+            if not os.path.exists(path):
+                self._atomic_write(path, lambda f: f.write(content))
+            written.add(name)
+            written.update(self._write_precompressed(path))
+            urls[extension] = f"{os.path.basename(self.assets_dir)}/{name}"
+
+        # Drop assets from earlier versions of the page
+        for path in glob.glob(os.path.join(self.assets_dir, '*')):
+            if os.path.basename(path) not in written:
+                os.remove(path)
+        return urls
+
+    def _head_assets(self) -> str:
+        if self._asset_urls:
+            return f'    <link rel="stylesheet" href="{self._asset_urls["css"]}">'
+        return f"    <style>\n{PAGE_CSS}    </style>"
+
+    def _body_script(self, script: str) -> str:
+        if self._asset_urls:
+            return f'    <script src="{self._asset_urls["js"]}"></script>'
+        return f"    <script>\n{script}    </script>"
+
     def _create_html(self, jobs: List[Dict]) -> str:
-        """Create the HTML content."""
-        last_updated = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        """Create the HTML content as a string."""
+        buffer = io.StringIO()
+        self._write_html(buffer, jobs)
+        return buffer.getvalue()
 
+    def _write_html(self, out: TextIO, jobs: List[Dict]):
+        """Write the page to `out` one fragment at a time, in time linear in the number of jobs."""
         # Count jobs by priority
-        high_count = sum(1 for j in jobs if j.get('priority') == 'HIGH')
-        med_count = sum(1 for j in jobs if j.get('priority') == 'MED')
-        low_count = sum(1 for j in jobs if j.get('priority') == 'LOW')
-
-        html = f"""<!DOCTYPE html>
+        counts = {"HIGH": 0, "MED": 0, "LOW": 0}
+        for job in jobs:
+            priority = job.get('priority')
+            if priority in counts:
+                counts[priority] += 1
+
+        out.write(self._render_header(len(jobs), counts["HIGH"], counts["MED"], counts["LOW"]))
+        for card in self._job_cards(jobs):
+            out.write(card)
+        out.write(self._render_footer(datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+
+    def _job_cards(self, jobs: List[Dict]):
+        """Yield each job's card markup, reusing cached fragments for unchanged jobs."""
+        if self.fragment_cache is None:
+            for job in jobs:
+                yield self._render_job_card(job)
+            return
+
+        keys = [fragment_key(job) for job in jobs]
+        cached = self.fragment_cache.get_many(set(keys))
+        rendered = {}
+        for job, key in zip(jobs, keys):
+            card = cached.get(key) or rendered.get(key)
+            if card is None:
+                card = rendered[key] = self._render_job_card(job)
+            yield card
+        if rendered:
+            self.fragment_cache.put_many(rendered)
+
+    def _write_paged(self, jobs: List[Dict]):
+        """Write the job data chunks, then the page that loads them."""
+        os.makedirs(self.data_dir, exist_ok=True)
+        version = datetime.now().strftime("%Y%m%d%H%M%S")
+        data_url = os.path.basename(self.data_dir)
+
+        counts = {"HIGH": 0, "MED": 0, "LOW": 0}
+        # Jobs are sorted by priority, so each filter is one contiguous index range
+        ranges = {"ALL": [0, len(jobs)]}
+        chunk_files = []
+        written = set()
+        for index, start in enumerate(range(0, len(jobs), self.chunk_size)):
+            rows = []
+            for offset, job in enumerate(jobs[start:start + self.chunk_size], start):
+                priority = job.get('priority', 'LOW')
+                if priority in counts:
+                    counts[priority] += 1
+                ranges.setdefault(priority, [offset, offset])[1] = offset + 1
+                rows.append(self._job_row(job))
+
+            name = f"jobs-{index:05d}.js"
+            chunk_files.append(name)
+            chunk_path = os.path.join(self.data_dir, name)
+            self._atomic_write(chunk_path, lambda f: self._write_chunk(f, index, rows))
+            written.add(name)
+            written.update(self._write_precompressed(chunk_path))
+
+        manifest = {
+            'total': len(jobs),
+            'chunkSize': self.chunk_size,
+            'pageSize': self.page_size,
+            'chunks': [f"{data_url}/{name}?v={version}" for name in chunk_files],
+            'ranges': ranges
+        }
+        header = self._render_header(len(jobs), counts["HIGH"], counts["MED"], counts["LOW"])
+        footer = self._render_paged_footer(datetime.now().strftime("%Y-%m-%d %H:%M:%S"), manifest)
+        self._atomic_write(self.output_path, lambda f: f.write(header + footer))
+
+        # Drop chunks left over from an earlier, larger run
+        for path in glob.glob(os.path.join(self.data_dir, 'jobs-*')):
+            if os.path.basename(path) not in written:
+                os.remove(path)
+
+    def _job_row(self, job: Dict) -> List[str]:
+        """Compact row for the paged data files; the field order matches renderCard in the page."""
+        return [
+            job.get('title', ''),
+            job.get('company', ''),
+            job.get('location', ''),
+            job.get('description', ''),
+            job.get('priority', 'LOW'),
+            job.get('reasoning', 'No reasoning available'),
+            job.get('url', '')
+        ]
+
+    def _write_chunk(self, out: TextIO, index: int, rows: List[List[str]]):
+        # A script rather than a .json file, so the page also works when opened from disk
+        out.write(f"registerJobChunk({index},")
+        json.dump(rows, out, ensure_ascii=False, separators=(',', ':'))
+        out.write(");\n")
+
+    def _render_header(self, total_count: int, high_count: int, med_count: int, low_count: int) -> str:
+        """Render everything before the first job card: styles, stats and filter buttons."""
+        head_assets = self._head_assets()
+        return f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Job Search Results - Prioritized</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }}
-
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-        }}
-
-        .header {{
-            background: white;
-            border-radius: 15px;
-            padding: 30px;
-            margin-bottom: 30px;
-            box-shadow: 0 10px 30px rgba(0,0,0,0.2);
-        }}
-
-        .header h1 {{
-            color: #667eea;
-            font-size: 2.5em;
-            margin-bottom: 10px;
-        }}
-
-        .header .subtitle {{
-            color: #666;
-            font-size: 1.1em;
-            margin-bottom: 20px;
-        }}
-
-        .stats {{
-            display: flex;
-            gap: 20px;
-            margin-top: 20px;
-        }}
-
-        .stat-card {{
-            flex: 1;
-            padding: 15px;
-            border-radius: 10px;
-            text-align: center;
-        }}
-
-        .stat-card.high {{
-            background: #d4edda;
-            border: 2px solid #28a745;
-        }}
-
-        .stat-card.med {{
-            background: #fff3cd;
-            border: 2px solid #ffc107;
-        }}
-
-        .stat-card.low {{
-            background: #f8d7da;
-            border: 2px solid #dc3545;
-        }}
-
-        .stat-card .number {{
-            font-size: 2em;
-            font-weight: bold;
-            margin-bottom: 5px;
-        }}
-
-        .stat-card .label {{
-            font-size: 0.9em;
-            color: #666;
-        }}
-
-        .jobs-container {{
-            display: flex;
-            flex-direction: column;
-            gap: 20px;
-        }}
-
-        .job-card {{
-            background: white;
-            border-radius: 15px;
-            padding: 25px;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.1);
-            transition: transform 0.2s, box-shadow 0.2s;
-            border-left: 5px solid #ccc;
-        }}
-
-        .job-card:hover {{
-            transform: translateY(-5px);
-            box-shadow: 0 10px 25px rgba(0,0,0,0.15);
-        }}
-
-        .job-card.priority-HIGH {{
-            border-left-color: #28a745;
-        }}
-
-        .job-card.priority-MED {{
-            border-left-color: #ffc107;
-        }}
-
-        .job-card.priority-LOW {{
-            border-left-color: #dc3545;
-        }}
-
-        .job-header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: start;
-            margin-bottom: 15px;
-        }}
-
-        .job-title {{
-            font-size: 1.5em;
-            font-weight: bold;
-            color: #333;
-            margin-bottom: 5px;
-        }}
-
-        .job-company {{
-            color: #666;
-            font-size: 1.1em;
-        }}
-
-        .priority-badge {{
-            padding: 8px 16px;
-            border-radius: 20px;
-            font-weight: bold;
-            font-size: 0.9em;
-            white-space: nowrap;
-        }}
-
-        .priority-badge.HIGH {{
-            background: #28a745;
-            color: white;
-        }}
-
-        .priority-badge.MED {{
-            background: #ffc107;
-            color: #333;
-        }}
-
-        .priority-badge.LOW {{
-            background: #dc3545;
-            color: white;
-        }}
-
-        .job-location {{
-            color: #888;
-            margin-bottom: 15px;
-            font-size: 0.95em;
-        }}
-
-        .job-description {{
-            color: #555;
-            line-height: 1.6;
-            margin-bottom: 15px;
-            border-left: 3px solid #e0e0e0;
-            padding-left: 15px;
-        }}
-
-        .job-reasoning {{
-            background: #f8f9fa;
-            padding: 15px;
-            border-radius: 10px;
-            margin-bottom: 15px;
-            font-style: italic;
-            color: #555;
-        }}
-
-        .job-reasoning strong {{
-            color: #333;
-            font-style: normal;
-        }}
-
-        .job-link {{
-            display: inline-block;
-            padding: 10px 20px;
-            background: #667eea;
-            color: white;
-            text-decoration: none;
-            border-radius: 8px;
-            font-weight: 500;
-            transition: background 0.2s;
-        }}
-
-        .job-link:hover {{
-            background: #764ba2;
-        }}
-
-        .last-updated {{
-            text-align: center;
-            color: white;
-            margin-top: 30px;
-            font-size: 0.9em;
-        }}
-
-        .filter-buttons {{
-            display: flex;
-            gap: 10px;
-            margin-top: 20px;
-            flex-wrap: wrap;
-        }}
-
-        .filter-btn {{
-            padding: 10px 20px;
-            border: 2px solid #667eea;
-            background: white;
-            color: #667eea;
-            border-radius: 8px;
-            cursor: pointer;
-            font-weight: 500;
-            transition: all 0.2s;
-        }}
-
-        .filter-btn:hover, .filter-btn.active {{
-            background: #667eea;
-            color: white;
-        }}
-
-        @media (max-width: 768px) {{
-            .header h1 {{
-                font-size: 1.8em;
-            }}
-
-            .stats {{
-                flex-direction: column;
-            }}
-
-            .job-header {{
-                flex-direction: column;
-            }}
-
-            .priority-badge {{
-                margin-top: 10px;
-            }}
-        }}
-    </style>
+{head_assets}
 </head>
 <body>
     <div class="container">
@@ -307,7 +311,7 @@ class HTMLGenerator:
             </div>
 
             <div class="filter-buttons">
-                <button class="filter-btn active" onclick="filterJobs('ALL')">All Jobs ({len(jobs)})</button>
+                <button class="filter-btn active" onclick="filterJobs('ALL')">All Jobs ({total_count})</button>
                 <button class="filter-btn" onclick="filterJobs('HIGH')">High Priority ({high_count})</button>
                 <button class="filter-btn" onclick="filterJobs('MED')">Medium Priority ({med_count})</button>
                 <button class="filter-btn" onclick="filterJobs('LOW')">Low Priority ({low_count})</button>
@@ -317,10 +321,10 @@ class HTMLGenerator:
         <div class="jobs-container" id="jobsContainer">
 """
 
-        # Add job cards
-        for job in jobs:
-            priority = job.get('priority', 'LOW')
-            html += f"""
+    def _render_job_card(self, job: Dict) -> str:
+        """Render one job card."""
+        priority = job.get('priority', 'LOW')
+        return f"""
             <div class="job-card priority-{priority}" data-priority="{priority}">
                 <div class="job-header">
                     <div>
@@ -344,7 +348,10 @@ class HTMLGenerator:
             </div>
 """
 
-        html += f"""
+    def _render_footer(self, last_updated: str) -> str:
+        """Render everything after the last job card."""
+        filter_script = self._body_script(FILTER_SCRIPT)
+        return f"""
         </div>
 
         <div class="last-updated">
@@ -352,31 +359,41 @@ class HTMLGenerator:
         </div>
     </div>
 
+{filter_script}
+</body>
+</html>
+"""
+
+    def _render_paged_footer(self, last_updated: str, manifest: Dict) -> str:
+        """Render the pager and the script that loads and renders one window of jobs."""
+        manifest_json = json.dumps(manifest, separators=(',', ':')).replace('</', '<\\/')
+        # With split assets the pager styles are part of the stylesheet
+        pager_style = '' if self._asset_urls else f"    <style>\n{PAGER_CSS}    </style>"
+        paged_script = self._body_script(PAGED_SCRIPT)
+        return f"""
+        </div>
+
+        <div class="pager" id="pager">
+            <button class="filter-btn" id="prevPage" onclick="changePage(-1)">← Previous</button>
+            <span id="pageInfo"></span>
+            <button class="filter-btn" id="nextPage" onclick="changePage(1)">Next →</button>
+        </div>
+
+        <div class="last-updated">
+            Last updated: {last_updated}
+        </div>
+    </div>
+
+{pager_style}
+
     <script>
-        function filterJobs(priority) {{
-            const cards = document.querySelectorAll('.job-card');
-            const buttons = document.querySelectorAll('.filter-btn');
-
-            // Update active button
-            buttons.forEach(btn => btn.classList.remove('active'));
-            event.target.classList.add('active');
-
-            // Filter cards
-            cards.forEach(card => {{
-                if (priority === 'ALL' || card.dataset.priority === priority) {{
-                    card.style.display = 'block';
-                }} else {{
-                    card.style.display = 'none';
-                }}
-            }});
-        }}
+        const MANIFEST = {manifest_json};
     </script>
+{paged_script}
 </body>
 </html>
 """
 
-        return html
-
     def _escape_html(self, text: str) -> str:
         """Escape HTML special characters."""
         if not text:
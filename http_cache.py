@@ -0,0 +1,214 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+# Request headers HTTPCache.conditional_headers may add
+CONDITIONAL_HEADERS = {'If-None-Match', 'If-Modified-Since'}
+
+
+def create_session(pool_size: int = 10) -> requests.Session:
+    """
+    Create a requests.Session with a keep-alive connection pool,
+    so repeated requests to the same host reuse TCP/TLS connections.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+class HTTPCache:
+    """
+    On-disk HTTP response cache keyed by URL and query params.
+    Entries younger than `ttl_seconds` are served without touching the network;
+    older entries are revalidated with If-None-Match / If-Modified-Since.
+    Entries not refreshed for `max_age_seconds` (default: four TTLs) are deleted
+    when the cache is opened.
+    """
+
+    def __init__(self, cache_dir: str, ttl_seconds: float = 12 * 3600,
+                 max_age_seconds: Optional[float] = None):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self.max_age_seconds = max_age_seconds if max_age_seconds is not None else 4 * ttl_seconds
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.pruned = 0
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        self.prune()
+
+    def prune(self) -> int:
+        """
+        Delete entries last fetched or revalidated more than `max_age_seconds` ago,
+        plus unreadable entries and leftover temp files. Returns how many entries were removed.
+        """
+        cutoff = time.time() - self.max_age_seconds
+        # Temp files and bodies without metadata are only leftovers once nobody is still writing them
+        leftover_cutoff = time.time() - 3600
+        removed = 0
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if name.endswith('.tmp'):
+                if os.path.getmtime(path) < leftover_cutoff:
+                    self._remove(path)
+                continue
+            if not name.endswith('.json'):
+                continue
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    fetched_at = json.load(f)['fetched_at']
+            except (OSError, ValueError, KeyError):
+                fetched_at = 0
+            if fetched_at < cutoff:
+                self._remove(path)
+                self._remove(path[:-len('.json')] + '.body')
+                removed += 1
+
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if (name.endswith('.body') and not os.path.exists(path[:-len('.body')] + '.json')
+                    and os.path.getmtime(path) < leftover_cutoff):
+                self._remove(path)
+
+        self.pruned += removed
+        return removed
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _key(self, url: str, params: Optional[Dict]) -> str:
+        params_part = json.dumps(sorted((params or {}).items()), default=str)
+        return hashlib.sha256(f"{url}?{params_part}".encode('utf-8')).hexdigest()
+
+    def _paths(self, key: str) -> tuple[str, str]:
+        base = os.path.join(self.cache_dir, key)
+        return base + '.json', base + '.body'
+
+    def _load(self, url: str, params: Optional[Dict]) -> Optional[tuple[Dict, str]]:
+        meta_path, body_path = self._paths(self._key(url, params))
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f), body_path
+        except (OSError, ValueError):
+            return None
+
+    def _count(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _build_response(self, meta: Dict, body_path: str) -> Optional[requests.Response]:
+        try:
+            with open(body_path, 'rb') as f:
+                content = f.read()
+        except OSError:
+            return None
+
+        response = requests.Response()
+        response.status_code = meta['status_code']
+        response.headers = CaseInsensitiveDict(meta.get('headers', {}))
+        response.url = meta['url']
+        response.encoding = meta.get('encoding')
+        response._content = content
+        response.from_cache = True
+        return response
+
+    def get_fresh(self, url: str, params: Optional[Dict] = None) -> Optional[requests.Response]:
+        """Return the cached response if it is still within its TTL."""
+        entry = self._load(url, params)
+        if entry is None:
+            return None
+
+        meta, body_path = entry
+        if time.time() - meta['fetched_at'] > self.ttl_seconds:
+            return None
+
+        response = self._build_response(meta, body_path)
+        if response is not None:
+            self._count('hits')
+        return response
+
+    def conditional_headers(self, url: str, params: Optional[Dict] = None) -> Dict[str, str]:
+        """Validators to send so an unchanged page comes back as 304 Not Modified."""
+        entry = self._load(url, params)
+        if entry is None:
+            return {}
+
+        meta, _ = entry
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def update(self, url: str, params: Optional[Dict], response: requests.Response) -> requests.Response:
+        """
+        Store a fresh 200 response, or turn a 304 into the cached response.
+        Returns the response the caller should use; a 304 comes back unchanged
+        when the cached copy is gone, and the caller has to fetch the page again.
+        """
+        if response.status_code == 304:
+            entry = self._load(url, params)
+            if entry is not None:
+                meta, body_path = entry
+                cached = self._build_response(meta, body_path)
+                if cached is not None:
+                    meta['fetched_at'] = time.time()
+                    self._write_meta(self._key(url, params), meta)
+                    self._count('revalidated')
+                    return cached
+                # Body lost: drop the metadata so the next request is unconditional
+                self._remove(self._paths(self._key(url, params))[0])
+
+        self._count('misses')
+        if response.status_code == 200:
+            self._store(url, params, response)
+        return response
+
+    def _store(self, url: str, params: Optional[Dict], response: requests.Response):
+        key = self._key(url, params)
+        meta = {
+            'url': response.url or url,
+            'status_code': response.status_code,
+            'headers': {'Content-Type': response.headers.get('Content-Type', '')},
+            'encoding': response.encoding,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'fetched_at': time.time()
+        }
+        _, body_path = self._paths(key)
+        self._atomic_write(body_path, response.content)
+        self._write_meta(key, meta)
+
+    def _write_meta(self, key: str, meta: Dict):
+        meta_path, _ = self._paths(key)
+        self._atomic_write(meta_path, json.dumps(meta).encode('utf-8'))
+
+    def _atomic_write(self, path: str, data: bytes):
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def stats(self) -> Dict[str, int]:
+        return {'hits': self.hits, 'revalidated': self.revalidated, 'misses': self.misses, 'pruned': self.pruned}
@@ -0,0 +1,145 @@
+from typing import Dict, List, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml.html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+
+# Backends from fastest to slowest; 'auto' picks the first one available
+PARSER_BACKENDS = ('lxml', 'strainer', 'html.parser')
+
+
+def _has_class(class_name: str) -> str:
+    """XPath predicate matching elements whose class list contains `class_name`."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+_LXML_CARDS = f"//div[{_has_class('base-card')}]"
+_LXML_TITLE = f".//h3[{_has_class('base-search-card__title')}]"
+_LXML_COMPANY = f".//h4[{_has_class('base-search-card__subtitle')}]"
+_LXML_LOCATION = f".//span[{_has_class('job-search-card__location')}]"
+_LXML_LINK = f".//a[{_has_class('base-card__full-link')}]"
+_LXML_SNIPPET = f".//p[{_has_class('base-search-card__snippet')}]"
+
+
+def _is_base_card_class(class_value) -> bool:
+    """
+    SoupStrainer class matcher. Strainers see the raw class attribute during parsing,
+    so a plain class_='base-card' would miss cards that carry several classes.
+    """
+    if not class_value:
+        return False
+    classes = class_value.split() if isinstance(class_value, str) else class_value
+    return 'base-card' in classes
+
+
+def parse_soup_card(card) -> Dict:
+    """Extract job fields from a BeautifulSoup `div.base-card` element."""
+    # Extract job title
+    title_elem = card.find('h3', class_='base-search-card__title')
+    title = title_elem.text.strip() if title_elem else 'N/A'
+
+    # Extract company name
+    company_elem = card.find('h4', class_='base-search-card__subtitle')
+    company = company_elem.text.strip() if company_elem else 'N/A'
+
+    # Extract location
+    location_elem = card.find('span', class_='job-search-card__location')
+    location = location_elem.text.strip() if location_elem else 'N/A'
+
+    # Extract job URL
+    link_elem = card.find('a', class_='base-card__full-link')
+    url = link_elem['href'] if link_elem and 'href' in link_elem.attrs else 'N/A'
+
+    # Extract job description (if available)
+    description_elem = card.find('p', class_='base-search-card__snippet')
+    description = description_elem.text.strip() if description_elem else 'No description available'
+
+    return {
+        'title': title,
+        'company': company,
+        'location': location,
+        'url': url,
+        'description': description,
+        'priority': None  # Will be set by LLM
+    }
+
+
+def _lxml_text(card, xpath: str, default: str) -> str:
+    elems = card.xpath(xpath)
+    return elems[0].text_content().strip() if elems else default
+
+
+def parse_lxml_card(card) -> Dict:
+    """Extract job fields from an lxml `div.base-card` element."""
+    links = card.xpath(_LXML_LINK)
+    url = links[0].get('href') if links and links[0].get('href') is not None else 'N/A'
+
+    return {
+        'title': _lxml_text(card, _LXML_TITLE, 'N/A'),
+        'company': _lxml_text(card, _LXML_COMPANY, 'N/A'),
+        'location': _lxml_text(card, _LXML_LOCATION, 'N/A'),
+        'url': url,
+        'description': _lxml_text(card, _LXML_SNIPPET, 'No description available'),
+        'priority': None  # Will be set by LLM
+    }
+
+
+class JobCardParser:
+    """
+    Parses LinkedIn search result pages into job dictionaries.
+
+    Backends:
+    - lxml: libxml2 parse plus XPath lookups (requires lxml)
+    - strainer: html.parser restricted by a SoupStrainer to the job cards only
+    - html.parser: full BeautifulSoup tree of the whole page
+    """
+
+    def __init__(self, backend: str = 'auto'):
+        if backend == 'auto':
+            backend = 'lxml' if LXML_AVAILABLE else 'strainer'
+        if backend not in PARSER_BACKENDS:
+            raise ValueError(f"Unknown parser backend '{backend}', expected one of {PARSER_BACKENDS}")
+        if backend == 'lxml' and not LXML_AVAILABLE:
+            print("⚠ lxml is not installed. Falling back to the 'strainer' parser backend...")
+            backend = 'strainer'
+        self.backend = backend
+
+    def parse(self, content: bytes) -> tuple[List[Optional[Dict]], int]:
+        """
+        Parse a search results page.
+        Returns the parsed jobs (None for cards that failed to parse)
+        and the number of job cards found on the page.
+        """
+        if self.backend == 'lxml':
+            return self._parse_lxml(content)
+        return self._parse_soup(content)
+
+    def _parse_lxml(self, content: bytes) -> tuple[List[Optional[Dict]], int]:
+        if not content or not content.strip():
+            return [], 0
+
+        tree = lxml.html.fromstring(content)
+        cards = tree.xpath(_LXML_CARDS)
+        return [self._safe(parse_lxml_card, card) for card in cards], len(cards)
+
+    def _parse_soup(self, content: bytes) -> tuple[List[Optional[Dict]], int]:
+        if self.backend == 'strainer':
+            # Only build tree nodes for the job cards, skipping the rest of the page
+            soup = BeautifulSoup(content, 'html.parser', parse_only=SoupStrainer('div', attrs={'class': _is_base_card_class}))
+        else:
+            soup = BeautifulSoup(content, 'html.parser')
+
+        cards = soup.find_all('div', class_='base-card')
+        return [self._safe(parse_soup_card, card) for card in cards], len(cards)
+
+    def _safe(self, parse_card, card) -> Optional[Dict]:
+        try:
+            return parse_card(card)
+        except Exception as e:
+            print(f"Error parsing job card details: {e}")
+            return None
@@ -1,94 +1,485 @@
-from anthropic import Anthropic
-from typing import List, Dict
+from anthropic import Anthropic, APIConnectionError, APIStatusError, RateLimitError
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import List, Dict, Optional
 import json
+import os
+import random
+import re
+import threading
+import time
 from config import Config
+from score_cache import ScoreCache, make_cache_key
+from metrics import RunMetrics
+from llm_usage import (ScoringBudget, UsageLedger, USAGE_FIELDS, estimate_cost, estimate_tokens,
+                       min_cacheable_tokens)
+
+# Reasoning prefix marking a job whose scoring call failed
+SCORING_ERROR_PREFIX = "Error occurred during scoring"
+
+# Reasoning prefix marking a job left unscored for now (budget ran out, batch still processing)
+UNSCORED_PREFIX = "Not scored"
+BUDGET_EXHAUSTED_REASONING = f"{UNSCORED_PREFIX}: the scoring budget ran out before this job"
+BATCH_PENDING_REASONING = f"{UNSCORED_PREFIX}: the message batch is still processing; results come next run"
+
+# Typical reply length per job, used to estimate a call's cost before sending it
+ESTIMATED_OUTPUT_TOKENS_PER_JOB = 150
+
+VALID_PRIORITIES = ("HIGH", "MED", "LOW")
+
+# Output budget per job in a multi-job batch reply
+BATCH_TOKENS_PER_JOB = 300
+
+# How replies are requested and read: 'full' waits for the whole completion, 'stream'
+# stops reading once the priority and the first reasoning sentences are in, and
+# 'priority' asks for the priority line alone
+RESPONSE_MODES = ('full', 'stream', 'priority')
+
+# Output caps in priority-only mode, per single-job reply and per job in a batch reply
+PRIORITY_ONLY_MAX_TOKENS = 10
+PRIORITY_ONLY_BATCH_TOKENS_PER_JOB = 20
+PRIORITY_ONLY_REASONING = "Scored in priority-only mode; no reasoning was requested."
+
+# A PRIORITY line whose value is complete
+PRIORITY_LINE = re.compile(r'^PRIORITY:\s*\**\s*(HIGH|MED|LOW)', re.MULTILINE | re.IGNORECASE)
+
+# Sentence-ending punctuation followed by whitespace
+SENTENCE_END = re.compile(r'[.!?](?=\s)')
+
+# Message Batches custom_id: a prefix of the job's score cache key (max 64 chars)
+BATCH_CUSTOM_ID_LENGTH = 40
+
+# Server errors worth retrying: 529 is Anthropic's "overloaded"
+RETRYABLE_STATUS_CODES = (500, 502, 503, 504, 529)
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """Rate-limit, overload and connection errors are transient; anything else is not."""
+    if isinstance(error, (RateLimitError, APIConnectionError)):
+        return True
+    return isinstance(error, APIStatusError) and error.status_code in RETRYABLE_STATUS_CODES
+
+
+# What to weigh and what each priority means, shared by the single- and multi-profile prompts
+SCORING_CRITERIA = """1. Skills match (required vs. user's skills)
+2. Experience level fit
+3. Career growth potential
+4. Job responsibilities alignment
+
+Guidelines:
+- HIGH: Excellent match (80%+ skills match, experience fits, strong alignment)
+- MED: Good match (50-79% skills match, reasonable fit with some gaps)
+- LOW: Poor match (<50% skills match, significant gaps, or misalignment)"""
+
+
+def create_system_prompt(user_skills: str, user_experience: str, user_profile: str) -> str:
+    """Scoring instructions for one user profile."""
+    return f"""You are a career advisor helping evaluate job opportunities.
+
+USER PROFILE:
+- Skills: {user_skills}
+- Experience: {user_experience} years
+- Profile: {user_profile}
+
+Analyze how well each job posting you are given matches the user's profile. Consider:
+{SCORING_CRITERIA}"""
+
+
+def cap_sentences(text: str, max_sentences: int) -> str:
+    """The first `max_sentences` sentences of `text`."""
+    ends = [match.end() for match in SENTENCE_END.finditer(text + ' ')]
+    return text[:ends[max_sentences - 1]].strip() if len(ends) >= max_sentences else text.strip()
+
+
+def mark_unscored(job: Dict, reasoning: str = BUDGET_EXHAUSTED_REASONING):
+    """Mark a job that got no score this run; it is shown as LOW and scored next run."""
+    job['priority'] = "LOW"
+    job['reasoning'] = reasoning
+    job['unscored'] = True
+
 
 class JobScorer:
     """
     Uses Claude (Anthropic) LLM to score jobs based on user profile and requirements.
     """
 
-    def __init__(self, api_key: str, user_profile: str, user_skills: str, user_experience: str):
-        self.client = Anthropic(api_key=api_key)
+    def __init__(self, api_key: str, user_profile: str, user_skills: str, user_experience: str,
+                 model: str = "claude-sonnet-4-5-20250929", temperature: float = 0,
+                 score_cache: Optional[ScoreCache] = None, base_url: Optional[str] = None,
+                 max_concurrency: int = 1, max_retries: int = 4,
+                 retry_base_delay: float = 1.0, retry_max_delay: float = 30.0,
+                 metrics: Optional[RunMetrics] = None, usage_ledger: Optional[UsageLedger] = None,
+                 budget: Optional[ScoringBudget] = None, response_mode: str = 'full',
+                 max_output_tokens: int = 300, max_reasoning_sentences: int = 2):
+        if response_mode not in RESPONSE_MODES:
+            raise ValueError(f"Unknown response mode '{response_mode}', expected one of {RESPONSE_MODES}")
+        # Retries are handled by _create_message, so the SDK's own retries are off
+        self.client = Anthropic(api_key=api_key, base_url=base_url, max_retries=0)
         self.user_profile = user_profile
         self.user_skills = user_skills
         self.user_experience = user_experience
+        self.model = model
+        self.temperature = temperature
+        self.score_cache = score_cache
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.retry_count = 0
+        self._retry_lock = threading.Lock()
+        self.metrics = metrics or RunMetrics()
+        self.usage_totals = {
+            'input_tokens': 0,
+            'output_tokens': 0,
+            'cache_creation_input_tokens': 0,
+            'cache_read_input_tokens': 0
+        }
+        self.cost_usd = 0.0
+        self._usage_lock = threading.Lock()
+        # Every call's usage is logged here, so spending can be tracked across runs
+        self.usage_ledger = usage_ledger
+        # With a budget, the most promising jobs are scored first and scoring stops when it runs out
+        self.budget = budget
+        self.response_mode = response_mode
+        # Output caps for 'stream' mode: max_tokens per request and reasoning sentences kept
+        self.max_output_tokens = max_output_tokens
+        self.max_reasoning_sentences = max(1, max_reasoning_sentences)
 
     def score_jobs(self, jobs: List[Dict]) -> List[Dict]:
         """
         Score all jobs and assign priority (HIGH, MED, LOW).
+        Up to `max_concurrency` requests are in flight at once; jobs keep their input order.
+        Each job gets its scoring time in `scoring_latency_ms`.
         """
         print(f"Scoring {len(jobs)} jobs using Claude LLM...")
 
-        for i, job in enumerate(jobs):
-            print(f"Scoring job {i+1}/{len(jobs)}: {job['title']} at {job['company']}")
+        def score(indexed_job: tuple[int, Dict]) -> Dict:
+            i, job = indexed_job
+            if self.budget is None or not self.budget.exhausted:
+                print(f"Scoring job {i+1}/{len(jobs)}: {job['title']} at {job['company']}")
+            start = time.perf_counter()
             priority, reasoning = self._score_single_job(job)
             job['priority'] = priority
             job['reasoning'] = reasoning
+            if reasoning.startswith(UNSCORED_PREFIX):
+                job['unscored'] = True
+                return job
+            job['scoring_latency_ms'] = (time.perf_counter() - start) * 1000
+            if reasoning.startswith(SCORING_ERROR_PREFIX):
+                job['scoring_failed'] = True
+            return job
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            list(executor.map(score, self._scheduling_order(jobs)))
 
+        self._print_latency_summary(jobs)
+        self._print_usage_summary(jobs)
         return jobs
 
-    def _score_single_job(self, job: Dict) -> tuple[str, str]:
+    def _scheduling_order(self, jobs: List[Dict]) -> List[tuple[int, Dict]]:
+        """
+        (index, job) pairs in the order to score them. Under a budget, jobs with the
+        best pre-filter skill match go first, so the budget is spent where it matters most.
+        """
+        indexed_jobs = list(enumerate(jobs))
+        if self.budget is not None:
+            indexed_jobs.sort(key=lambda indexed_job: -indexed_job[1].get('prefilter_score', 0.0))
+        return indexed_jobs
+
+    def _print_latency_summary(self, jobs: List[Dict]):
+        latencies = sorted(job['scoring_latency_ms'] for job in jobs if 'scoring_latency_ms' in job)
+        if not latencies:
+            return
+        p50 = latencies[len(latencies) // 2]
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        print(f"Scoring latency: p50 {p50:.0f} ms, p95 {p95:.0f} ms, max {latencies[-1]:.0f} ms "
+              f"({self.retry_count} retries)")
+
+    def _record_usage(self, usage, job_count: int = 1, kind: str = 'message',
+                      reservation: Optional[tuple[int, float]] = None):
+        """
+        Add a response's token usage (including prompt-cache reads/writes) and estimated
+        cost to the run totals and the usage ledger, and settle its budget reservation.
+        """
+        if usage is None:
+            self._release_budget(reservation)
+            return
+        tokens = {field: getattr(usage, field, None) or 0 for field in USAGE_FIELDS}
+        cost = estimate_cost(self.model, tokens, batch=kind == 'message_batch')
+        with self._usage_lock:
+            for field, count in tokens.items():
+                self.usage_totals[field] += count
+                self.metrics.inc('llm_tokens_total', count, type=field.replace('_input_tokens', '').replace('_tokens', ''))
+            self.cost_usd += cost
+        self.metrics.inc('llm_cost_usd_total', cost)
+        if self.usage_ledger is not None:
+            self.usage_ledger.record(self.model, tokens, cost, kind=kind, jobs=job_count)
+        if self.budget is not None and reservation is not None:
+            self.budget.settle(*reservation, sum(tokens.values()), cost)
+
+    def _reserve_budget(self, prompt: str, job_count: int = 1, batch: bool = False) -> Optional[tuple[int, float]]:
+        """
+        Reserve the estimated tokens and cost of a call. Returns the reservation,
+        or None if the budget can't cover the call. Without a budget this always succeeds.
+        The shared system prompt is counted as uncached input, so estimates err high.
+        """
+        if self.budget is None:
+            return (0, 0.0)
+        usage = {
+            'input_tokens': estimate_tokens(self._create_system_prompt()) + estimate_tokens(prompt),
+            'output_tokens': self._estimated_output_tokens() * job_count
+        }
+        tokens, cost = sum(usage.values()), estimate_cost(self.model, usage, batch=batch)
+        return (tokens, cost) if self.budget.reserve(tokens, cost) else None
+
+    def _estimated_output_tokens(self) -> int:
+        if self.response_mode == 'priority':
+            return PRIORITY_ONLY_MAX_TOKENS
+        if self.response_mode == 'stream':
+            return min(ESTIMATED_OUTPUT_TOKENS_PER_JOB, self.max_output_tokens)
+        return ESTIMATED_OUTPUT_TOKENS_PER_JOB
+
+    def _release_budget(self, reservation: Optional[tuple[int, float]]):
+        if self.budget is not None and reservation is not None:
+            self.budget.release(*reservation)
+
+    def _print_usage_summary(self, jobs: List[Dict]):
+        totals = self.usage_totals
+        print(f"Token usage: {totals['input_tokens']} input, {totals['output_tokens']} output, "
+              f"{totals['cache_read_input_tokens']} cache read, "
+              f"{totals['cache_creation_input_tokens']} cache write (about ${self.cost_usd:.4f})")
+        if self.budget is not None:
+            unscored = sum(1 for job in jobs if job.get('unscored'))
+            print(f"Scoring budget: {self.budget.describe()} used"
+                  + (f"; {unscored} jobs left unscored" if unscored else ''))
+
+    def _create_message(self, **kwargs):
+        """
+        Call messages.create, retrying rate-limit and overload errors with
+        jittered exponential backoff. Other errors are raised immediately.
+        """
+        with self.metrics.timer('llm_call_seconds'):
+            try:
+                message = self._call_with_retries(self.client.messages.create, **kwargs)
+            except Exception:
+                self.metrics.inc('llm_calls_total', outcome='error')
+                raise
+        self.metrics.inc('llm_calls_total', outcome='ok')
+        return message
+
+    def _stream_message(self, **kwargs) -> tuple[str, SimpleNamespace]:
+        """
+        Stream a reply and stop reading as soon as it holds everything that is kept: the
+        PRIORITY line, plus the first `max_reasoning_sentences` reasoning sentences unless
+        in 'priority' mode. Closing the stream stops generation, so the rest of the reply
+        is neither waited for nor billed beyond the tokens already in flight. Returns the
+        text and its usage; output tokens of a stream cut short are estimated from the text.
+        """
+        with self.metrics.timer('llm_call_seconds'):
+            try:
+                text, usage, stopped_early = self._call_with_retries(self._read_stream, **kwargs)
+            except Exception:
+                self.metrics.inc('llm_calls_total', outcome='error')
+                raise
+        self.metrics.inc('llm_calls_total', outcome='ok')
+        if stopped_early:
+            self.metrics.inc('llm_streams_stopped_early_total')
+        return text, usage
+
+    def _read_stream(self, **kwargs) -> tuple[str, SimpleNamespace, bool]:
+        start = time.perf_counter()
+        usage = dict.fromkeys(USAGE_FIELDS, 0)
+        text = ''
+        priority_seen = False
+        stream = self.client.messages.create(stream=True, **kwargs)
+        try:
+            for event in stream:
+                if event.type == 'message_start':
+                    for field in USAGE_FIELDS:
+                        usage[field] = getattr(event.message.usage, field, None) or 0
+                elif event.type == 'content_block_delta' and event.delta.type == 'text_delta':
+                    text += event.delta.text
+                    if not priority_seen and PRIORITY_LINE.search(text):
+                        priority_seen = True
+                        self.metrics.observe('llm_time_to_priority_seconds', time.perf_counter() - start)
+                    if priority_seen and self._reply_complete(text):
+                        usage['output_tokens'] = estimate_tokens(text)
+                        return text, SimpleNamespace(**usage), True
+                elif event.type == 'message_delta' and event.usage is not None:
+                    usage['output_tokens'] = event.usage.output_tokens
+        finally:
+            stream.close()
+        return text, SimpleNamespace(**usage), False
+
+    def _reply_complete(self, text: str) -> bool:
+        """Whether a partial reply (with its priority already in) holds everything that is kept."""
+        if self.response_mode == 'priority':
+            return True
+        start = text.find('REASONING:')
+        return start != -1 and len(SENTENCE_END.findall(text, start)) >= self.max_reasoning_sentences
+
+    def _call_with_retries(self, api_call, *args, **kwargs):
+        """Run an API call with the retry policy described in _create_message."""
+        for attempt in range(self.max_retries + 1):
+            try:
+                return api_call(*args, **kwargs)
+            except Exception as e:
+                if attempt == self.max_retries or not is_retryable_error(e):
+                    raise
+                delay = self._retry_delay(e, attempt)
+                with self._retry_lock:
+                    self.retry_count += 1
+                self.metrics.inc('llm_retries_total', error=e.__class__.__name__)
+                print(f"Retryable scoring error ({e.__class__.__name__}), retrying in {delay:.1f}s...")
+                time.sleep(delay)
+
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        """Full-jitter exponential backoff, but never sooner than the server's Retry-After."""
+        delay = random.uniform(0, min(self.retry_max_delay, self.retry_base_delay * 2 ** attempt))
+        response = getattr(error, 'response', None)
+        retry_after = response.headers.get('retry-after') if response is not None else None
+        if retry_after:
+            try:
+                delay = max(delay, min(self.retry_max_delay, float(retry_after)))
+            except ValueError:
+                pass
+        return delay
+
+    def _score_single_job(self, job: Dict, system_prompt: Optional[str] = None) -> tuple[str, str]:
         """
         Score a single job and return priority and reasoning.
+        Identical prompts scored before (same model and temperature) come from the score cache.
+        `system_prompt` replaces the scorer's own system prompt.
         """
         prompt = self._create_scoring_prompt(job)
 
+        cache_key = self._prompt_cache_key(prompt, system_prompt)
+        if self.score_cache:
+            cached = self.score_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        reservation = self._reserve_budget(prompt)
+        if reservation is None:
+            return "LOW", BUDGET_EXHAUSTED_REASONING
+
         try:
-            message = self.client.messages.create(
-                model="claude-sonnet-4-5-20250929",
-                max_tokens=1000,
-                temperature=0,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
-            )
+            if self.response_mode == 'full':
+                message = self._create_message(**self._request_params(prompt, system_prompt))
+                usage = getattr(message, 'usage', None)
+                response_text = ''.join(block.text for block in message.content if block.type == 'text')
+            else:
+                response_text, usage = self._stream_message(**self._request_params(prompt, system_prompt))
+        except Exception as e:
+            self._release_budget(reservation)
+            print(f"Error scoring job: {e}")
+            return "LOW", f"{SCORING_ERROR_PREFIX}: {str(e)}"
+
+        self._record_usage(usage, reservation=reservation)
+        try:
+            priority, reasoning = self._parse_reply(response_text)
 
-            response_text = message.content[0].text
-            priority, reasoning = self._parse_llm_response(response_text)
+            if self.score_cache:
+                self.score_cache.put(cache_key, (priority, reasoning))
 
             return priority, reasoning
 
         except Exception as e:
             print(f"Error scoring job: {e}")
-            return "LOW", f"Error occurred during scoring: {str(e)}"
+            return "LOW", f"{SCORING_ERROR_PREFIX}: {str(e)}"
 
-    def _create_scoring_prompt(self, job: Dict) -> str:
+    def _request_params(self, prompt: str, system_prompt: Optional[str] = None) -> Dict:
+        """messages.create arguments for one job's prompt in the configured response mode."""
+        params = {
+            'model': self.model,
+            'max_tokens': 1000,
+            'temperature': self.temperature,
+            'system': self._system_blocks(system_prompt),
+            'messages': [{'role': 'user', 'content': prompt}]
+        }
+        if self.response_mode == 'stream':
+            params['max_tokens'] = self.max_output_tokens
+        elif self.response_mode == 'priority':
+            params['max_tokens'] = PRIORITY_ONLY_MAX_TOKENS
+            # Generation ends with the PRIORITY line even when the reply isn't streamed
+            params['stop_sequences'] = ['\n']
+        return params
+
+    def _parse_reply(self, response: str) -> tuple[str, str]:
+        """Priority and reasoning of a single-job reply, with reasoning trimmed to the response mode."""
+        priority, reasoning = self._parse_llm_response(response)
+        if self.response_mode == 'priority':
+            return priority, PRIORITY_ONLY_REASONING
+        if self.response_mode == 'stream':
+            return priority, cap_sentences(reasoning, self.max_reasoning_sentences)
+        return priority, reasoning
+
+    def _create_system_prompt(self) -> str:
         """
-        Create a prompt for the LLM to score the job.
+        Create the instructions and user profile shared by every scoring request.
+        This prefix is identical across jobs, so it is sent as a cached system block.
         """
-        prompt = f"""You are a career advisor helping evaluate job opportunities.
+        return create_system_prompt(self.user_skills, self.user_experience, self.user_profile)
 
-USER PROFILE:
-- Skills: {self.user_skills}
-- Experience: {self.user_experience} years
-- Profile: {self.user_profile}
+    def _system_blocks(self, system_prompt: Optional[str] = None) -> List[Dict]:
+        """
+        System prompt, marked for prompt caching when it is long enough for the model's
+        minimum cacheable length, so later calls read it from the cache. Shorter prompts
+        can't be cached and go out unmarked.
+        """
+        block = {"type": "text", "text": system_prompt or self._create_system_prompt()}
+        if estimate_tokens(block["text"]) >= min_cacheable_tokens(self.model):
+            block["cache_control"] = {"type": "ephemeral"}
+        return [block]
+
+    def scoring_fingerprint(self) -> str:
+        """
+        Hash of everything besides the posting that decides a score: system prompt
+        (instructions and profile), response mode, model and temperature. Stored
+        scores with a different fingerprint are stale.
+        """
+        return make_cache_key(self._create_system_prompt() + self._response_settings(), self.model, self.temperature)
+
+    def _prompt_cache_key(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+        """
+        Score-cache key covering the full rendered request (system prompt, job prompt,
+        model, temperature) and the response mode, since 'stream' keeps shorter reasoning.
+        """
+        return make_cache_key((system_prompt or self._create_system_prompt()) + "\n\n" + prompt
+                              + self._response_settings(), self.model, self.temperature)
 
-JOB POSTING:
+    def _response_settings(self) -> str:
+        """Cache-key suffix for the response mode; empty for 'full', so its keys predate the modes."""
+        if self.response_mode == 'stream':
+            return f"\n\n[response: stream, {self.max_reasoning_sentences} sentences]"
+        if self.response_mode == 'priority':
+            return "\n\n[response: priority]"
+        return ''
+
+    def _create_scoring_prompt(self, job: Dict) -> str:
+        """
+        Create the per-job part of the prompt for the LLM to score the job.
+        """
+        prompt = f"""JOB POSTING:
 - Title: {job['title']}
 - Company: {job['company']}
 - Location: {job['location']}
 - Description: {job['description']}
 
-Analyze how well this job matches the user's profile. Consider:
-1. Skills match (required vs. user's skills)
-2. Experience level fit
-3. Career growth potential
-4. Job responsibilities alignment
-
-Provide your assessment in the following format:
-PRIORITY: [HIGH/MED/LOW]
-REASONING: [2-3 sentences explaining why]
-
-Guidelines:
-- HIGH: Excellent match (80%+ skills match, experience fits, strong alignment)
-- MED: Good match (50-79% skills match, reasonable fit with some gaps)
-- LOW: Poor match (<50% skills match, significant gaps, or misalignment)
+{self._response_format()}
 
 Your response:"""
 
         return prompt
 
+    def _response_format(self) -> str:
+        if self.response_mode == 'priority':
+            return """Respond with only the priority, in this format:
+PRIORITY: [HIGH/MED/LOW]"""
+        return """Provide your assessment in the following format:
+PRIORITY: [HIGH/MED/LOW]
+REASONING: [2-3 sentences explaining why]"""
+
     def _parse_llm_response(self, response: str) -> tuple[str, str]:
         """
         Parse the LLM response to extract priority and reasoning.
@@ -125,11 +516,520 @@ Your response:"""
 
     def batch_score_jobs(self, jobs: List[Dict], batch_size: int = 5) -> List[Dict]:
         """
-        Score jobs in batches for efficiency (optional optimization).
+        Score jobs in batches for efficiency: up to `batch_size` jobs share one prompt,
+        so the profile block and instructions are sent once per batch instead of once per job.
+        Jobs missing from a malformed batch reply are scored one at a time.
+        """
+        if batch_size <= 1:
+            return self.score_jobs(jobs)
+
+        print(f"Scoring {len(jobs)} jobs using Claude LLM in batches of {batch_size}...")
+
+        # Scores from single-job requests are reused here; batch replies are cached
+        # under the batch request they answered (see _batch_cache_key)
+        pending = []
+        for i, job in self._scheduling_order(jobs):
+            cached = None
+            if self.score_cache:
+                cached = self.score_cache.get(self._cache_key(job))
+            if cached is not None:
+                job['priority'], job['reasoning'] = cached
+                job['scoring_latency_ms'] = 0.0
+            else:
+                pending.append((f"J{i + 1}", job))
+
+        batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+
+        def score_batch(batch: List[tuple[str, Dict]]):
+            prompt = self._create_batch_scoring_prompt(batch)
+            cache_keys = {job_key: self._batch_cache_key(prompt, job_key) for job_key, _ in batch}
+            if self.score_cache:
+                cached = {job_key: self.score_cache.get(cache_key) for job_key, cache_key in cache_keys.items()}
+                if all(result is not None for result in cached.values()):
+                    for job_key, job in batch:
+                        job['priority'], job['reasoning'] = cached[job_key]
+                        job['scoring_latency_ms'] = 0.0
+                    return
+
+            reservation = self._reserve_budget(prompt, len(batch))
+            if reservation is None:
+                for _, job in batch:
+                    mark_unscored(job)
+                return
+
+            print(f"Scoring batch of {len(batch)} jobs: {', '.join(job['title'] for _, job in batch)}")
+            start = time.perf_counter()
+            results = self._score_batch(batch, reservation)
+            latency_ms = (time.perf_counter() - start) * 1000
+
+            for job_key, job in batch:
+                if job_key in results:
+                    job['priority'], job['reasoning'] = results[job_key]
+                    job['scoring_latency_ms'] = latency_ms
+                    if self.score_cache:
+                        self.score_cache.put(cache_keys[job_key], results[job_key])
+                else:
+                    print(f"No batch result for {job['title']} at {job['company']}, scoring individually...")
+                    single_start = time.perf_counter()
+                    job['priority'], job['reasoning'] = self._score_single_job(job)
+                    job['scoring_latency_ms'] = latency_ms + (time.perf_counter() - single_start) * 1000
+                    if job['reasoning'].startswith(SCORING_ERROR_PREFIX):
+                        job['scoring_failed'] = True
+                    elif job['reasoning'].startswith(UNSCORED_PREFIX):
+                        job['unscored'] = True
+                        del job['scoring_latency_ms']
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            list(executor.map(score_batch, batches))
+
+        self._print_latency_summary(jobs)
+        self._print_usage_summary(jobs)
+        return jobs
+
+    def bulk_score_jobs(self, jobs: List[Dict], state_path: str, poll_interval: float = 60.0,
+                        max_wait_seconds: Optional[float] = None) -> List[Dict]:
+        """
+        Score jobs offline through the Message Batches API (half price, separate rate limits).
+        All uncached jobs go into one batch whose ID is saved to `state_path`, so a restarted
+        process resumes polling the same batch instead of submitting again.
+        Jobs whose results haven't arrived when `max_wait_seconds` runs out are marked
+        unscored and the batch is picked up again on the next run.
+        Under a budget, new requests are charged their estimated cost when submitted, and
+        jobs that no longer fit are left out of the batch and marked unscored.
+        """
+        print(f"Scoring {len(jobs)} jobs using the Claude Message Batches API...")
+
+        pending: Dict[str, List[Dict]] = {}
+        requests_by_id: Dict[str, Dict] = {}
+        for _, job in self._scheduling_order(jobs):
+            prompt = self._create_scoring_prompt(job)
+            cache_key = self._prompt_cache_key(prompt)
+            cached = self.score_cache.get(cache_key) if self.score_cache else None
+            if cached is not None:
+                job['priority'], job['reasoning'] = cached
+                continue
+
+            custom_id = cache_key[:BATCH_CUSTOM_ID_LENGTH]
+            pending.setdefault(custom_id, []).append(job)
+            requests_by_id[custom_id] = {
+                'custom_id': custom_id,
+                'params': self._request_params(prompt)
+            }
+
+        state = self._load_batch_state(state_path)
+        submitted = {custom_id for batch in state['batches'] for custom_id in batch['cache_keys']}
+        new_ids = [custom_id for custom_id in requests_by_id if custom_id not in submitted]
+        over_budget = set()
+        if self.budget is not None:
+            for i, custom_id in enumerate(new_ids):
+                prompt = requests_by_id[custom_id]['params']['messages'][0]['content']
+                reservation = self._reserve_budget(prompt, batch=True)
+                if reservation is None:
+                    over_budget = set(new_ids[i:])
+                    new_ids = new_ids[:i]
+                    break
+                # Results may only arrive in a later run, so the estimate stands as the charge
+                self.budget.settle(*reservation, *reservation)
+
+        if state['batches']:
+            print(f"Resuming {len(state['batches'])} submitted message batch(es)")
+        if new_ids:
+            batch = self._call_with_retries(
+                self.client.messages.batches.create,
+                requests=[requests_by_id[custom_id] for custom_id in new_ids]
+            )
+            state['batches'].append({
+                'id': batch.id,
+                'submitted_at': time.time(),
+                'cache_keys': {
+                    custom_id: self._prompt_cache_key(requests_by_id[custom_id]['params']['messages'][0]['content'])
+                    for custom_id in new_ids
+                }
+            })
+            self._save_batch_state(state_path, state)
+            print(f"Submitted message batch {batch.id} with {len(new_ids)} requests")
+
+        results = self._wait_for_batches(state, state_path, poll_interval, max_wait_seconds)
+
+        for custom_id, custom_jobs in pending.items():
+            if custom_id in over_budget:
+                for job in custom_jobs:
+                    mark_unscored(job)
+                continue
+            if custom_id not in results:
+                for job in custom_jobs:
+                    mark_unscored(job, BATCH_PENDING_REASONING)
+                continue
+            priority, reasoning = results[custom_id]
+            for job in custom_jobs:
+                job['priority'] = priority
+                job['reasoning'] = reasoning
+                if reasoning.startswith(SCORING_ERROR_PREFIX):
+                    job['scoring_failed'] = True
+
+        self._print_usage_summary(jobs)
+        return jobs
+
+    def _wait_for_batches(self, state: Dict, state_path: str, poll_interval: float,
+                          max_wait_seconds: Optional[float]) -> Dict[str, tuple[str, str]]:
+        """
+        Poll every batch in `state` until it ends (or time runs out) and collect its results.
+        Finished batches are removed from the saved state.
+        """
+        results = {}
+        deadline = time.monotonic() + max_wait_seconds if max_wait_seconds is not None else None
+
+        while state['batches']:
+            for batch in list(state['batches']):
+                status = self._call_with_retries(self.client.messages.batches.retrieve, batch['id'])
+                if status.processing_status != 'ended':
+                    continue
+
+                results.update(self._collect_batch_results(batch))
+                state['batches'].remove(batch)
+                self._save_batch_state(state_path, state)
+
+            if not state['batches']:
+                break
+            if deadline is not None and time.monotonic() + poll_interval > deadline:
+                print("Message batches still processing; will resume on the next run")
+                break
+            print(f"Waiting for {len(state['batches'])} message batch(es)...")
+            time.sleep(poll_interval)
+
+        return results
+
+    def _collect_batch_results(self, batch: Dict) -> Dict[str, tuple[str, str]]:
+        """Map a finished batch's results back to custom IDs and fill the score cache."""
+        results = {}
+        for entry in self._call_with_retries(self.client.messages.batches.results, batch['id']):
+            if entry.result.type == 'succeeded':
+                self._record_usage(getattr(entry.result.message, 'usage', None), kind='message_batch')
+                priority, reasoning = self._parse_reply(entry.result.message.content[0].text)
+                results[entry.custom_id] = (priority, reasoning)
+                cache_key = batch['cache_keys'].get(entry.custom_id)
+                if self.score_cache and cache_key:
+                    self.score_cache.put(cache_key, (priority, reasoning))
+            else:
+                results[entry.custom_id] = ("LOW", f"{SCORING_ERROR_PREFIX}: batch request {entry.result.type}")
+
+        print(f"Collected {len(results)} results from message batch {batch['id']}")
+        return results
+
+    def _load_batch_state(self, state_path: str) -> Dict:
+        try:
+            with open(state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {'batches': []}
+
+    def _save_batch_state(self, state_path: str, state: Dict):
+        if not state['batches']:
+            if os.path.exists(state_path):
+                os.remove(state_path)
+            return
+
+        directory = os.path.dirname(state_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = state_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, state_path)
+
+    def _cache_key(self, job: Dict) -> str:
+        return self._prompt_cache_key(self._create_scoring_prompt(job))
+
+    def _batch_cache_key(self, prompt: str, job_key: str) -> str:
+        """Score-cache key for one result in a multi-result reply: the request sent, plus the result's ID."""
+        return self._prompt_cache_key(f"{prompt}\n\n[result: {job_key}]")
+
+    def _score_batch(self, batch: List[tuple[str, Dict]],
+                     reservation: Optional[tuple[int, float]] = None) -> Dict[str, tuple[str, str]]:
+        """
+        Score several jobs with one request.
+        Returns {job_key: (priority, reasoning)} for every job the reply covered validly.
+        """
+        prompt = self._create_batch_scoring_prompt(batch)
+
+        message = None
+        try:
+            message = self._create_message(
+                model=self.model,
+                max_tokens=(PRIORITY_ONLY_BATCH_TOKENS_PER_JOB if self.response_mode == 'priority'
+                            else BATCH_TOKENS_PER_JOB) * len(batch),
+                temperature=self.temperature,
+                system=self._system_blocks(),
+                messages=[
+                    {"role": "user", "content": prompt}
+                ]
+            )
+            self._record_usage(getattr(message, 'usage', None), job_count=len(batch), kind='batch',
+                               reservation=reservation)
+            return self._parse_batch_response(message.content[0].text, [job_key for job_key, _ in batch])
+
+        except Exception as e:
+            if message is None:
+                self._release_budget(reservation)
+            print(f"Error scoring batch: {e}")
+            return {}
+
+    def _create_batch_scoring_prompt(self, batch: List[tuple[str, Dict]]) -> str:
+        """
+        Create one prompt covering several jobs, each tagged with its JOB ID.
+        """
+        if self.response_mode == 'priority':
+            batch_format = '{"J1": {"priority": "HIGH"}}'
+        else:
+            batch_format = '{"J1": {"priority": "HIGH", "reasoning": "2-3 sentences explaining why"}}'
+        job_sections = "\n\n".join(
+            f"""[JOB ID: {job_key}]
+- Title: {job['title']}
+- Company: {job['company']}
+- Location: {job['location']}
+- Description: {job['description']}"""
+            for job_key, job in batch
+        )
+
+        prompt = f"""JOB POSTINGS ({len(batch)}):
+
+{job_sections}
+
+Respond with only a JSON object mapping every JOB ID to its assessment, in this format:
+{batch_format}
+
+Your response:"""
+
+        return prompt
+
+    def _parse_batch_response(self, response: str, job_keys: List[str]) -> Dict[str, tuple[str, str]]:
+        """
+        Parse an ID-keyed JSON batch reply. Entries with unknown IDs or an invalid
+        priority are dropped, so the caller can rescore those jobs individually.
         """
-        # For now, we'll score individually, but this can be optimized
-        # to send multiple jobs in one prompt
-        return self.score_jobs(jobs)
+        start, end = response.find('{'), response.rfind('}')
+        if start == -1 or end <= start:
+            print("Malformed batch response: no JSON object found")
+            return {}
+
+        try:
+            data = json.loads(response[start:end + 1])
+        except json.JSONDecodeError as e:
+            print(f"Malformed batch response: {e}")
+            return {}
+
+        results = {}
+        for job_key in job_keys:
+            entry = data.get(job_key) if isinstance(data, dict) else None
+            if not isinstance(entry, dict):
+                continue
+            priority = str(entry.get('priority', '')).strip().upper()
+            if priority not in VALID_PRIORITIES:
+                continue
+            reasoning = str(entry.get('reasoning') or 'No reasoning provided').strip()
+            if self.response_mode == 'priority':
+                reasoning = PRIORITY_ONLY_REASONING
+            elif self.response_mode == 'stream':
+                # Same length as streamed single-job replies, which share the cache keys
+                reasoning = cap_sentences(reasoning, self.max_reasoning_sentences)
+            results[job_key] = (priority, reasoning)
+
+        return results
+
+
+class MultiProfileScorer(JobScorer):
+    """
+    Scores one shared set of jobs against several candidate profiles.
+
+    Every profile goes into one shared system prompt, and each job is sent once
+    together with the IDs of the profiles it still needs, so a posting's
+    description costs input tokens once rather than once per profile. Scores
+    cached by single-profile runs of the same profile are reused; replies are
+    cached under the request they answered. Profiles a reply leaves out are
+    scored on their own with a single-profile request.
+
+    Profiles are dicts with `name`, `user_profile`, `user_skills` and
+    `user_experience`. Use `score_profiles`; the single-profile methods
+    inherited from JobScorer don't apply here.
+    """
+
+    def __init__(self, api_key: str, profiles: List[Dict], **kwargs):
+        super().__init__(api_key, user_profile='', user_skills='', user_experience='', **kwargs)
+        # Short IDs keep the prompts and JSON replies compact
+        self.profiles = {f"P{i + 1}": profile for i, profile in enumerate(profiles)}
+        self._profile_ids = {profile['name']: profile_id for profile_id, profile in self.profiles.items()}
+        self._profile_system_prompts = {
+            profile_id: create_system_prompt(profile['user_skills'], profile['user_experience'],
+                                             profile['user_profile'])
+            for profile_id, profile in self.profiles.items()
+        }
+
+    def score_profiles(self, jobs_by_profile: Dict[str, List[Dict]]) -> Dict[str, List[Dict]]:
+        """
+        Score each profile's own copies of the shared jobs in place, keyed by profile name.
+        Copies of one posting (matched by URL) are scored together with a single request.
+        """
+        copies_by_url = {}
+        for name, jobs in jobs_by_profile.items():
+            profile_id = self._profile_ids[name]
+            for job in jobs:
+                copies_by_url.setdefault(job['url'], {})[profile_id] = job
+
+        print(f"Scoring {len(copies_by_url)} jobs for {len(jobs_by_profile)} profiles using Claude LLM...")
+
+        pending = []
+        for copies in copies_by_url.values():
+            prompt = self._create_profiles_prompt(next(iter(copies.values())), list(copies))
+            for profile_id, job in list(copies.items()):
+                cached = None
+                if self.score_cache:
+                    # A reply to this same request, or a single-profile run's score
+                    cached = (self.score_cache.get(self._batch_cache_key(prompt, profile_id))
+                              or self.score_cache.get(self._profile_cache_key(profile_id, job)))
+                if cached is not None:
+                    job['priority'], job['reasoning'] = cached
+                    job['scoring_latency_ms'] = 0.0
+                    del copies[profile_id]
+            if copies and self.score_cache and prompt != self._create_profiles_prompt(job, list(copies)):
+                # The rest may have been sent on their own by an earlier run with the same cached scores
+                prompt = self._create_profiles_prompt(job, list(copies))
+                cached = {profile_id: self.score_cache.get(self._batch_cache_key(prompt, profile_id))
+                          for profile_id in copies}
+                if all(result is not None for result in cached.values()):
+                    for profile_id, copy in copies.items():
+                        copy['priority'], copy['reasoning'] = cached[profile_id]
+                        copy['scoring_latency_ms'] = 0.0
+                    copies.clear()
+            if copies:
+                pending.append(copies)
+        if self.budget is not None:
+            # Best skill match for any profile first, as in _scheduling_order
+            pending.sort(key=lambda copies: -max(job.get('prefilter_score', 0.0) for job in copies.values()))
+
+        def score(indexed_copies: tuple[int, Dict[str, Dict]]):
+            i, copies = indexed_copies
+            job = next(iter(copies.values()))
+            prompt = self._create_profiles_prompt(job, list(copies))
+            cache_keys = {profile_id: self._batch_cache_key(prompt, profile_id) for profile_id in copies}
+            reservation = self._reserve_budget(prompt, len(copies))
+            if reservation is None:
+                for copy in copies.values():
+                    mark_unscored(copy)
+                return
+
+            print(f"Scoring job {i + 1}/{len(pending)} for {len(copies)} profiles: "
+                  f"{job['title']} at {job['company']}")
+            start = time.perf_counter()
+            results = self._score_profiles_request(prompt, list(copies), reservation)
+            latency_ms = (time.perf_counter() - start) * 1000
+
+            for profile_id, copy in copies.items():
+                if profile_id in results:
+                    copy['priority'], copy['reasoning'] = results[profile_id]
+                    copy['scoring_latency_ms'] = latency_ms
+                    if self.score_cache:
+                        self.score_cache.put(cache_keys[profile_id], results[profile_id])
+                else:
+                    print(f"No result for profile {self.profiles[profile_id]['name']} on {job['title']} "
+                          f"at {job['company']}, scoring individually...")
+                    single_start = time.perf_counter()
+                    copy['priority'], copy['reasoning'] = self._score_single_job(
+                        copy, self._profile_system_prompts[profile_id])
+                    copy['scoring_latency_ms'] = latency_ms + (time.perf_counter() - single_start) * 1000
+                    if copy['reasoning'].startswith(SCORING_ERROR_PREFIX):
+                        copy['scoring_failed'] = True
+                    elif copy['reasoning'].startswith(UNSCORED_PREFIX):
+                        copy['unscored'] = True
+                        del copy['scoring_latency_ms']
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            list(executor.map(score, enumerate(pending)))
+
+        all_jobs = [job for jobs in jobs_by_profile.values() for job in jobs]
+        self._print_latency_summary(all_jobs)
+        self._print_usage_summary(all_jobs)
+        return jobs_by_profile
+
+    def profile_fingerprint(self, name: str) -> str:
+        """scoring_fingerprint of a single-profile JobScorer for the named profile."""
+        return make_cache_key(self._profile_system_prompts[self._profile_ids[name]] + self._response_settings(),
+                              self.model, self.temperature)
+
+    def _profile_cache_key(self, profile_id: str, job: Dict) -> str:
+        """The score-cache key a single-profile JobScorer for this profile would use."""
+        return self._prompt_cache_key(self._create_scoring_prompt(job), self._profile_system_prompts[profile_id])
+
+    def _score_profiles_request(self, prompt: str, profile_ids: List[str],
+                                reservation: Optional[tuple[int, float]] = None) -> Dict[str, tuple[str, str]]:
+        """
+        Score one job for several profiles with one request.
+        Returns {profile_id: (priority, reasoning)} for every profile the reply covered validly.
+        """
+        message = None
+        try:
+            message = self._create_message(
+                model=self.model,
+                max_tokens=(PRIORITY_ONLY_BATCH_TOKENS_PER_JOB if self.response_mode == 'priority'
+                            else BATCH_TOKENS_PER_JOB) * len(profile_ids),
+                temperature=self.temperature,
+                system=self._system_blocks(),
+                messages=[
+                    {"role": "user", "content": prompt}
+                ]
+            )
+            self._record_usage(getattr(message, 'usage', None), job_count=len(profile_ids), kind='profiles',
+                               reservation=reservation)
+            return self._parse_batch_response(message.content[0].text, profile_ids)
+
+        except Exception as e:
+            if message is None:
+                self._release_budget(reservation)
+            print(f"Error scoring job: {e}")
+            return {}
+
+    def _create_system_prompt(self) -> str:
+        """Instructions and every candidate profile, shared by all requests and cached."""
+        profiles = "\n\n".join(
+            f"""{profile_id}:
+- Skills: {profile['user_skills']}
+- Experience: {profile['user_experience']} years
+- Profile: {profile['user_profile']}"""
+            for profile_id, profile in self.profiles.items()
+        )
+        return f"""You are a career advisor helping evaluate job opportunities for several candidates.
+
+CANDIDATE PROFILES:
+
+{profiles}
+
+Analyze how well each job posting you are given matches each profile it is assessed for. Consider:
+{SCORING_CRITERIA}"""
+
+    def _create_profiles_prompt(self, job: Dict, profile_ids: List[str]) -> str:
+        """
+        Create the per-job prompt, listing the profiles to assess the job for.
+        """
+        if self.response_mode == 'priority':
+            reply_format = '{"P1": {"priority": "HIGH"}}'
+        else:
+            reply_format = '{"P1": {"priority": "HIGH", "reasoning": "2-3 sentences explaining why"}}'
+        profile_list = "\n".join(f"[PROFILE ID: {profile_id}]" for profile_id in profile_ids)
+
+        prompt = f"""JOB POSTING:
+- Title: {job['title']}
+- Company: {job['company']}
+- Location: {job['location']}
+- Description: {job['description']}
+
+Assess this posting for each of these profiles:
+{profile_list}
+
+Respond with only a JSON object mapping every PROFILE ID to its assessment, in this format:
+{reply_format}
+
+Your response:"""
+
+        return prompt
 
 
 def mock_score_jobs(jobs: List[Dict], user_profile: str) -> List[Dict]:
@@ -0,0 +1,154 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List
+
+from linkedin_fetcher import extract_job_id
+
+# Fields that define a posting's content; a change to any of them triggers rescoring
+CONTENT_FIELDS = ('title', 'company', 'location', 'description')
+
+
+def content_hash(job: Dict) -> str:
+    """Stable hash of the fields that the scorer looks at."""
+    digest = hashlib.sha256()
+    for field in CONTENT_FIELDS:
+        digest.update(str(job.get(field, '')).encode('utf-8'))
+        digest.update(b'\x00')
+    return digest.hexdigest()
+
+
+class JobStore:
+    """
+    SQLite-backed store of every job seen across runs, keyed by canonical job ID.
+    Lets each run score only postings that are new or whose content changed.
+
+    `scoring_fingerprint` identifies how jobs are scored (profile, model and
+    prompt settings, see JobScorer.scoring_fingerprint). Scores saved under a
+    different fingerprint are treated as stale, so editing the profile or
+    switching models rescores every posting.
+    """
+
+    def __init__(self, path: str, scoring_fingerprint: str = ''):
+        self.path = path
+        self.scoring_fingerprint = scoring_fingerprint
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                title TEXT,
+                company TEXT,
+                location TEXT,
+                url TEXT,
+                description TEXT,
+                content_hash TEXT NOT NULL,
+                priority TEXT,
+                reasoning TEXT,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL,
+                scored_at REAL,
+                scoring_fingerprint TEXT
+            )
+        """)
+        # Stores created before fingerprints existed: their scores count as stale
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        if 'scoring_fingerprint' not in columns:
+            self._conn.execute("ALTER TABLE jobs ADD COLUMN scoring_fingerprint TEXT")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_first_seen ON jobs (first_seen)")
+        self._conn.commit()
+
+    def upsert_jobs(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Insert or refresh the given jobs and return the ones that need scoring.
+        Unchanged jobs that were already scored with the current fingerprint get
+        their stored priority and reasoning copied onto the job dict.
+        """
+        now = time.time()
+        pending = []
+
+        with self._lock:
+            for job in jobs:
+                job_id = job.get('job_id') or extract_job_id(job.get('url', ''))
+                job['job_id'] = job_id
+                new_hash = content_hash(job)
+
+                row = self._conn.execute(
+                    "SELECT content_hash, priority, reasoning, first_seen, scoring_fingerprint "
+                    "FROM jobs WHERE job_id = ?",
+                    (job_id,)
+                ).fetchone()
+
+                if row is None:
+                    self._conn.execute(
+                        """INSERT INTO jobs (job_id, title, company, location, url, description,
+                                             content_hash, first_seen, last_seen)
+                           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                        (job_id, job.get('title'), job.get('company'), job.get('location'),
+                         job.get('url'), job.get('description'), new_hash, now, now)
+                    )
+                    job['first_seen'] = now
+                    pending.append(job)
+                    continue
+
+                stored_hash, priority, reasoning, first_seen, fingerprint = row
+                job['first_seen'] = first_seen
+
+                if (stored_hash == new_hash and priority is not None
+                        and fingerprint == self.scoring_fingerprint):
+                    self._conn.execute("UPDATE jobs SET last_seen = ?, url = ? WHERE job_id = ?",
+                                       (now, job.get('url'), job_id))
+                    job['priority'] = priority
+                    job['reasoning'] = reasoning
+                    continue
+
+                # Content or scoring setup changed (or never scored): refresh and drop the stale score
+                self._conn.execute(
+                    """UPDATE jobs SET title = ?, company = ?, location = ?, url = ?, description = ?,
+                                       content_hash = ?, priority = NULL, reasoning = NULL,
+                                       scored_at = NULL, last_seen = ?
+                       WHERE job_id = ?""",
+                    (job.get('title'), job.get('company'), job.get('location'), job.get('url'),
+                     job.get('description'), new_hash, now, job_id)
+                )
+                pending.append(job)
+
+            self._conn.commit()
+
+        return pending
+
+    def save_scores(self, jobs: List[Dict]):
+        """
+        Persist priority and reasoning for jobs the LLM scored. Failed and unscored jobs
+        are skipped, and so are the pre-filter's local verdicts, which depend on pre-filter
+        settings and on the rest of the run rather than on the scoring fingerprint.
+        """
+        now = time.time()
+        rows = [
+            (job['priority'], job.get('reasoning'), now, self.scoring_fingerprint, job['job_id'])
+            for job in jobs
+            if job.get('job_id') and job.get('priority')
+            and not job.get('scoring_failed') and not job.get('unscored') and not job.get('prefiltered')
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE jobs SET priority = ?, reasoning = ?, scored_at = ?, scoring_fingerprint = ? "
+                "WHERE job_id = ?", rows
+            )
+            self._conn.commit()
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -1,8 +1,54 @@
 import requests
 from bs4 import BeautifulSoup
-import time
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Iterator
+import hashlib
 import json
+import queue
+import re
+import threading
+from rate_limiter import RateLimiter
+from http_cache import CONDITIONAL_HEADERS, HTTPCache, create_session
+from job_card_parser import JobCardParser, parse_soup_card
+from description_cache import DescriptionCache
+from seen_index import SeenIndex
+from metrics import RunMetrics
+
+# Status codes LinkedIn uses to tell scrapers to slow down
+THROTTLE_STATUS_CODES = (429, 999)
+
+# LinkedIn serves 25 cards per search page and stops paginating at 1000 results
+JOBS_PER_PAGE = 25
+MAX_PAGES = 40
+
+# Numeric posting ID at the end of /jobs/view/<slug>-<id> or in ?currentJobId=<id>
+JOB_ID_PATTERN = re.compile(r'(?:/jobs/view/(?:[^/?#]*-)?|[?&]currentJobId=)(\d+)')
+
+DETAILS_UNAVAILABLE = "Could not fetch detailed description"
+
+
+def extract_job_id(url: str) -> str:
+    """
+    Return the LinkedIn job ID for a job URL.
+    URLs without a recognizable ID fall back to a hash of the URL.
+    """
+    match = JOB_ID_PATTERN.search(url or '')
+    if match:
+        return match.group(1)
+    return 'url-' + hashlib.sha1((url or '').encode('utf-8')).hexdigest()[:16]
+
+
+def canonicalize_job_url(url: str) -> str:
+    """
+    Strip slugs and tracking parameters, so every variant of a posting's URL
+    becomes https://www.linkedin.com/jobs/view/<job id>/.
+    URLs without a job ID are returned unchanged.
+    """
+    match = JOB_ID_PATTERN.search(url or '')
+    if not match:
+        return url
+    return f"https://www.linkedin.com/jobs/view/{match.group(1)}/"
+
 
 class LinkedInJobFetcher:
     """
@@ -10,107 +56,241 @@ class LinkedInJobFetcher:
     Note: This uses the public API approach. For production, consider using official LinkedIn API.
     """
 
-    def __init__(self, keywords: List[str], location: str, limit: int = 50):
+    def __init__(self, keywords: List[str], location: str, limit: int = 50,
+                 max_workers: int = 1, rate_limiter: Optional[RateLimiter] = None,
+                 max_retries: int = 3, session: Optional[requests.Session] = None,
+                 http_cache: Optional[HTTPCache] = None, parser_backend: str = 'auto',
+                 description_cache: Optional[DescriptionCache] = None, detail_workers: int = 4,
+                 seen_index: Optional[SeenIndex] = None, metrics: Optional[RunMetrics] = None):
         self.keywords = keywords
         self.location = location
         self.limit = limit
         self.base_url = "https://www.linkedin.com/jobs/search"
+        self.max_workers = max(1, max_workers)
+        # Defaults to one request every 2 seconds, like the old fixed sleep
+        self.rate_limiter = rate_limiter or RateLimiter(rate_per_second=0.5)
+        self.max_retries = max_retries
+        # One pooled keep-alive session shared by all workers
+        self.session = session or create_session(pool_size=self.max_workers)
+        self.http_cache = http_cache
+        self.card_parser = JobCardParser(parser_backend)
+        self.description_cache = description_cache
+        self.detail_workers = max(1, detail_workers)
+        # Jobs processed in earlier runs are skipped before enrichment and scoring
+        self.seen_index = seen_index
+        self.seen_skipped = 0
+        self.metrics = metrics or RunMetrics()
+        # Unique job URLs collected so far across all keyword workers
+        self._collected_urls = set()
+        self._collected_lock = threading.Lock()
 
     def fetch_jobs(self) -> List[Dict]:
         """
         Fetch jobs from LinkedIn public job search.
+        Keywords are fetched concurrently by up to `max_workers` threads,
+        paced by the shared rate limiter.
         Returns a list of job dictionaries with details.
         """
         all_jobs = []
+        keywords = [keyword.strip() for keyword in self.keywords]
+        self._collected_urls = set()
 
-        for keyword in self.keywords:
-            print(f"Fetching jobs for keyword: {keyword.strip()}")
-            jobs = self._fetch_jobs_for_keyword(keyword.strip())
-            all_jobs.extend(jobs)
-            time.sleep(2)  # Rate limiting
+        # executor.map keeps results in keyword order
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for jobs in executor.map(self._fetch_keyword_logged, keywords):
+                all_jobs.extend(jobs)
 
         # Remove duplicates based on job URL
         unique_jobs = self._remove_duplicates(all_jobs)
         return unique_jobs[:self.limit]
 
+    def iter_pages(self, queue_size: int = 4) -> Iterator[List[Dict]]:
+        """
+        Yield pages of new jobs as soon as any keyword worker fetches them, so later
+        stages can start before every keyword is done. Pages from different keywords
+        interleave; each URL is yielded once and at most `limit` jobs in total.
+        Workers block once `queue_size` pages are waiting to be consumed.
+        """
+        keywords = [keyword.strip() for keyword in self.keywords]
+        self._collected_urls = set()
+        pages = queue.Queue(maxsize=max(1, queue_size))
+        done = object()
+        stopped = threading.Event()
+
+        def worker(keyword: str):
+            try:
+                print(f"Fetching jobs for keyword: {keyword}")
+                for page in self._iter_job_pages(keyword):
+                    if stopped.is_set():
+                        break
+                    pages.put(page)
+            except Exception as e:
+                print(f"Error fetching jobs for keyword '{keyword}': {e}")
+            finally:
+                pages.put(done)
+
+        yielded_urls = set()
+        remaining = len(keywords)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for keyword in keywords:
+                executor.submit(worker, keyword)
+            try:
+                while remaining:
+                    page = pages.get()
+                    if page is done:
+                        remaining -= 1
+                        continue
+                    new_jobs = []
+                    for job in page:
+                        if job['url'] not in yielded_urls and len(yielded_urls) < self.limit:
+                            yielded_urls.add(job['url'])
+                            new_jobs.append(job)
+                    if new_jobs:
+                        yield new_jobs
+            finally:
+                # If the consumer stopped early, unblock the workers so they can finish
+                stopped.set()
+                while remaining:
+                    if pages.get() is done:
+                        remaining -= 1
+
+    def _fetch_keyword_logged(self, keyword: str) -> List[Dict]:
+        print(f"Fetching jobs for keyword: {keyword}")
+        return self._fetch_jobs_for_keyword(keyword)
+
+    def _get(self, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None,
+             use_cache: bool = True) -> requests.Response:
+        """
+        GET a URL through the HTTP cache and the shared rate limiter.
+        Fresh cache hits skip the network entirely; stale entries are revalidated.
+        Throttling responses (429/999) slow the limiter down and are retried.
+        """
+        request_headers = dict(headers or {})
+        kind = 'search' if url == self.base_url else 'detail'
+        http_cache = self.http_cache if use_cache else None
+        if http_cache:
+            cached = http_cache.get_fresh(url, params)
+            if cached is not None:
+                self.metrics.inc('http_cache_hits_total', kind=kind)
+                return cached
+            request_headers.update(http_cache.conditional_headers(url, params))
+
+        response = None
+        for attempt in range(self.max_retries + 1):
+            with self.metrics.timer('http_rate_limit_wait_seconds', kind=kind):
+                self.rate_limiter.acquire(url)
+            with self.metrics.timer('http_request_seconds', kind=kind):
+                response = self.session.get(url, params=params, headers=request_headers, timeout=10)
+            self.metrics.inc('http_responses_total', kind=kind, status=response.status_code)
+
+            if response.status_code not in THROTTLE_STATUS_CODES:
+                self.rate_limiter.reward(url)
+                if http_cache:
+                    response = http_cache.update(url, params, response)
+                    if response.status_code == 304 and CONDITIONAL_HEADERS & set(request_headers):
+                        # Not modified, but the cached copy was removed meanwhile: fetch it in full
+                        return self._get(url, params, headers, use_cache)
+                return response
+
+            retry_after = response.headers.get('Retry-After')
+            self.rate_limiter.penalize(url, float(retry_after) if retry_after and retry_after.isdigit() else None)
+
+        raise requests.HTTPError(f"{response.status_code} Throttled by server for url: {response.url}", response=response)
+
     def _fetch_jobs_for_keyword(self, keyword: str) -> List[Dict]:
-        """Fetch jobs for a specific keyword."""
+        """Fetch jobs for a specific keyword, page by page, until the global limit is met."""
         jobs = []
+        for page in self._iter_job_pages(keyword):
+            jobs.extend(page)
+        return jobs
 
-        params = {
-            'keywords': keyword,
-            'location': self.location,
-            'f_TPR': 'r86400',  # Posted in last 24 hours (past day)
-            'f_AL': 'true',  # Easy Apply filter (optional)
-            'position': 1,
-            'pageNum': 0,
-            'sortBy': 'DD'  # Sort by date (most recent first)
-        }
-
+    def _iter_job_pages(self, keyword: str) -> Iterator[List[Dict]]:
+        """
+        Yield the new jobs found on each search results page for a keyword.
+        Stops when the global job limit is met, a page has nothing new,
+        or LinkedIn runs out of results.
+        """
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        seen_urls = set()
 
-        try:
-            response = requests.get(self.base_url, params=params, headers=headers, timeout=10)
-            response.raise_for_status()
+        for page_num in range(MAX_PAGES):
+            if self._limit_reached():
+                return
+
+            params = {
+                'keywords': keyword,
+                'location': self.location,
+                'f_TPR': 'r86400',  # Posted in last 24 hours (past day)
+                'f_AL': 'true',  # Easy Apply filter (optional)
+                'position': 1,
+                'pageNum': page_num,
+                'start': page_num * JOBS_PER_PAGE,
+                'sortBy': 'DD'  # Sort by date (most recent first)
+            }
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            try:
+                response = self._get(self.base_url, params=params, headers=headers)
+                response.raise_for_status()
+            except Exception as e:
+                print(f"Error fetching jobs for keyword '{keyword}' (page {page_num}): {e}")
+                return
 
-            # Find job cards
-            job_cards = soup.find_all('div', class_='base-card')
+            with self.metrics.timer('parse_seconds'):
+                parsed_jobs, card_count = self.card_parser.parse(response.content)
 
-            for card in job_cards[:25]:  # Limit per keyword
-                try:
-                    job = self._parse_job_card(card)
-                    if job:
-                        jobs.append(job)
-                except Exception as e:
-                    print(f"Error parsing job card: {e}")
+            page_jobs = []
+            already_processed = 0
+            for job in parsed_jobs:
+                if not job:
+                    continue
+                job['job_id'] = extract_job_id(job['url'])
+                job['url'] = canonicalize_job_url(job['url'])
+                if job['url'] in seen_urls:
+                    continue
+                seen_urls.add(job['url'])
+                if self.seen_index is not None and job['job_id'] in self.seen_index:
+                    already_processed += 1
                     continue
+                page_jobs.append(job)
 
-        except Exception as e:
-            print(f"Error fetching jobs for keyword '{keyword}': {e}")
+            if already_processed:
+                with self._collected_lock:
+                    self.seen_skipped += already_processed
+                self.metrics.inc('jobs_seen_skipped_total', already_processed)
 
-        return jobs
+            # Results are newest first, so a page with nothing new means we're done
+            if not page_jobs:
+                return
+
+            self._record_collected(page_jobs)
+            self.metrics.inc('search_pages_total')
+            self.metrics.inc('jobs_fetched_total', len(page_jobs))
+            yield page_jobs
+
+            # A short page means there are no more results
+            if card_count < JOBS_PER_PAGE:
+                return
+
+    def _record_collected(self, jobs: List[Dict]):
+        with self._collected_lock:
+            self._collected_urls.update(job['url'] for job in jobs)
+
+    def _limit_reached(self) -> bool:
+        with self._collected_lock:
+            return len(self._collected_urls) >= self.limit
 
     def _parse_job_card(self, card) -> Dict:
-        """Parse a job card to extract job details."""
+        """Parse a BeautifulSoup job card to extract job details."""
         try:
-            # Extract job title
-            title_elem = card.find('h3', class_='base-search-card__title')
-            title = title_elem.text.strip() if title_elem else 'N/A'
-
-            # Extract company name
-            company_elem = card.find('h4', class_='base-search-card__subtitle')
-            company = company_elem.text.strip() if company_elem else 'N/A'
-
-            # Extract location
-            location_elem = card.find('span', class_='job-search-card__location')
-            location = location_elem.text.strip() if location_elem else 'N/A'
-
-            # Extract job URL
-            link_elem = card.find('a', class_='base-card__full-link')
-            url = link_elem['href'] if link_elem and 'href' in link_elem.attrs else 'N/A'
-
-            # Extract job description (if available)
-            description_elem = card.find('p', class_='base-search-card__snippet')
-            description = description_elem.text.strip() if description_elem else 'No description available'
-
-            return {
-                'title': title,
-                'company': company,
-                'location': location,
-                'url': url,
-                'description': description,
-                'priority': None  # Will be set by LLM
-            }
+            return parse_soup_card(card)
         except Exception as e:
             print(f"Error parsing job card details: {e}")
             return None
 
     def _remove_duplicates(self, jobs: List[Dict]) -> List[Dict]:
-        """Remove duplicate jobs based on URL."""
+        """Remove duplicate jobs based on their canonical URL."""
         seen_urls = set()
         unique_jobs = []
 
@@ -121,17 +301,57 @@ class LinkedInJobFetcher:
 
         return unique_jobs
 
+    def enrich_jobs(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Replace each job's search snippet with its full description.
+        Descriptions come from the description cache when possible; the rest are
+        fetched concurrently by up to `detail_workers` threads through the shared rate limiter.
+        """
+        jobs_by_id = {}
+        for job in jobs:
+            if job.get('url') and job['url'] != 'N/A':
+                jobs_by_id.setdefault(extract_job_id(job['url']), []).append(job)
+
+        cached = self.description_cache.get_many(jobs_by_id) if self.description_cache else {}
+        to_fetch = [job_id for job_id in jobs_by_id if job_id not in cached]
+        print(f"Enriching {len(jobs_by_id)} jobs: {len(cached)} cached, {len(to_fetch)} to fetch")
+        self.metrics.inc('description_cache_hits_total', len(cached))
+        self.metrics.inc('description_cache_misses_total', len(to_fetch))
+
+        def fetch(job_id: str) -> Optional[str]:
+            description = self._fetch_job_description(jobs_by_id[job_id][0]['url'])
+            if description and self.description_cache:
+                self.description_cache.put(job_id, description)
+            return description
+
+        descriptions = dict(cached)
+        with ThreadPoolExecutor(max_workers=self.detail_workers) as executor:
+            for job_id, description in zip(to_fetch, executor.map(fetch, to_fetch)):
+                if description:
+                    descriptions[job_id] = description
+
+        for job_id, description in descriptions.items():
+            for job in jobs_by_id[job_id]:
+                job['description'] = description
+
+        return jobs
+
     def fetch_job_details(self, job_url: str) -> str:
         """
         Fetch detailed job description from job URL.
         This requires more detailed scraping and may need authentication.
         """
+        return self._fetch_job_description(job_url) or DETAILS_UNAVAILABLE
+
+    def _fetch_job_description(self, job_url: str) -> Optional[str]:
+        """Fetch the full description from a job page, or None if it can't be found."""
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
 
         try:
-            response = requests.get(job_url, headers=headers, timeout=10)
+            # The description cache already keeps what matters from detail pages
+            response = self._get(job_url, headers=headers, use_cache=self.description_cache is None)
             response.raise_for_status()
 
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -141,11 +361,11 @@ class LinkedInJobFetcher:
             if description_elem:
                 return description_elem.get_text(strip=True)
 
-            return "Could not fetch detailed description"
+            return None
 
         except Exception as e:
             print(f"Error fetching job details: {e}")
-            return "Could not fetch detailed description"
+            return None
 
 
 def mock_fetch_jobs(keywords: List[str], location: str, limit: int = 50) -> List[Dict]:
@@ -0,0 +1,204 @@
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+# USD per million tokens: input, output, cache write (5-minute TTL), cache read.
+# Keys are model name prefixes; the longest matching prefix wins.
+MODEL_PRICING = {
+    'claude-opus-4-5': (5.0, 25.0, 6.25, 0.50),
+    'claude-opus-4': (15.0, 75.0, 18.75, 1.50),
+    'claude-sonnet-4': (3.0, 15.0, 3.75, 0.30),
+    'claude-3-7-sonnet': (3.0, 15.0, 3.75, 0.30),
+    'claude-haiku-4-5': (1.0, 5.0, 1.25, 0.10),
+    'claude-3-5-haiku': (0.80, 4.0, 1.0, 0.08),
+}
+
+# Pricing used for models missing from MODEL_PRICING
+DEFAULT_PRICING = MODEL_PRICING['claude-sonnet-4']
+
+# Message Batches requests are billed at half price
+MESSAGE_BATCH_DISCOUNT = 0.5
+
+# Usage fields of an API response, in MODEL_PRICING order
+USAGE_FIELDS = ('input_tokens', 'output_tokens', 'cache_creation_input_tokens', 'cache_read_input_tokens')
+
+# Rough characters per token, for estimating a request before it is sent
+CHARS_PER_TOKEN = 4
+
+# Shortest prompt prefix the API will cache, by model name prefix. A shorter prefix
+# marked with cache_control is silently sent uncached.
+MIN_CACHEABLE_TOKENS = {
+    'claude-opus-4-5': 4096,
+    'claude-haiku-4-5': 4096,
+    'claude-3-5-haiku': 2048,
+    'claude-3-haiku': 2048,
+}
+
+# Minimum for models missing from MIN_CACHEABLE_TOKENS (Sonnet and older Opus)
+DEFAULT_MIN_CACHEABLE_TOKENS = 1024
+
+_warned_models = set()
+
+
+def model_pricing(model: str) -> tuple:
+    matches = [prefix for prefix in MODEL_PRICING if model.startswith(prefix)]
+    if not matches:
+        if model not in _warned_models:
+            _warned_models.add(model)
+            print(f"⚠ No pricing known for model '{model}'. Estimating cost with Sonnet prices...")
+        return DEFAULT_PRICING
+    return MODEL_PRICING[max(matches, key=len)]
+
+
+def estimate_cost(model: str, usage: Dict[str, int], batch: bool = False) -> float:
+    """Estimated USD cost of a call's token usage (a dict keyed by USAGE_FIELDS)."""
+    cost = sum(usage.get(field, 0) * price for field, price in zip(USAGE_FIELDS, model_pricing(model))) / 1_000_000
+    return cost * MESSAGE_BATCH_DISCOUNT if batch else cost
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def min_cacheable_tokens(model: str) -> int:
+    matches = [prefix for prefix in MIN_CACHEABLE_TOKENS if model.startswith(prefix)]
+    return MIN_CACHEABLE_TOKENS[max(matches, key=len)] if matches else DEFAULT_MIN_CACHEABLE_TOKENS
+
+
+class UsageLedger:
+    """
+    SQLite log of every LLM call's token usage and estimated cost, kept across runs.
+    Each process is one run; totals can be read for the current run or any period.
+    """
+
+    def __init__(self, path: str, run_id: Optional[str] = None):
+        self.path = path
+        self.run_id = run_id or f"{datetime.now().strftime('%Y%m%dT%H%M%S')}-{os.getpid()}"
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS llm_calls (
+                created_at REAL NOT NULL,
+                run_id TEXT NOT NULL,
+                model TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                jobs INTEGER NOT NULL,
+                input_tokens INTEGER NOT NULL,
+                output_tokens INTEGER NOT NULL,
+                cache_creation_input_tokens INTEGER NOT NULL,
+                cache_read_input_tokens INTEGER NOT NULL,
+                cost_usd REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_calls_created_at ON llm_calls (created_at)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_calls_run_id ON llm_calls (run_id)")
+        self._conn.commit()
+
+    def record(self, model: str, usage: Dict[str, int], cost_usd: float, kind: str = 'message', jobs: int = 1):
+        """
+        Log one call. `kind` is 'message', 'batch' (several jobs per prompt),
+        'profiles' (one job for several profiles) or 'message_batch'.
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO llm_calls VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (time.time(), self.run_id, model, kind, jobs,
+                 *(usage.get(field, 0) for field in USAGE_FIELDS), cost_usd)
+            )
+            self._conn.commit()
+
+    def totals(self, since: Optional[float] = None, run_id: Optional[str] = None) -> Dict:
+        """Calls, jobs, tokens by type and cost, optionally since a timestamp or for one run."""
+        conditions, params = [], []
+        if since is not None:
+            conditions.append("created_at >= ?")
+            params.append(since)
+        if run_id is not None:
+            conditions.append("run_id = ?")
+            params.append(run_id)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+        columns = ', '.join(f"COALESCE(SUM({field}), 0)" for field in USAGE_FIELDS)
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT COUNT(*), COALESCE(SUM(jobs), 0), {columns}, COALESCE(SUM(cost_usd), 0) "
+                f"FROM llm_calls {where}", params
+            ).fetchone()
+        totals = {'calls': row[0], 'jobs': row[1], 'cost_usd': row[-1]}
+        totals.update(zip(USAGE_FIELDS, row[2:-1]))
+        return totals
+
+    def run_totals(self) -> Dict:
+        return self.totals(run_id=self.run_id)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class ScoringBudget:
+    """
+    Per-run cap on LLM tokens and/or estimated USD cost, shared by concurrent scoring calls.
+
+    Each call reserves its estimated tokens and cost before it is sent and settles to
+    the actual usage when it returns, so concurrent calls can't all slip under the cap
+    at once. A call that doesn't fit waits for the calls in flight to settle, since
+    they usually cost less than estimated. Once nothing is in flight and it still
+    doesn't fit, the budget is exhausted and every later call is refused.
+    """
+
+    def __init__(self, max_tokens: Optional[int] = None, max_cost_usd: Optional[float] = None):
+        self.max_tokens = max_tokens
+        self.max_cost_usd = max_cost_usd
+        self.used_tokens = 0
+        self.used_cost_usd = 0.0
+        self.exhausted = False
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    def _fits(self, tokens: int, cost_usd: float) -> bool:
+        return ((self.max_tokens is None or self.used_tokens + tokens <= self.max_tokens) and
+                (self.max_cost_usd is None or self.used_cost_usd + cost_usd <= self.max_cost_usd))
+
+    def reserve(self, tokens: int, cost_usd: float) -> bool:
+        with self._condition:
+            while not self.exhausted:
+                if self._fits(tokens, cost_usd):
+                    self.used_tokens += tokens
+                    self.used_cost_usd += cost_usd
+                    self._in_flight += 1
+                    return True
+                if not self._in_flight:
+                    self.exhausted = True
+                    self._condition.notify_all()
+                    break
+                self._condition.wait()
+            return False
+
+    def settle(self, reserved_tokens: int, reserved_cost_usd: float, tokens: int, cost_usd: float):
+        """Replace a reservation with the call's actual usage."""
+        with self._condition:
+            self.used_tokens += tokens - reserved_tokens
+            self.used_cost_usd += cost_usd - reserved_cost_usd
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def release(self, reserved_tokens: int, reserved_cost_usd: float):
+        """Give back a reservation whose call failed without being billed."""
+        self.settle(reserved_tokens, reserved_cost_usd, 0, 0.0)
+
+    def describe(self) -> str:
+        limits = []
+        if self.max_tokens is not None:
+            limits.append(f"{self.used_tokens}/{self.max_tokens} tokens")
+        if self.max_cost_usd is not None:
+            limits.append(f"${self.used_cost_usd:.4f}/${self.max_cost_usd:.2f}")
+        return ', '.join(limits)
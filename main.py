@@ -2,7 +2,9 @@ import schedule
 import time
 import sys
 import os
+import tracemalloc
 from datetime import datetime
+from typing import Dict, List
 
 # Fix Windows console encoding issue
 if sys.platform == 'win32':
@@ -12,8 +14,292 @@ if sys.platform == 'win32':
 
 from config import Config
 from linkedin_fetcher import LinkedInJobFetcher, mock_fetch_jobs
-from job_scorer import JobScorer, mock_score_jobs
+from rate_limiter import RateLimiter
+from http_cache import HTTPCache, create_session
+from description_cache import DescriptionCache
+from job_store import JobStore
+from score_cache import create_score_cache
+from prefilter import SkillPrefilter
+from dedup import NearDuplicateDetector
+from seen_index import SeenIndex
+from job_scorer import JobScorer, MultiProfileScorer, mock_score_jobs
+from llm_usage import ScoringBudget, UsageLedger
 from html_generator import HTMLGenerator
+from fragment_cache import FragmentCache
+from pipeline import JobPipeline
+from metrics import RunMetrics
+from synthetic_jobs import SyntheticJobGenerator
+from profiles import load_profiles, profile_path
+
+def create_fetcher(seen_index=None, metrics=None) -> LinkedInJobFetcher:
+    """Build the LinkedIn fetcher with rate limiting, caching and pooling from config."""
+    return LinkedInJobFetcher(
+        keywords=Config.JOB_KEYWORDS,
+        location=Config.JOB_LOCATION,
+        limit=Config.JOB_LIMIT,
+        max_workers=Config.FETCH_WORKERS,
+        rate_limiter=RateLimiter(
+            rate_per_second=Config.FETCH_RATE_PER_SECOND,
+            burst=Config.FETCH_BURST,
+            max_rate_per_second=Config.FETCH_MAX_RATE_PER_SECOND
+        ),
+        session=create_session(pool_size=Config.HTTP_POOL_SIZE),
+        http_cache=HTTPCache(
+            cache_dir=Config.HTTP_CACHE_DIR,
+            ttl_seconds=Config.HTTP_CACHE_TTL_HOURS * 3600,
+            max_age_seconds=Config.HTTP_CACHE_MAX_AGE_HOURS * 3600
+        ) if Config.HTTP_CACHE_ENABLED else None,
+        parser_backend=Config.PARSER_BACKEND,
+        description_cache=DescriptionCache(Config.DESCRIPTION_CACHE_PATH),
+        detail_workers=Config.DETAIL_WORKERS,
+        seen_index=seen_index,
+        metrics=metrics
+    )
+
+
+def create_usage_tracking():
+    """Return the configured usage ledger and scoring budget (either may be None)."""
+    usage_ledger = UsageLedger(Config.USAGE_LEDGER_PATH) if Config.USAGE_LEDGER_ENABLED else None
+    budget = ScoringBudget(
+        max_tokens=Config.SCORING_BUDGET_TOKENS or None,
+        max_cost_usd=Config.SCORING_BUDGET_USD or None
+    ) if Config.SCORING_BUDGET_TOKENS or Config.SCORING_BUDGET_USD else None
+    return usage_ledger, budget
+
+
+def create_scorer(scorer_class, metrics: RunMetrics, usage_ledger, budget, **profile) -> JobScorer:
+    """Build a JobScorer (or subclass) from config; `profile` holds the class's profile arguments."""
+    return scorer_class(
+        api_key=Config.ANTHROPIC_API_KEY,
+        model=Config.SCORING_MODEL,
+        base_url=Config.ANTHROPIC_BASE_URL,
+        max_concurrency=Config.SCORING_CONCURRENCY,
+        max_retries=Config.SCORING_MAX_RETRIES,
+        score_cache=create_score_cache(
+            Config.SCORE_CACHE_BACKEND,
+            path=Config.SCORE_CACHE_PATH,
+            max_entries=Config.SCORE_CACHE_MAX_ENTRIES
+        ),
+        metrics=metrics,
+        usage_ledger=usage_ledger,
+        budget=budget,
+        response_mode=Config.SCORING_RESPONSE_MODE,
+        max_output_tokens=Config.SCORING_MAX_OUTPUT_TOKENS,
+        max_reasoning_sentences=Config.SCORING_REASONING_SENTENCES,
+        **profile
+    )
+
+
+def create_prefilter(user_skills: str, budget) -> SkillPrefilter:
+    """Return the configured pre-filter for a profile's skills, or None."""
+    prefilter = SkillPrefilter(
+        user_skills,
+        min_score=Config.PREFILTER_MIN_SCORE,
+        top_k=Config.PREFILTER_TOP_K or None
+    ) if Config.PREFILTER_ENABLED else None
+    if budget is not None and prefilter is None:
+        # Only ranks jobs by skill match, so the budget goes to the best matches first
+        prefilter = SkillPrefilter(user_skills, min_score=0.0)
+    return prefilter
+
+
+def finish_scoring_run(metrics: RunMetrics, scorer: JobScorer, usage_ledger, budget, prefilters, job_stores):
+    """Close the stores and record usage, budget, pre-filter and score-cache stats."""
+    for job_store in job_stores:
+        job_store.close()
+    if usage_ledger is not None:
+        run, month = usage_ledger.run_totals(), usage_ledger.totals(since=time.time() - 30 * 86400)
+        print(f"LLM cost: ${run['cost_usd']:.4f} this run ({run['calls']} calls), "
+              f"${month['cost_usd']:.2f} over the last 30 days")
+        usage_ledger.close()
+    if budget is not None:
+        metrics.set('scoring_budget_used_tokens', budget.used_tokens)
+        metrics.set('scoring_budget_used_usd', budget.used_cost_usd)
+        metrics.set('scoring_budget_exhausted', 1 if budget.exhausted else 0)
+    for prefilter in prefilters:
+        metrics.inc('prefilter_skipped_total', prefilter.skipped_count)
+    if scorer.score_cache:
+        stats = scorer.score_cache.stats()
+        print(f"Score cache: {stats['hits']} hits, {stats['misses']} misses")
+        metrics.inc('score_cache_hits_total', stats['hits'])
+        metrics.inc('score_cache_misses_total', stats['misses'])
+
+
+def create_job_scoring(metrics: RunMetrics):
+    """
+    Return (score_jobs, finish): score_jobs scores a list of jobs in place and can be
+    called once for everything or once per page; finish records stats and closes stores.
+    """
+    if not (Config.ANTHROPIC_API_KEY and Config.ANTHROPIC_API_KEY != 'your_api_key_here'):
+        print("⚠ No API key found. Using mock scoring...")
+        return (lambda jobs: mock_score_jobs(jobs, Config.YOUR_PROFILE)), (lambda: None)
+
+    usage_ledger, budget = create_usage_tracking()
+    scorer = create_scorer(
+        JobScorer, metrics, usage_ledger, budget,
+        user_profile=Config.YOUR_PROFILE,
+        user_skills=Config.YOUR_SKILLS,
+        user_experience=Config.YOUR_EXPERIENCE_YEARS
+    )
+    prefilter = create_prefilter(Config.YOUR_SKILLS, budget)
+    # Only new or changed postings go to the LLM; the rest reuse stored scores
+    job_store = JobStore(
+        Config.JOB_STORE_PATH,
+        scoring_fingerprint=scorer.scoring_fingerprint()
+    ) if Config.JOB_STORE_ENABLED else None
+
+    def score(jobs_to_score):
+        # Obvious mismatches are marked LOW locally and never reach the LLM
+        if prefilter:
+            jobs_to_score = prefilter.filter(jobs_to_score)
+        if Config.USE_MESSAGE_BATCHES:
+            return scorer.bulk_score_jobs(
+                jobs_to_score,
+                state_path=Config.MESSAGE_BATCH_STATE_PATH,
+                poll_interval=Config.MESSAGE_BATCH_POLL_SECONDS,
+                max_wait_seconds=Config.MESSAGE_BATCH_MAX_WAIT_MINUTES * 60
+            )
+        return scorer.batch_score_jobs(jobs_to_score, batch_size=Config.SCORING_BATCH_SIZE)
+
+    def score_jobs(jobs):
+        pending_jobs = jobs
+        if job_store is not None:
+            pending_jobs = job_store.upsert_jobs(jobs)
+            print(f"{len(pending_jobs)} new or changed jobs to score, "
+                  f"{len(jobs) - len(pending_jobs)} reused from previous runs")
+            metrics.inc('jobs_reused_total', len(jobs) - len(pending_jobs))
+        score(pending_jobs)
+        if job_store is not None:
+            job_store.save_scores(pending_jobs)
+        for job in pending_jobs:
+            if 'scoring_latency_ms' in job:
+                metrics.observe('job_scoring_seconds', job['scoring_latency_ms'] / 1000)
+
+    def finish():
+        finish_scoring_run(metrics, scorer, usage_ledger, budget,
+                           [prefilter] if prefilter else [], [job_store] if job_store else [])
+
+    return score_jobs, finish
+
+
+def create_profile_scoring(metrics: RunMetrics, profiles: List[Dict]):
+    """
+    Multi-profile counterpart of create_job_scoring. Returns (score_jobs, finish,
+    jobs_by_profile): score_jobs gives every profile its own copy of each job, scores
+    the copies and appends them to jobs_by_profile[name] in arrival order.
+    """
+    jobs_by_profile = {profile['name']: [] for profile in profiles}
+
+    def copy_jobs(jobs):
+        copies = {}
+        for profile in profiles:
+            copies[profile['name']] = [dict(job) for job in jobs]
+            jobs_by_profile[profile['name']].extend(copies[profile['name']])
+        return copies
+
+    if not (Config.ANTHROPIC_API_KEY and Config.ANTHROPIC_API_KEY != 'your_api_key_here'):
+        print("⚠ No API key found. Using mock scoring...")
+
+        def mock_score(jobs):
+            for profile, copies in zip(profiles, copy_jobs(jobs).values()):
+                mock_score_jobs(copies, profile['user_profile'])
+
+        return mock_score, (lambda: None), jobs_by_profile
+
+    if Config.USE_MESSAGE_BATCHES or Config.SCORING_BATCH_SIZE > 1:
+        print("⚠ SCORING_BATCH_SIZE and USE_MESSAGE_BATCHES don't apply to multiple profiles. "
+              "Scoring each job once for all profiles...")
+
+    usage_ledger, budget = create_usage_tracking()
+    scorer = create_scorer(MultiProfileScorer, metrics, usage_ledger, budget, profiles=profiles)
+    prefilters = {profile['name']: create_prefilter(profile['user_skills'], budget) for profile in profiles}
+    # Stored scores belong to one profile, so each profile has its own store
+    job_stores = {
+        profile['name']: JobStore(
+            profile_path(Config.JOB_STORE_PATH, profile['name']),
+            scoring_fingerprint=scorer.profile_fingerprint(profile['name'])
+        )
+        for profile in profiles
+    } if Config.JOB_STORE_ENABLED else {}
+
+    def score_jobs(jobs):
+        pending_by_profile, to_score = {}, {}
+        for name, copies in copy_jobs(jobs).items():
+            pending_jobs = copies
+            if name in job_stores:
+                pending_jobs = job_stores[name].upsert_jobs(copies)
+                print(f"{name}: {len(pending_jobs)} new or changed jobs to score, "
+                      f"{len(copies) - len(pending_jobs)} reused from previous runs")
+                metrics.inc('jobs_reused_total', len(copies) - len(pending_jobs))
+            pending_by_profile[name] = pending_jobs
+            to_score[name] = prefilters[name].filter(pending_jobs) if prefilters[name] else pending_jobs
+        scorer.score_profiles(to_score)
+        for name, pending_jobs in pending_by_profile.items():
+            if name in job_stores:
+                job_stores[name].save_scores(pending_jobs)
+            for job in pending_jobs:
+                if 'scoring_latency_ms' in job:
+                    metrics.observe('job_scoring_seconds', job['scoring_latency_ms'] / 1000)
+
+    def finish():
+        finish_scoring_run(metrics, scorer, usage_ledger, budget,
+                           [prefilter for prefilter in prefilters.values() if prefilter], job_stores.values())
+
+    return score_jobs, finish, jobs_by_profile
+
+
+def create_html_generator(output_path: str, fragment_cache=None) -> HTMLGenerator:
+    """Return an HTMLGenerator for `output_path` configured from Config."""
+    return HTMLGenerator(
+        output_path,
+        mode=Config.HTML_OUTPUT_MODE,
+        chunk_size=Config.HTML_CHUNK_SIZE,
+        page_size=Config.HTML_PAGE_SIZE,
+        fragment_cache=fragment_cache,
+        split_assets=Config.HTML_SPLIT_ASSETS,
+        precompress=Config.HTML_PRECOMPRESS
+    )
+
+
+def print_fetch_stats(fetcher: LinkedInJobFetcher):
+    if fetcher.seen_index is not None:
+        print(f"Skipped {fetcher.seen_skipped} jobs already processed in earlier runs")
+    if fetcher.http_cache:
+        stats = fetcher.http_cache.stats()
+        print(f"HTTP cache: {stats['hits']} hits, {stats['revalidated']} revalidated, {stats['misses']} misses, "
+              f"{stats['pruned']} expired entries pruned")
+        fetcher.metrics.inc('http_cache_revalidated_total', stats['revalidated'])
+        fetcher.metrics.inc('http_cache_pruned_total', stats['pruned'])
+
+
+def write_run_report(metrics: RunMetrics):
+    """Export the run's metrics as a JSON report and a Prometheus textfile."""
+    if Config.METRICS_JSON_PATH:
+        metrics.write_json(Config.METRICS_JSON_PATH)
+        print(f"Run report written to {Config.METRICS_JSON_PATH}")
+    if Config.METRICS_PROMETHEUS_PATH:
+        metrics.write_prometheus(Config.METRICS_PROMETHEUS_PATH)
+        print(f"Prometheus metrics written to {Config.METRICS_PROMETHEUS_PATH}")
+
+
+def pipeline_supported() -> bool:
+    """
+    Whether scoring may run page by page. Message Batches submit one batch per run,
+    and PREFILTER_TOP_K and a scoring budget must rank the whole run's jobs, so they
+    need every page first.
+    """
+    budget = Config.SCORING_BUDGET_TOKENS or Config.SCORING_BUDGET_USD
+    return not Config.USE_MESSAGE_BATCHES and not Config.PREFILTER_TOP_K and not budget
+
+
+def fetch_mock_jobs():
+    print("⚠ No jobs found from LinkedIn. Using mock data as fallback...")
+    return mock_fetch_jobs(
+        keywords=Config.JOB_KEYWORDS,
+        location=Config.JOB_LOCATION,
+        limit=Config.JOB_LIMIT
+    )
+
 
 def run_job_search():
     """
@@ -23,77 +309,247 @@ def run_job_search():
     print(f"Starting job search at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"{'='*60}\n")
 
+    metrics = RunMetrics()
+    success = False
     try:
-        # Step 1: Fetch jobs from LinkedIn
-        print("Step 1: Fetching jobs from LinkedIn...")
         print(f"Keywords: {Config.JOB_KEYWORDS}")
         print(f"Location: {Config.JOB_LOCATION}")
         print(f"Limit: {Config.JOB_LIMIT}\n")
 
+        seen_index = SeenIndex(
+            Config.SEEN_INDEX_PATH,
+            capacity=Config.SEEN_INDEX_CAPACITY
+        ) if Config.SEEN_INDEX_ENABLED else None
+
+        # Several profiles share one fetch; each gets its own scored copies and page
+        profiles = load_profiles(Config.PROFILES_PATH, Config.OUTPUT_HTML_PATH) if Config.PROFILES_PATH else None
+        if profiles:
+            print(f"Profiles: {', '.join(profile['name'] for profile in profiles)}\n")
+
         # Real LinkedIn fetcher
-        fetcher = LinkedInJobFetcher(
-            keywords=Config.JOB_KEYWORDS,
-            location=Config.JOB_LOCATION,
-            limit=Config.JOB_LIMIT
-        )
-        jobs = fetcher.fetch_jobs()
-
-        # Fallback to mock data if no real jobs found
-        if not jobs:
-            print("⚠ No jobs found from LinkedIn. Using mock data as fallback...")
-            jobs = mock_fetch_jobs(
-                keywords=Config.JOB_KEYWORDS,
-                location=Config.JOB_LOCATION,
-                limit=Config.JOB_LIMIT
+        fetcher = create_fetcher(seen_index, metrics)
+        if profiles:
+            score_jobs, finish_scoring, jobs_by_profile = create_profile_scoring(metrics, profiles)
+        else:
+            score_jobs, finish_scoring = create_job_scoring(metrics)
+        fragment_cache = FragmentCache(Config.FRAGMENT_CACHE_PATH) if Config.FRAGMENT_CACHE_ENABLED else None
+        generator = create_html_generator(Config.OUTPUT_HTML_PATH, fragment_cache)
+
+        if Config.PIPELINE_ENABLED and not pipeline_supported():
+            print("⚠ Pipelining is off for this run: scoring waits until every page is fetched\n")
+        if Config.PIPELINE_ENABLED and pipeline_supported():
+            # Steps 1-2 overlap: each fetched page is enriched and scored while later pages are fetched
+            print("Steps 1-2: Fetching and scoring jobs as a pipeline...")
+            pipeline = JobPipeline(
+                fetcher.iter_pages(queue_size=Config.PIPELINE_QUEUE_SIZE),
+                score=score_jobs,
+                enrich=fetcher.enrich_jobs if Config.ENRICH_DETAILS else None,
+                deduplicator=NearDuplicateDetector(
+                    threshold=Config.NEAR_DUP_THRESHOLD
+                ) if Config.NEAR_DUP_ENABLED else None,
+                # Partial pages would need every profile's copies, so multi-profile runs render at the end
+                render=None if profiles else generator.generate,
+                queue_size=Config.PIPELINE_QUEUE_SIZE,
+                render_interval=Config.PIPELINE_RENDER_INTERVAL_SECONDS if Config.PIPELINE_PROGRESSIVE_RENDER else None
             )
+            scored_jobs = pipeline.run()
+            print_fetch_stats(fetcher)
+            for stage, seconds in pipeline.stage_seconds.items():
+                metrics.inc('stage_seconds_total', seconds, stage=stage)
+            if pipeline.deduplicator:
+                metrics.inc('jobs_deduplicated_total', pipeline.deduplicator.merged_count)
 
-        print(f"✓ Fetched {len(jobs)} jobs\n")
+            # Fallback to mock data if no real jobs found
+            if not scored_jobs:
+                scored_jobs = fetch_mock_jobs()
+                score_jobs(scored_jobs)
+        else:
+            # Step 1: Fetch jobs from LinkedIn
+            print("Step 1: Fetching jobs from LinkedIn...")
+            with metrics.stage('fetch'):
+                jobs = fetcher.fetch_jobs()
+            if jobs and Config.ENRICH_DETAILS:
+                with metrics.stage('enrich'):
+                    fetcher.enrich_jobs(jobs)
+            print_fetch_stats(fetcher)
 
-        if not jobs:
-            print("No jobs found. Exiting...")
-            return
+            # Fallback to mock data if no real jobs found
+            if not jobs:
+                jobs = fetch_mock_jobs()
 
-        # Step 2: Score jobs using LLM
-        print("Step 2: Scoring jobs with LLM...")
+            if Config.NEAR_DUP_ENABLED:
+                fetched_count = len(jobs)
+                jobs = NearDuplicateDetector(threshold=Config.NEAR_DUP_THRESHOLD).deduplicate(jobs)
+                metrics.inc('jobs_deduplicated_total', fetched_count - len(jobs))
 
-        if Config.ANTHROPIC_API_KEY and Config.ANTHROPIC_API_KEY != 'your_api_key_here':
-            scorer = JobScorer(
-                api_key=Config.ANTHROPIC_API_KEY,
-                user_profile=Config.YOUR_PROFILE,
-                user_skills=Config.YOUR_SKILLS,
-                user_experience=Config.YOUR_EXPERIENCE_YEARS
-            )
-            scored_jobs = scorer.score_jobs(jobs)
-        else:
-            print("⚠ No API key found. Using mock scoring...")
-            scored_jobs = mock_score_jobs(jobs, Config.YOUR_PROFILE)
+            print(f"✓ Fetched {len(jobs)} jobs\n")
+
+            if not jobs:
+                print("No jobs found. Exiting...")
+                finish_scoring()
+                success = True
+                return
 
+            # Step 2: Score jobs using LLM
+            print("Step 2: Scoring jobs with LLM...")
+            with metrics.stage('score'):
+                score_jobs(jobs)
+            scored_jobs = jobs
+
+        finish_scoring()
         print(f"✓ Scored {len(scored_jobs)} jobs\n")
 
+        # (profile name, output path, scored jobs) per page to write
+        if profiles:
+            outputs = [(profile['name'], profile['output_path'], jobs_by_profile[profile['name']])
+                       for profile in profiles]
+        else:
+            outputs = [(None, Config.OUTPUT_HTML_PATH, scored_jobs)]
+
         # Step 3: Generate HTML page
         print("Step 3: Generating HTML page...")
-        generator = HTMLGenerator(Config.OUTPUT_HTML_PATH)
-        output_path = generator.generate(scored_jobs)
-        print(f"✓ HTML page generated at: {output_path}\n")
+        with metrics.stage('render'):
+            for name, output_path, jobs in outputs:
+                page_generator = generator if name is None else create_html_generator(output_path, fragment_cache)
+                output_path = page_generator.generate(jobs)
+                print(f"✓ HTML page {'for ' + name + ' ' if name else ''}generated at: {output_path}")
+        print()
+        if fragment_cache is not None:
+            print(f"Fragment cache: {fragment_cache.hits} cards reused, {fragment_cache.misses} rendered")
+            metrics.inc('fragment_cache_hits_total', fragment_cache.hits)
+            metrics.inc('fragment_cache_misses_total', fragment_cache.misses)
+            fragment_cache.prune(Config.FRAGMENT_CACHE_MAX_AGE_DAYS * 86400)
+            fragment_cache.close()
 
-        # Print summary
-        high_count = sum(1 for j in scored_jobs if j.get('priority') == 'HIGH')
-        med_count = sum(1 for j in scored_jobs if j.get('priority') == 'MED')
-        low_count = sum(1 for j in scored_jobs if j.get('priority') == 'LOW')
+        # Remember what was shown so later runs can skip it (only jobs scored for every profile)
+        if seen_index is not None:
+            incomplete = {
+                job.get('job_id') for _, _, jobs in outputs for job in jobs
+                if job.get('scoring_failed') or job.get('unscored')
+            }
+            seen_index.add_many(
+                job['job_id'] for job in outputs[0][2]
+                if job.get('job_id') and job['job_id'] not in incomplete
+            )
+            seen_index.close()
 
+        # Print summary
         print(f"\n{'='*60}")
         print("Summary:")
-        print(f"  Total jobs: {len(scored_jobs)}")
-        print(f"  High priority: {high_count}")
-        print(f"  Medium priority: {med_count}")
-        print(f"  Low priority: {low_count}")
+        for name, _, jobs in outputs:
+            labels = {'profile': name} if name else {}
+            high_count = sum(1 for j in jobs if j.get('priority') == 'HIGH')
+            med_count = sum(1 for j in jobs if j.get('priority') == 'MED')
+            low_count = sum(1 for j in jobs if j.get('priority') == 'LOW')
+            for priority, count in (('HIGH', high_count), ('MED', med_count), ('LOW', low_count)):
+                metrics.set('jobs_total', count, priority=priority, **labels)
+            metrics.set('jobs_scoring_failed', sum(1 for j in jobs if j.get('scoring_failed')), **labels)
+            unscored_count = sum(1 for j in jobs if j.get('unscored'))
+            metrics.set('jobs_unscored', unscored_count, **labels)
+
+            indent = '    ' if name else '  '
+            if name:
+                print(f"  {name}:")
+            print(f"{indent}Total jobs: {len(jobs)}")
+            print(f"{indent}High priority: {high_count}")
+            print(f"{indent}Medium priority: {med_count}")
+            print(f"{indent}Low priority: {low_count}")
+            if unscored_count:
+                print(f"{indent}Left unscored (budget or pending message batch): {unscored_count}")
         print(f"{'='*60}\n")
+        success = True
 
     except Exception as e:
         print(f"❌ Error during job search: {e}")
         import traceback
         traceback.print_exc()
 
+    finally:
+        if Config.METRICS_ENABLED:
+            metrics.set('run_success', 1 if success else 0)
+            write_run_report(metrics)
+
+
+def run_load_test(count: int):
+    """
+    Push synthetic jobs through dedup, pre-filter, scoring and rendering, and report
+    the time and peak Python memory of each stage. Scoring is mocked, so nothing is
+    fetched or sent to the API. Memory tracing slows allocation-heavy stages down
+    noticeably; turn it off with LOAD_TEST_TRACE_MEMORY=false for clean timings.
+    """
+    print(f"\n{'='*60}")
+    print(f"Load test with {count} synthetic jobs (seed {Config.LOAD_TEST_SEED})")
+    print(f"{'='*60}\n")
+
+    metrics = RunMetrics()
+    job_generator = SyntheticJobGenerator(
+        seed=Config.LOAD_TEST_SEED,
+        duplicate_rate=Config.LOAD_TEST_DUPLICATE_RATE,
+        description_words=Config.LOAD_TEST_DESCRIPTION_WORDS,
+        skills=Config.LOAD_TEST_SKILLS or None
+    )
+    html_generator = HTMLGenerator(
+        Config.LOAD_TEST_OUTPUT_PATH,
+        mode=Config.HTML_OUTPUT_MODE,
+        chunk_size=Config.HTML_CHUNK_SIZE,
+        page_size=Config.HTML_PAGE_SIZE,
+        split_assets=Config.HTML_SPLIT_ASSETS,
+        precompress=Config.HTML_PRECOMPRESS
+    )
+    prefilter = SkillPrefilter(
+        Config.YOUR_SKILLS,
+        min_score=Config.PREFILTER_MIN_SCORE,
+        top_k=Config.PREFILTER_TOP_K or None
+    ) if Config.PREFILTER_ENABLED else None
+
+    results = []
+    trace_memory = Config.LOAD_TEST_TRACE_MEMORY
+
+    def stage(name, work, *args):
+        if trace_memory:
+            tracemalloc.reset_peak()
+            start_memory = tracemalloc.get_traced_memory()[0]
+        with metrics.stage(name):
+            start = time.perf_counter()
+            result = work(*args)
+            seconds = time.perf_counter() - start
+        peak = retained = None
+        if trace_memory:
+            current_memory, peak_memory = tracemalloc.get_traced_memory()
+            peak, retained = peak_memory - start_memory, current_memory - start_memory
+            metrics.set('load_test_peak_memory_bytes', peak, stage=name)
+            metrics.set('load_test_retained_memory_bytes', retained, stage=name)
+        results.append((name, seconds, peak, retained))
+        return result
+
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        jobs = stage('generate', job_generator.generate, count)
+        if Config.NEAR_DUP_ENABLED:
+            jobs = stage('dedup', NearDuplicateDetector(threshold=Config.NEAR_DUP_THRESHOLD).deduplicate, jobs)
+        to_score = stage('prefilter', prefilter.filter, jobs) if prefilter else jobs
+        stage('score', mock_score_jobs, to_score, Config.YOUR_PROFILE)
+        output_path = stage('render', html_generator.generate, jobs)
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+
+    metrics.set('load_test_jobs', count)
+    metrics.set('load_test_duplicates_generated', job_generator.duplicates_generated)
+    metrics.set('jobs_deduplicated_total', count - len(jobs))
+
+    print(f"\n{'stage':<10} {'seconds':>9} {'jobs/s':>10} {'peak MB':>9} {'kept MB':>9}")
+    for name, seconds, peak, retained in results:
+        rate = count / seconds if seconds else 0.0
+        memory = f"{peak / 1024 / 1024:>9.1f} {retained / 1024 / 1024:>9.1f}" if trace_memory else f"{'-':>9} {'-':>9}"
+        print(f"{name:<10} {seconds:>9.3f} {rate:>10.0f} {memory}")
+    print(f"\nReposts generated: {job_generator.duplicates_generated}, merged: {count - len(jobs)}")
+    print(f"✓ HTML page generated at: {output_path}")
+    if Config.LOAD_TEST_REPORT_PATH:
+        metrics.write_json(Config.LOAD_TEST_REPORT_PATH)
+        print(f"Load test report written to {Config.LOAD_TEST_REPORT_PATH}")
+
 
 def run_scheduled():
     """
@@ -132,10 +588,14 @@ if __name__ == "__main__":
     elif len(sys.argv) > 1 and sys.argv[1] == "--schedule":
         # Run on schedule
         run_scheduled()
+    elif len(sys.argv) > 1 and sys.argv[1] == "--load-test":
+        # Synthetic jobs through every local stage, with time and memory per stage
+        run_load_test(int(sys.argv[2]) if len(sys.argv) > 2 else Config.LOAD_TEST_JOBS)
     else:
         # Default: run once
         print("Usage:")
         print("  python main.py --once      # Run once and exit")
         print("  python main.py --schedule  # Run every 24 hours")
+        print("  python main.py --load-test [COUNT]  # Time and memory per stage on synthetic jobs")
         print("\nRunning once by default...\n")
         run_once()
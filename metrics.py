@@ -0,0 +1,171 @@
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List
+
+# Latency buckets in seconds, from a cached page to a slow LLM call
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+# Prefix for every exported Prometheus metric
+PROMETHEUS_PREFIX = 'job_search_'
+
+
+def _series_key(name: str, labels: Dict[str, str]) -> tuple:
+    return (name,) + tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format_series(key: tuple) -> str:
+    """name{label="value",...} for a series key; also used as the JSON report key."""
+    name, labels = key[0], key[1:]
+    if not labels:
+        return name
+    escaped = ','.join(
+        f'{label}="' + value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') + '"'
+        for label, value in labels
+    )
+    return f"{name}{{{escaped}}}"
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+class RunMetrics:
+    """
+    Thread-safe counters, gauges and latency histograms for one run.
+
+    Components record into a shared instance while the run proceeds; at the end it
+    is exported as a JSON run report and as a Prometheus textfile (for the
+    node_exporter textfile collector or any scraper that reads the format).
+    """
+
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.started_at = time.time()
+        self._counters = {}
+        self._gauges = {}
+        self._samples = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, value: float = 1, **labels):
+        key = _series_key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def set(self, name: str, value: float, **labels):
+        with self._lock:
+            self._gauges[_series_key(name, labels)] = value
+
+    def observe(self, name: str, value: float, **labels):
+        """Record one sample (e.g. a latency in seconds) in a histogram."""
+        key = _series_key(name, labels)
+        with self._lock:
+            self._samples.setdefault(key, []).append(value)
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        """Observe the time spent in the block, in seconds, even if it raises."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    @contextmanager
+    def stage(self, stage: str):
+        """Add the time spent in the block to stage_seconds_total for `stage`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.inc('stage_seconds_total', time.perf_counter() - start, stage=stage)
+
+    def counter(self, name: str, **labels) -> float:
+        with self._lock:
+            return self._counters.get(_series_key(name, labels), 0)
+
+    def report(self) -> Dict:
+        """Snapshot of every series, with count/sum/percentiles for histograms."""
+        with self._lock:
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+            samples = {key: sorted(values) for key, values in self._samples.items()}
+
+        histograms = {}
+        for key, values in samples.items():
+            histograms[_format_series(key)] = {
+                'count': len(values),
+                'sum': sum(values),
+                'p50': _percentile(values, 0.5),
+                'p95': _percentile(values, 0.95),
+                'max': values[-1]
+            }
+        return {
+            'started_at': datetime.fromtimestamp(self.started_at).isoformat(timespec='seconds'),
+            'duration_seconds': time.time() - self.started_at,
+            'counters': {_format_series(key): value for key, value in sorted(counters.items())},
+            'gauges': {_format_series(key): value for key, value in sorted(gauges.items())},
+            'histograms': dict(sorted(histograms.items()))
+        }
+
+    def prometheus_text(self) -> str:
+        """Render every series in the Prometheus text exposition format."""
+        with self._lock:
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+            samples = {key: sorted(values) for key, values in self._samples.items()}
+        gauges[('run_duration_seconds',)] = time.time() - self.started_at
+
+        lines = []
+        typed = set()
+
+        def add(kind: str, key: tuple, value: float, suffix: str = '', extra_labels: tuple = ()):
+            name = PROMETHEUS_PREFIX + key[0]
+            if name not in typed:
+                lines.append(f"# TYPE {name} {kind}")
+                typed.add(name)
+            series = _format_series((name + suffix,) + key[1:] + extra_labels)
+            lines.append(f"{series} {float(value):g}")
+
+        for key, value in sorted(counters.items()):
+            add('counter', key, value)
+        for key, value in sorted(gauges.items()):
+            add('gauge', key, value)
+        for key, values in sorted(samples.items()):
+            # Values are sorted, so each cumulative bucket count is one linear walk
+            count = 0
+            for bound in self.buckets:
+                while count < len(values) and values[count] <= bound:
+                    count += 1
+                add('histogram', key, count, '_bucket', (('le', f"{bound:g}"),))
+            add('histogram', key, len(values), '_bucket', (('le', '+Inf'),))
+            add('histogram', key, sum(values), '_sum')
+            add('histogram', key, len(values), '_count')
+        return '\n'.join(lines) + '\n'
+
+    def write_json(self, path: str):
+        _atomic_write_text(path, json.dumps(self.report(), indent=2) + '\n')
+
+    def write_prometheus(self, path: str):
+        _atomic_write_text(path, self.prometheus_text())
+
+
+def _atomic_write_text(path: str, text: str):
+    """Write via a temp file and rename, so collectors never read a partial file."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with io.open(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
@@ -0,0 +1,161 @@
+import queue
+import threading
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from dedup import NearDuplicateDetector
+
+# Marks the end of a stage's output
+_END = object()
+
+
+class JobPipeline:
+    """
+    Runs fetch → enrich → score → render as concurrent stages joined by bounded queues.
+
+    Each stage handles one page of jobs at a time and passes it on, so scoring starts
+    on the first fetched page while later pages are still being fetched, and a run
+    takes about as long as its slowest stage instead of the sum of all of them.
+    A full queue blocks the stage feeding it, which bounds memory when a downstream
+    stage is slower.
+
+    With `render_interval` set, the page is re-rendered with the jobs scored so far
+    whenever that many seconds have passed, so partial results show up early.
+    """
+
+    def __init__(self, pages: Iterable[List[Dict]], score: Callable[[List[Dict]], None],
+                 enrich: Optional[Callable[[List[Dict]], None]] = None,
+                 deduplicator: Optional[NearDuplicateDetector] = None,
+                 render: Optional[Callable[[List[Dict]], None]] = None,
+                 queue_size: int = 4, render_interval: Optional[float] = None):
+        self.pages = pages
+        self.score = score
+        self.enrich = enrich
+        self.deduplicator = deduplicator
+        self.render = render
+        self.queue_size = max(1, queue_size)
+        self.render_interval = render_interval
+        # Seconds each stage spent working (not waiting on its neighbours)
+        self.stage_seconds = {'fetch': 0.0, 'enrich': 0.0, 'score': 0.0, 'render': 0.0}
+        self.partial_renders = 0
+        self._failed = threading.Event()
+        self._error = None
+
+    def run(self) -> List[Dict]:
+        """Run all stages to completion and return every scored job in arrival order."""
+        self._failed.clear()
+        self._error = None
+        fetched = queue.Queue(maxsize=self.queue_size)
+        enriched = queue.Queue(maxsize=self.queue_size)
+        scored = queue.Queue(maxsize=self.queue_size)
+
+        threads = [
+            threading.Thread(target=self._fetch_stage, args=(fetched,), name='pipeline-fetch', daemon=True),
+            threading.Thread(target=self._stage, args=('enrich', fetched, self._enrich_page, enriched),
+                             name='pipeline-enrich', daemon=True),
+            threading.Thread(target=self._stage, args=('score', enriched, self._score_page, scored),
+                             name='pipeline-score', daemon=True)
+        ]
+        for thread in threads:
+            thread.start()
+
+        jobs = []
+        last_render = time.monotonic()
+        try:
+            for page in self._drain(scored):
+                jobs.extend(page)
+                if (self.render and self.render_interval is not None
+                        and time.monotonic() - last_render >= self.render_interval):
+                    start = time.perf_counter()
+                    self.render(jobs)
+                    self.stage_seconds['render'] += time.perf_counter() - start
+                    self.partial_renders += 1
+                    last_render = time.monotonic()
+        except BaseException as e:
+            self._fail(e)
+        finally:
+            for thread in threads:
+                thread.join()
+
+        if self._error is not None:
+            raise self._error
+        self._print_summary(len(jobs))
+        return jobs
+
+    def _enrich_page(self, page: List[Dict]) -> List[Dict]:
+        if self.enrich:
+            self.enrich(page)
+        if self.deduplicator:
+            page = [job for job in page if self.deduplicator.add(job)]
+        return page
+
+    def _score_page(self, page: List[Dict]) -> List[Dict]:
+        self.score(page)
+        return page
+
+    def _fetch_stage(self, output: queue.Queue):
+        pages = iter(self.pages)
+        try:
+            while not self._failed.is_set():
+                start = time.perf_counter()
+                page = next(pages, _END)
+                self.stage_seconds['fetch'] += time.perf_counter() - start
+                if page is _END:
+                    break
+                self._put(output, page)
+        except BaseException as e:
+            self._fail(e)
+        finally:
+            # Stops the fetcher's keyword workers if we bailed out early
+            if hasattr(pages, 'close'):
+                pages.close()
+            self._put(output, _END)
+
+    def _stage(self, name: str, source: queue.Queue, work: Callable[[List[Dict]], List[Dict]],
+               output: queue.Queue):
+        try:
+            for page in self._drain(source):
+                start = time.perf_counter()
+                page = work(page)
+                self.stage_seconds[name] += time.perf_counter() - start
+                if page:
+                    self._put(output, page)
+        except BaseException as e:
+            self._fail(e)
+        finally:
+            self._put(output, _END)
+
+    def _fail(self, error: BaseException):
+        if self._error is None:
+            self._error = error
+        self._failed.set()
+
+    def _put(self, output: queue.Queue, item):
+        """Blocking put that gives up once any stage has failed."""
+        while not self._failed.is_set():
+            try:
+                output.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _drain(self, source: queue.Queue) -> Iterator[List[Dict]]:
+        """Yield pages until the upstream stage finishes or any stage fails."""
+        while True:
+            try:
+                item = source.get(timeout=0.1)
+            except queue.Empty:
+                if self._failed.is_set():
+                    return
+                continue
+            if item is _END:
+                return
+            yield item
+
+    def _print_summary(self, job_count: int):
+        seconds = self.stage_seconds
+        print(f"Pipeline: {job_count} jobs; busy time fetch {seconds['fetch']:.1f}s, "
+              f"enrich {seconds['enrich']:.1f}s, score {seconds['score']:.1f}s, "
+              f"render {seconds['render']:.1f}s ({self.partial_renders} partial renders)")
+        if self.deduplicator and self.deduplicator.merged_count:
+            print(f"Near-duplicate detection: merged {self.deduplicator.merged_count} reposted jobs")
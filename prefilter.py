@@ -0,0 +1,93 @@
+import re
+from typing import Dict, List, Optional
+
+import numpy as np
+
+# Keeps tech tokens like "c++", "c#", "node.js" and ".net" intact
+TOKEN_PATTERN = re.compile(r"[a-z0-9.+#]*[a-z0-9+#]")
+
+# Descriptions the fetcher uses when it found none; these jobs can't be judged locally
+PLACEHOLDER_DESCRIPTIONS = ('No description available', 'Could not fetch detailed description')
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens, keeping symbols that are part of tech names."""
+    return TOKEN_PATTERN.findall((text or '').lower())
+
+
+def parse_skills(skills: str) -> List[str]:
+    """Split a comma-separated skills string into normalized, de-duplicated skill phrases."""
+    phrases = []
+    for skill in (skills or '').split(','):
+        phrase = ' '.join(tokenize(skill))
+        if phrase and phrase not in phrases:
+            phrases.append(phrase)
+    return phrases
+
+
+class SkillPrefilter:
+    """
+    Cheap local scoring stage that runs before the LLM.
+
+    Builds a job x skill presence matrix for the whole batch and weights each
+    skill by its inverse document frequency within the batch, so a match on a
+    rare skill counts for more than one every posting mentions. Jobs scoring
+    below `min_score` are marked LOW without an LLM call; with `top_k` set,
+    only the k best remaining jobs go to the LLM.
+    """
+
+    def __init__(self, user_skills: str, min_score: float = 0.01, top_k: Optional[int] = None):
+        self.skills = parse_skills(user_skills)
+        self.min_score = min_score
+        self.top_k = top_k
+        self.skipped_count = 0
+
+    def score(self, jobs: List[Dict]) -> np.ndarray:
+        """Return each job's weighted share of the user's skills that it mentions (0-1)."""
+        if not jobs or not self.skills:
+            return np.zeros(len(jobs))
+
+        presence = np.zeros((len(jobs), len(self.skills)), dtype=bool)
+        for i, job in enumerate(jobs):
+            # Pad with spaces so phrases only match on token boundaries
+            text = f" {' '.join(tokenize(job.get('title', '') + ' ' + job.get('description', '')))} "
+            presence[i] = [f" {skill} " in text for skill in self.skills]
+
+        document_frequency = presence.sum(axis=0)
+        idf = np.log((1 + len(jobs)) / (1 + document_frequency)) + 1
+        return presence @ idf / idf.sum()
+
+    def filter(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Assign LOW to obvious mismatches and return the jobs that still need the LLM.
+        Jobs without a real description are always passed through.
+        """
+        if not self.skills or not jobs:
+            return jobs
+
+        judgeable = [job for job in jobs if job.get('description') not in PLACEHOLDER_DESCRIPTIONS]
+        unjudgeable = [job for job in jobs if job.get('description') in PLACEHOLDER_DESCRIPTIONS]
+        scores = self.score(judgeable)
+
+        keep = scores >= self.min_score
+        if self.top_k is not None and keep.sum() > self.top_k:
+            # Keep the k best-scoring jobs among those above the threshold
+            ranked = np.argsort(-np.where(keep, scores, -1), kind='stable')
+            keep = np.zeros(len(judgeable), dtype=bool)
+            keep[ranked[:self.top_k]] = True
+
+        to_score = []
+        for job, job_score, keep_job in zip(judgeable, scores, keep):
+            job['prefilter_score'] = float(job_score)
+            if keep_job:
+                to_score.append(job)
+            else:
+                job['priority'] = 'LOW'
+                job['reasoning'] = (f"Skipped LLM scoring: little overlap with your skills "
+                                    f"(local pre-filter score {job_score:.2f}).")
+                job['prefiltered'] = True
+
+        skipped = len(judgeable) - len(to_score)
+        self.skipped_count += skipped
+        print(f"Pre-filter: {skipped} of {len(jobs)} jobs marked LOW locally ({skipped} LLM calls avoided)")
+        return to_score + unjudgeable
@@ -0,0 +1,47 @@
+import json
+import os
+import re
+from typing import Dict, List
+
+
+def profile_slug(name: str) -> str:
+    """Filesystem-safe form of a profile name, used in per-profile file names."""
+    return re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-')
+
+
+def profile_path(path: str, name: str) -> str:
+    """`path` with the profile's slug added before the extension (jobs.sqlite3 -> jobs_alice.sqlite3)."""
+    root, extension = os.path.splitext(path)
+    return f"{root}_{profile_slug(name)}{extension}"
+
+
+def load_profiles(path: str, output_path: str) -> List[Dict]:
+    """
+    Read candidate profiles from a JSON file holding a list of objects with `name`,
+    `skills` and optionally `experience_years`, `profile` and `output_html_path`.
+    Returns dicts with the keys JobScorer takes (`user_profile`, `user_skills`,
+    `user_experience`) plus `name` and `output_path`, which defaults to `output_path`
+    with the profile's slug added.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    if not isinstance(entries, list) or not entries:
+        raise ValueError(f"{path} must hold a non-empty JSON list of profiles")
+
+    profiles = []
+    slugs = set()
+    for i, entry in enumerate(entries):
+        if not isinstance(entry, dict) or not entry.get('name') or not entry.get('skills'):
+            raise ValueError(f"Profile {i + 1} in {path} needs a 'name' and 'skills'")
+        slug = profile_slug(str(entry['name']))
+        if not slug or slug in slugs:
+            raise ValueError(f"Profile name '{entry['name']}' in {path} is empty or not unique")
+        slugs.add(slug)
+        profiles.append({
+            'name': str(entry['name']),
+            'user_profile': str(entry.get('profile', '')),
+            'user_skills': str(entry['skills']),
+            'user_experience': str(entry.get('experience_years', '0')),
+            'output_path': entry.get('output_html_path') or profile_path(output_path, entry['name'])
+        })
+    return profiles
@@ -0,0 +1,111 @@
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket whose refill rate adapts to server feedback.
+    The rate is cut multiplicatively when the server throttles us and grows
+    back additively on success (AIMD), bounded by [min_rate, max_rate].
+    """
+
+    def __init__(self, rate: float, capacity: float, min_rate: float, max_rate: float,
+                 backoff_factor: float = 0.5, recovery_step: float = 0.05):
+        self.rate = rate
+        self.capacity = capacity
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.backoff_factor = backoff_factor
+        self.recovery_step = recovery_step
+        self.tokens = capacity
+        self.blocked_until = 0.0
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        elapsed = now - self._last_refill
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self._last_refill = now
+
+    def acquire(self) -> float:
+        """
+        Reserve one token, sleeping until it is available.
+        Returns the number of seconds spent waiting.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            wait = max(wait, self.blocked_until - now)
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def penalize(self, retry_after: Optional[float] = None):
+        """Slow down after a throttling response (HTTP 429/999)."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate * self.backoff_factor)
+            self.tokens = min(self.tokens, 0.0)
+            pause = retry_after if retry_after is not None else 1.0 / self.rate
+            self.blocked_until = max(self.blocked_until, now + pause)
+
+    def reward(self):
+        """Speed back up after a successful response."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.recovery_step)
+
+
+class RateLimiter:
+    """
+    Per-host adaptive token-bucket rate limiter shared by all fetch workers.
+    """
+
+    def __init__(self, rate_per_second: float = 0.5, burst: float = 1,
+                 max_rate_per_second: Optional[float] = None, min_rate_per_second: float = 0.05,
+                 backoff_factor: float = 0.5):
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.max_rate_per_second = max_rate_per_second or rate_per_second
+        self.min_rate_per_second = min(min_rate_per_second, rate_per_second)
+        self.backoff_factor = backoff_factor
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, url: str) -> TokenBucket:
+        host = urlparse(url).netloc or url
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(
+                    rate=self.rate_per_second,
+                    capacity=self.burst,
+                    min_rate=self.min_rate_per_second,
+                    max_rate=self.max_rate_per_second,
+                    backoff_factor=self.backoff_factor,
+                    recovery_step=self.rate_per_second * 0.1
+                )
+                self._buckets[host] = bucket
+            return bucket
+
+    def acquire(self, url: str) -> float:
+        """Block until a request to the host of `url` is allowed."""
+        return self._bucket(url).acquire()
+
+    def penalize(self, url: str, retry_after: Optional[float] = None):
+        """Record a throttling response from the host of `url`."""
+        bucket = self._bucket(url)
+        bucket.penalize(retry_after)
+        print(f"Rate limited by {urlparse(url).netloc or url}; slowing down to {bucket.rate:.2f} req/s")
+
+    def reward(self, url: str):
+        """Record a successful response from the host of `url`."""
+        self._bucket(url).reward()
+
+    def current_rate(self, url: str) -> float:
+        return self._bucket(url).rate
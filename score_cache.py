@@ -0,0 +1,119 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+
+def make_cache_key(prompt: str, model: str, temperature: float) -> str:
+    """Content address of a scoring request: same prompt, model and temperature, same answer."""
+    digest = hashlib.sha256()
+    for part in (model, repr(float(temperature)), prompt):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\x00')
+    return digest.hexdigest()
+
+
+class ScoreCache:
+    """
+    Base class for LLM score caches. Values are (priority, reasoning) tuples.
+    Subclasses implement `_get` and `_put`; hit/miss counting lives here.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[tuple[str, str]]:
+        with self._lock:
+            value = self._get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def put(self, key: str, value: tuple[str, str]):
+        with self._lock:
+            self._put(key, value)
+
+    def stats(self) -> Dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def _get(self, key: str) -> Optional[tuple[str, str]]:
+        raise NotImplementedError
+
+    def _put(self, key: str, value: tuple[str, str]):
+        raise NotImplementedError
+
+
+class MemoryScoreCache(ScoreCache):
+    """In-process LRU cache holding at most `max_entries` scores."""
+
+    def __init__(self, max_entries: int = 10000):
+        super().__init__()
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+
+    def _get(self, key: str) -> Optional[tuple[str, str]]:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def _put(self, key: str, value: tuple[str, str]):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class DiskScoreCache(ScoreCache):
+    """SQLite-backed cache that keeps scores across runs."""
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS scores (
+                cache_key TEXT PRIMARY KEY,
+                priority TEXT NOT NULL,
+                reasoning TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+    def _get(self, key: str) -> Optional[tuple[str, str]]:
+        row = self._conn.execute(
+            "SELECT priority, reasoning FROM scores WHERE cache_key = ?", (key,)
+        ).fetchone()
+        return tuple(row) if row else None
+
+    def _put(self, key: str, value: tuple[str, str]):
+        priority, reasoning = value
+        self._conn.execute(
+            "INSERT OR REPLACE INTO scores (cache_key, priority, reasoning, created_at) VALUES (?, ?, ?, ?)",
+            (key, priority, reasoning, time.time())
+        )
+        self._conn.commit()
+
+
+def create_score_cache(backend: str, path: str = '', max_entries: int = 10000) -> Optional[ScoreCache]:
+    """Build a score cache from config: 'disk', 'memory' or 'none'."""
+    if backend == 'disk':
+        return DiskScoreCache(path)
+    if backend == 'memory':
+        return MemoryScoreCache(max_entries)
+    if backend == 'none':
+        return None
+    raise ValueError(f"Unknown score cache backend '{backend}', expected 'disk', 'memory' or 'none'")
@@ -0,0 +1,84 @@
+import hashlib
+import math
+import mmap
+import os
+import struct
+import threading
+from typing import Iterable
+
+# Header: magic, format version, number of bits, number of hash functions, items added
+_HEADER = struct.Struct('<4sIQIQ')
+_HEADER_SIZE = 32
+_MAGIC = b'JSBF'
+_VERSION = 1
+
+
+class SeenIndex:
+    """
+    Persistent Bloom filter of job IDs that were already processed, memory-mapped from disk.
+
+    Membership checks and inserts are O(1) and touch only a few bits, so the file
+    stays small (about 1.8 MB per million IDs at a 0.1% false-positive rate) and
+    nothing has to be loaded up front. A false positive means a new job is
+    occasionally treated as seen; there are no false negatives.
+    """
+
+    def __init__(self, path: str, capacity: int = 1_000_000, false_positive_rate: float = 0.001):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        if not os.path.exists(path):
+            num_bits = math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2)
+            num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+            with open(path, 'wb') as f:
+                f.write(_HEADER.pack(_MAGIC, _VERSION, num_bits, num_hashes, 0).ljust(_HEADER_SIZE, b'\0'))
+                f.truncate(_HEADER_SIZE + (num_bits + 7) // 8)
+
+        self._file = open(path, 'r+b')
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+        magic, version, self.num_bits, self.num_hashes, self._count = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"{path} is not a seen-index file")
+        self._lock = threading.Lock()
+
+    def _positions(self, job_id: str):
+        digest = hashlib.blake2b(job_id.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        # Kirsch-Mitzenmacher double hashing: k positions from two hashes
+        return ((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+
+    def __contains__(self, job_id: str) -> bool:
+        return all(self._mmap[_HEADER_SIZE + pos // 8] & (1 << (pos % 8)) for pos in self._positions(job_id))
+
+    def add(self, job_id: str):
+        with self._lock:
+            added = False
+            for pos in self._positions(job_id):
+                offset = _HEADER_SIZE + pos // 8
+                bit = 1 << (pos % 8)
+                if not self._mmap[offset] & bit:
+                    self._mmap[offset] |= bit
+                    added = True
+            if added:
+                self._count += 1
+
+    def add_many(self, job_ids: Iterable[str]):
+        for job_id in job_ids:
+            self.add(job_id)
+
+    def __len__(self) -> int:
+        """Approximate number of distinct IDs added."""
+        return self._count
+
+    def flush(self):
+        with self._lock:
+            _HEADER.pack_into(self._mmap, 0, _MAGIC, _VERSION, self.num_bits, self.num_hashes, self._count)
+            self._mmap.flush()
+
+    def close(self):
+        self.flush()
+        self._mmap.close()
+        self._file.close()
@@ -0,0 +1,141 @@
+import math
+import random
+from typing import Dict, Iterator, List, Optional, Sequence
+
+# Default skill vocabulary; postings mention a random subset of it
+SKILL_VOCABULARY = (
+    'Python', 'JavaScript', 'TypeScript', 'React', 'Angular', 'Vue.js', 'Next.js', 'Node.js',
+    'Java', 'Spring Boot', 'Kotlin', 'Go', 'C++', 'C#', '.NET', 'Rust', 'Scala', 'Ruby on Rails',
+    'Django', 'FastAPI', 'Flask', 'GraphQL', 'REST APIs', 'SQL', 'PostgreSQL', 'MySQL', 'MongoDB',
+    'Redis', 'Kafka', 'Elasticsearch', 'Docker', 'Kubernetes', 'Terraform', 'AWS', 'GCP', 'Azure',
+    'CI/CD', 'Git', 'Linux', 'Spark', 'Airflow', 'PyTorch', 'TensorFlow', 'LLMs', 'RAG pipelines'
+)
+
+_TITLE_LEVELS = ('Junior', 'Entry Level', 'Graduate', 'Mid-level', 'Senior', 'Staff')
+_TITLE_ROLES = ('Software Engineer', 'Full Stack Developer', 'Backend Engineer', 'Frontend Developer',
+                'Data Engineer', 'DevOps Engineer', 'Machine Learning Engineer', 'Platform Engineer')
+_TITLE_TEAMS = ('', ' - Payments', ' - Cloud Platform', ' - AI/ML', ' - Security', ' - Growth', ' - Infrastructure')
+_COMPANY_PREFIXES = ('Blue', 'Bright', 'Cyber', 'Data', 'Deep', 'Green', 'Hyper', 'Nova', 'Open', 'Quantum',
+                     'Red', 'Silver', 'Smart', 'Swift', 'Terra', 'Urban')
+_COMPANY_SUFFIXES = ('Labs', 'Systems', 'Tech', 'AI', 'Cloud', 'Works', 'Soft', 'Logic', 'Networks', 'Data')
+_LOCATIONS = ('Tel Aviv, Israel', 'Herzliya, Israel', 'Haifa, Israel', 'Jerusalem, Israel', 'Petah Tikva, Israel',
+              'Ra\'anana, Israel', 'Netanya, Israel', 'Be\'er Sheva, Israel', 'Yokneam, Israel', 'Israel (Remote)')
+
+_REQUIREMENT_SENTENCES = (
+    'Required: {skills}.', 'Must have hands-on experience with {skills}.',
+    'Our stack includes {skills}.', 'Experience with {skills} is a plus.',
+    'You will build services using {skills}.', 'Nice to have: {skills}.'
+)
+_FILLER_SENTENCES = (
+    'We are looking for a motivated engineer to join our growing team.',
+    'You will collaborate closely with product managers, designers and senior engineers.',
+    'Strong problem-solving skills and a good understanding of data structures are expected.',
+    'B.Sc. in Computer Science or a related field, or equivalent practical experience.',
+    'We value ownership, curiosity and clear communication.',
+    'The role includes code reviews, design discussions and on-call rotations.',
+    'We offer a hybrid work model, a learning budget and excellent mentorship.',
+    'You will help us scale a product used by millions of people every day.',
+    'Recent graduates with a strong portfolio are encouraged to apply.',
+    'Join a fast-paced environment where your work ships to customers every week.',
+    'You will write clean, tested and maintainable code.',
+    'Experience working in an agile team is an advantage.'
+)
+
+_REPOST_NOTES = ('Reposted.', 'Still hiring!', 'Urgent hire.', 'Apply today.', 'Updated listing.')
+
+
+class SyntheticJobGenerator:
+    """
+    Seeded generator of realistic job postings for load testing.
+
+    Postings have the same fields as a parsed LinkedIn job card. Description
+    lengths follow a log-normal distribution around `description_words`, each
+    posting mentions a few skills from `skills`, and about `duplicate_rate` of
+    the postings are reposts of an earlier one (new URL, description lightly
+    edited), so near-duplicate detection has something to find. The same seed
+    always yields the same postings, and they are produced lazily, so any
+    volume can be streamed without holding it in memory.
+    """
+
+    def __init__(self, seed: int = 42, duplicate_rate: float = 0.05, description_words: int = 150,
+                 description_sigma: float = 0.5, skills: Optional[Sequence[str]] = None,
+                 skills_per_job: tuple = (3, 8), repost_window: int = 1000):
+        if not 0 <= duplicate_rate < 1:
+            raise ValueError("duplicate_rate must be in [0, 1)")
+        self.seed = seed
+        self.duplicate_rate = duplicate_rate
+        self.description_words = description_words
+        self.description_sigma = description_sigma
+        self.skills = list(skills or SKILL_VOCABULARY)
+        self.skills_per_job = (min(skills_per_job[0], len(self.skills)), min(skills_per_job[1], len(self.skills)))
+        # Reposts copy one of the most recent originals, like real re-listings
+        self.repost_window = repost_window
+        self.duplicates_generated = 0
+
+    def iter_jobs(self, count: int) -> Iterator[Dict]:
+        rng = random.Random(self.seed)
+        recent = []
+        originals = 0
+        self.duplicates_generated = 0
+        for i in range(count):
+            if recent and rng.random() < self.duplicate_rate:
+                job = self._repost(rng, rng.choice(recent), i)
+                self.duplicates_generated += 1
+            else:
+                job = self._posting(rng, i)
+                # Ring buffer of the last `repost_window` originals
+                if len(recent) < self.repost_window:
+                    recent.append(job)
+                else:
+                    recent[originals % self.repost_window] = job
+                originals += 1
+            yield job
+
+    def iter_pages(self, count: int, page_size: int = 25) -> Iterator[List[Dict]]:
+        """Postings in pages, like LinkedInJobFetcher.iter_pages, for pipeline runs."""
+        page = []
+        for job in self.iter_jobs(count):
+            page.append(job)
+            if len(page) == page_size:
+                yield page
+                page = []
+        if page:
+            yield page
+
+    def generate(self, count: int) -> List[Dict]:
+        return list(self.iter_jobs(count))
+
+    def _posting(self, rng: random.Random, index: int) -> Dict:
+        title = f"{rng.choice(_TITLE_LEVELS)} {rng.choice(_TITLE_ROLES)}{rng.choice(_TITLE_TEAMS)}"
+        company = f"{rng.choice(_COMPANY_PREFIXES)}{rng.choice(_COMPANY_SUFFIXES)} {index % 997}"
+        return {
+            'title': title,
+            'company': company,
+            'location': rng.choice(_LOCATIONS),
+            'url': self._url(index),
+            'description': self._description(rng),
+            'priority': None
+        }
+
+    def _repost(self, rng: random.Random, original: Dict, index: int) -> Dict:
+        # A short added line makes the repost near-identical rather than identical
+        description = f"{original['description']} {rng.choice(_REPOST_NOTES)}"
+        return {**original, 'url': self._url(index), 'description': description}
+
+    def _description(self, rng: random.Random) -> str:
+        target = max(20, int(rng.lognormvariate(math.log(self.description_words), self.description_sigma)))
+        skills = rng.sample(self.skills, rng.randint(*self.skills_per_job))
+        sentences = []
+        words = 0
+        while words < target:
+            if skills and (not sentences or rng.random() < 0.3):
+                chunk, skills = skills[:3], skills[3:]
+                sentence = rng.choice(_REQUIREMENT_SENTENCES).format(skills=', '.join(chunk))
+            else:
+                sentence = rng.choice(_FILLER_SENTENCES)
+            sentences.append(sentence)
+            words += sentence.count(' ') + 1
+        return ' '.join(sentences)
+
+    def _url(self, index: int) -> str:
+        return f"https://www.linkedin.com/jobs/view/{5_000_000_000 + self.seed * 100_000_000 + index}/"
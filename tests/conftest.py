@@ -0,0 +1,43 @@
+import os
+import sys
+
+import pytest
+
+# Modules live at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fake_anthropic import FakeAnthropicServer  # noqa: E402
+from job_scorer import JobScorer  # noqa: E402
+from synthetic_jobs import SyntheticJobGenerator  # noqa: E402
+
+
+@pytest.fixture
+def fake_server():
+    """A FakeAnthropicServer on a free port; tweak its attributes per test."""
+    with FakeAnthropicServer(seed=1) as server:
+        yield server
+
+
+@pytest.fixture
+def make_scorer(fake_server):
+    """Build JobScorers against the fake server with near-zero retry delays."""
+    def make(**kwargs):
+        options = {
+            'api_key': 'fake',
+            'base_url': fake_server.base_url,
+            'user_profile': 'Junior full-stack developer',
+            'user_skills': 'Python, React, SQL',
+            'user_experience': '0-2',
+            'retry_base_delay': 0.001,
+            'retry_max_delay': 0.01,
+        }
+        options.update(kwargs)
+        return JobScorer(**options)
+    return make
+
+
+@pytest.fixture
+def make_jobs():
+    def make(count: int, seed: int = 7):
+        return SyntheticJobGenerator(seed=seed, duplicate_rate=0).generate(count)
+    return make
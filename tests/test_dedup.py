@@ -0,0 +1,38 @@
+from dedup import NearDuplicateDetector
+
+DESCRIPTION = ("We are looking for a junior backend developer to build REST APIs in Python and Django, "
+               "write SQL queries against PostgreSQL, review pull requests and help run our services on AWS.")
+
+
+def make_job(job_id: str, description: str = DESCRIPTION, title: str = 'Junior Backend Developer') -> dict:
+    return {
+        'title': title,
+        'company': 'Acme',
+        'description': description,
+        'url': f'https://www.linkedin.com/jobs/view/{job_id}/'
+    }
+
+
+def test_reposts_are_merged_into_the_first_posting():
+    repost = make_job('2', DESCRIPTION + ' Apply today.')
+    jobs = [make_job('1'), make_job('3', 'Forklift driver for a warehouse night shift.', 'Forklift Driver'), repost]
+
+    unique = NearDuplicateDetector().deduplicate(jobs)
+
+    assert unique == jobs[:2]
+    assert unique[0]['duplicate_urls'] == [repost['url']]
+
+
+def test_streaming_add_matches_deduplicate():
+    detector = NearDuplicateDetector()
+    jobs = [make_job('1'), make_job('2', DESCRIPTION + ' Apply today.'), make_job('3', 'Forklift driver.')]
+
+    assert [detector.add(job) for job in jobs] == [True, False, True]
+    assert detector.merged_count == 1
+    assert jobs[0]['duplicate_urls'] == [jobs[1]['url']]
+
+
+def test_jobs_without_description_are_never_merged():
+    jobs = [make_job('1', 'No description available'), make_job('2', 'No description available')]
+
+    assert NearDuplicateDetector().deduplicate(jobs) == jobs
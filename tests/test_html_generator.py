@@ -0,0 +1,95 @@
+import gzip
+import json
+import os
+import re
+
+from fragment_cache import FragmentCache
+from html_generator import HTMLGenerator
+
+
+def make_job(title: str, priority: str) -> dict:
+    return {
+        'title': title,
+        'company': 'Acme',
+        'location': 'Remote',
+        'description': 'Build things',
+        'priority': priority,
+        'reasoning': 'Fits',
+        'url': 'https://www.linkedin.com/jobs/view/1/'
+    }
+
+
+def test_static_page_lists_jobs_by_priority_and_escapes_them(tmp_path):
+    output_path = str(tmp_path / 'jobs.html')
+    jobs = [make_job('Low one', 'LOW'), make_job('<b>High</b> one', 'HIGH'), make_job('Med one', 'MED')]
+
+    HTMLGenerator(output_path).generate(jobs)
+
+    with open(output_path, encoding='utf-8') as f:
+        page = f.read()
+    positions = [page.index(title) for title in ('&lt;b&gt;High&lt;/b&gt; one', 'Med one', 'Low one')]
+    assert positions == sorted(positions)
+    assert '<b>High</b>' not in page
+    # Written through a temp file that was renamed into place
+    assert os.listdir(tmp_path) == ['jobs.html']
+
+
+def test_paged_mode_writes_chunks_and_drops_stale_ones(tmp_path):
+    output_path = str(tmp_path / 'jobs.html')
+    jobs = [make_job(f'Job {i}', priority) for i, priority in enumerate(['HIGH'] * 3 + ['MED'] * 2 + ['LOW'] * 5)]
+
+    HTMLGenerator(output_path, mode='paged', chunk_size=4).generate(jobs)
+
+    data_dir = tmp_path / 'jobs_data'
+    assert sorted(os.listdir(data_dir)) == ['jobs-00000.js', 'jobs-00001.js', 'jobs-00002.js']
+    chunk = (data_dir / 'jobs-00001.js').read_text(encoding='utf-8')
+    rows = json.loads(re.fullmatch(r'registerJobChunk\(1,(.*)\);\n', chunk, re.DOTALL).group(1))
+    assert [row[0] for row in rows] == ['Job 4', 'Job 5', 'Job 6', 'Job 7']
+    page = (tmp_path / 'jobs.html').read_text(encoding='utf-8')
+    manifest = json.loads(re.search(r'const MANIFEST = (.*);', page).group(1))
+    assert manifest['total'] == 10
+    assert manifest['ranges'] == {'ALL': [0, 10], 'HIGH': [0, 3], 'MED': [3, 5], 'LOW': [5, 10]}
+    assert 'Job 0' not in page
+
+    HTMLGenerator(output_path, mode='paged', chunk_size=4).generate(jobs[:4])
+
+    assert os.listdir(data_dir) == ['jobs-00000.js']
+
+
+def test_precompressed_copy_matches_page_and_is_removed_when_disabled(make_jobs, tmp_path):
+    output_path = str(tmp_path / 'jobs.html')
+    jobs = make_jobs(30)
+
+    HTMLGenerator(output_path, precompress=['gzip']).generate(jobs)
+
+    with gzip.open(output_path + '.gz', 'rb') as f, open(output_path, 'rb') as page:
+        assert f.read() == page.read()
+
+    HTMLGenerator(output_path).generate(jobs)
+
+    assert not os.path.exists(output_path + '.gz')
+
+
+def test_fragment_cache_keeps_fragments_that_are_still_used(tmp_path):
+    cache = FragmentCache(str(tmp_path / 'fragments.sqlite3'))
+    cache.put_many({'used': '<div>used</div>', 'unused': '<div>unused</div>'})
+    # Both were written long ago
+    cache._conn.execute("UPDATE fragments SET created_at = 0, last_used = 0")
+
+    assert cache.get_many(['used']) == {'used': '<div>used</div>'}
+    assert cache.prune(max_age_seconds=3600) == 1
+    assert cache.get_many(['used', 'unused']) == {'used': '<div>used</div>'}
+    cache.close()
+
+
+def test_split_assets_are_linked_by_content_hash(make_jobs, tmp_path):
+    output_path = str(tmp_path / 'jobs.html')
+
+    HTMLGenerator(output_path, split_assets=True).generate(make_jobs(3))
+
+    page = (tmp_path / 'jobs.html').read_text(encoding='utf-8')
+    css = re.search(r'href="(jobs_assets/style\.\w{12}\.css)"', page)
+    js = re.search(r'src="(jobs_assets/script\.\w{12}\.js)"', page)
+    assert css and js
+    assert (tmp_path / css.group(1)).exists() and (tmp_path / js.group(1)).exists()
+    assert '<style>' not in page
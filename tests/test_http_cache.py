@@ -0,0 +1,80 @@
+import json
+import os
+import time
+
+import requests
+
+from http_cache import HTTPCache
+from linkedin_fetcher import LinkedInJobFetcher
+from rate_limiter import RateLimiter
+
+URL = 'https://www.linkedin.com/jobs/search'
+
+
+def make_response(status_code: int, content: bytes = b'', headers: dict = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response.url = URL
+    response.headers.update(headers or {})
+    return response
+
+
+class ScriptedSession:
+    """Stands in for requests.Session, answering GETs from a list of responses."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.request_headers = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.request_headers.append(dict(headers or {}))
+        return self.responses.pop(0)
+
+
+def test_fresh_entries_are_served_and_stale_ones_revalidated(tmp_path):
+    cache = HTTPCache(str(tmp_path), ttl_seconds=3600)
+    cache.update(URL, {'start': 0}, make_response(200, b'page', {'ETag': '"v1"'}))
+
+    assert cache.get_fresh(URL, {'start': 0}).content == b'page'
+    assert cache.get_fresh(URL, {'start': 25}) is None
+
+    cache.ttl_seconds = 0
+    assert cache.get_fresh(URL, {'start': 0}) is None
+    assert cache.conditional_headers(URL, {'start': 0}) == {'If-None-Match': '"v1"'}
+    assert cache.update(URL, {'start': 0}, make_response(304)).content == b'page'
+    assert cache.stats() == {'hits': 1, 'revalidated': 1, 'misses': 1, 'pruned': 0}
+
+
+def test_entries_past_max_age_are_pruned_on_open(tmp_path):
+    cache = HTTPCache(str(tmp_path), ttl_seconds=10)
+    cache.update(URL, {'start': 0}, make_response(200, b'old'))
+    cache.update(URL, {'start': 25}, make_response(200, b'new'))
+    meta_path, _ = cache._paths(cache._key(URL, {'start': 0}))
+    with open(meta_path, encoding='utf-8') as f:
+        meta = json.load(f)
+    meta['fetched_at'] = time.time() - 41
+    with open(meta_path, 'w', encoding='utf-8') as f:
+        json.dump(meta, f)
+
+    reopened = HTTPCache(str(tmp_path), ttl_seconds=10)
+
+    assert reopened.pruned == 1
+    assert sorted(os.listdir(tmp_path)) == sorted(os.path.basename(p) for p in cache._paths(cache._key(URL, {'start': 25})))
+
+
+def test_not_modified_without_cached_copy_is_fetched_again(tmp_path):
+    cache = HTTPCache(str(tmp_path), ttl_seconds=0)
+    cache.update(URL, None, make_response(200, b'page', {'ETag': '"v1"'}))
+    session = ScriptedSession([make_response(304), make_response(200, b'page again')])
+    fetcher = LinkedInJobFetcher(['python'], 'Israel', rate_limiter=RateLimiter(rate_per_second=1000, burst=10),
+                                 session=session, http_cache=cache)
+    # The body disappears between sending the conditional request and the 304 arriving
+    os.remove(cache._paths(cache._key(URL, None))[1])
+
+    response = fetcher._get(URL)
+
+    assert response.status_code == 200
+    assert response.content == b'page again'
+    assert session.request_headers[0] == {'If-None-Match': '"v1"'}
+    assert session.request_headers[1] == {}
@@ -0,0 +1,158 @@
+import json
+
+import benchmarks.fake_anthropic as fake_anthropic
+from job_scorer import BATCH_PENDING_REASONING, SCORING_ERROR_PREFIX, JobScorer, MultiProfileScorer
+from score_cache import MemoryScoreCache
+
+
+def expected_scores(scorer, jobs):
+    """The priority the fake server gives each job, computed from the job's own prompt."""
+    replies = [
+        fake_anthropic.fake_reply(fake_anthropic._prompt_text({
+            'system': scorer._system_blocks(),
+            'messages': [{'role': 'user', 'content': scorer._create_scoring_prompt(job)}]
+        }))
+        for job in jobs
+    ]
+    return [reply.split('\n')[0].split(': ')[1] for reply in replies]
+
+
+def test_retries_injected_errors_and_keeps_input_order(fake_server, make_scorer, make_jobs):
+    fake_server.error_rate = 0.4
+    scorer = make_scorer(max_concurrency=4, max_retries=20)
+    jobs = make_jobs(12)
+    titles = [job['title'] for job in jobs]
+
+    scored = scorer.score_jobs(jobs)
+
+    assert fake_server.errors > 0
+    assert scorer.retry_count == fake_server.errors
+    assert [job['title'] for job in scored] == titles
+    assert not any(job.get('scoring_failed') for job in scored)
+    assert [job['priority'] for job in scored] == expected_scores(scorer, jobs)
+
+
+def test_non_retryable_error_falls_back_to_low(fake_server, make_scorer, make_jobs):
+    fake_server.error_rate = 1.0
+    fake_server.error_statuses = (400,)
+    scorer = make_scorer(max_retries=5)
+    jobs = make_jobs(3)
+
+    scorer.score_jobs(jobs)
+
+    # One attempt per job: 400 is not retried
+    assert fake_server.requests == 3
+    assert scorer.retry_count == 0
+    for job in jobs:
+        assert job['priority'] == 'LOW'
+        assert job['reasoning'].startswith(SCORING_ERROR_PREFIX)
+        assert job['scoring_failed']
+
+
+def test_retries_give_up_after_max_retries(fake_server, make_scorer, make_jobs):
+    fake_server.error_rate = 1.0
+    scorer = make_scorer(max_retries=2)
+    jobs = make_jobs(1)
+
+    scorer.score_jobs(jobs)
+
+    assert fake_server.requests == 3
+    assert jobs[0]['scoring_failed']
+
+
+def test_bulk_scoring_resumes_submitted_batch(fake_server, make_scorer, make_jobs, tmp_path):
+    state_path = str(tmp_path / 'message_batch.json')
+    fake_server.batch_processing_s = 60
+    jobs = make_jobs(4)
+
+    make_scorer().bulk_score_jobs(jobs, state_path=state_path, poll_interval=0.01, max_wait_seconds=0)
+
+    assert len(fake_server.batches) == 1
+    with open(state_path, encoding='utf-8') as f:
+        assert len(json.load(f)['batches']) == 1
+    assert all(job['unscored'] and job['reasoning'] == BATCH_PENDING_REASONING for job in jobs)
+
+    # A new process picks the saved batch up instead of submitting the jobs again
+    fake_server.batch_processing_s = 0
+    resumed_jobs = make_jobs(4)
+    scorer = make_scorer()
+    scorer.bulk_score_jobs(resumed_jobs, state_path=state_path, poll_interval=0.01, max_wait_seconds=5)
+
+    assert len(fake_server.batches) == 1
+    assert [job['priority'] for job in resumed_jobs] == expected_scores(scorer, resumed_jobs)
+    assert not any(job.get('unscored') or job.get('scoring_failed') for job in resumed_jobs)
+    assert not (tmp_path / 'message_batch.json').exists()
+
+
+def test_malformed_batch_reply_falls_back_to_single_job_scoring(fake_server, make_scorer, make_jobs,
+                                                                 monkeypatch):
+    reply = fake_anthropic.fake_reply
+
+    def malformed_batch_reply(prompt: str) -> str:
+        if '[JOB ID:' in prompt:
+            return '{"J1": {"priority": "HIGH", "reasoning": "cut off'
+        return reply(prompt)
+
+    monkeypatch.setattr(fake_anthropic, 'fake_reply', malformed_batch_reply)
+    scorer = make_scorer()
+    jobs = make_jobs(4)
+
+    scorer.batch_score_jobs(jobs, batch_size=2)
+
+    # Two batch requests, then one single-job request per job
+    assert fake_server.requests == 2 + 4
+    assert [job['priority'] for job in jobs] == expected_scores(scorer, jobs)
+    assert not any(job.get('scoring_failed') for job in jobs)
+
+
+def test_batch_replies_are_cached_under_the_batch_request(fake_server, make_scorer, make_jobs):
+    cache = MemoryScoreCache()
+    jobs = make_jobs(4)
+
+    make_scorer(score_cache=cache).batch_score_jobs(jobs, batch_size=2)
+    assert fake_server.requests == 2
+
+    # The same batches again come from the cache
+    make_scorer(score_cache=cache).batch_score_jobs(make_jobs(4), batch_size=2)
+    assert fake_server.requests == 2
+
+    # Single-job prompts were never sent, so they have no cached scores
+    make_scorer(score_cache=cache).score_jobs(make_jobs(4))
+    assert fake_server.requests == 2 + 4
+
+
+def test_profiles_missing_from_reply_are_scored_on_their_own(fake_server, make_jobs, monkeypatch):
+    reply = fake_anthropic.fake_reply
+
+    def reply_without_p2(prompt: str) -> str:
+        if '[PROFILE ID:' in prompt:
+            return '{"P1": {"priority": "HIGH", "reasoning": "Strong match."}}'
+        return reply(prompt)
+
+    monkeypatch.setattr(fake_anthropic, 'fake_reply', reply_without_p2)
+    profiles = [
+        {'name': 'Alice', 'user_profile': 'Backend developer', 'user_skills': 'Python, SQL', 'user_experience': '3'},
+        {'name': 'Bob', 'user_profile': 'Designer', 'user_skills': 'Figma', 'user_experience': '5'},
+    ]
+    cache = MemoryScoreCache()
+
+    def make_scorer():
+        return MultiProfileScorer('fake', profiles, base_url=fake_server.base_url, score_cache=cache,
+                                  retry_base_delay=0.001, retry_max_delay=0.01)
+
+    jobs = make_jobs(2)
+    jobs_by_profile = {'Alice': [dict(job) for job in jobs], 'Bob': [dict(job) for job in jobs]}
+    scorer = make_scorer()
+    scorer.score_profiles(jobs_by_profile)
+
+    # One shared request per job, then one single-profile request per job for Bob
+    assert fake_server.requests == 2 + 2
+    assert all(job['priority'] == 'HIGH' for job in jobs_by_profile['Alice'])
+    bob = JobScorer('fake', user_profile='Designer', user_skills='Figma', user_experience='5')
+    assert [job['priority'] for job in jobs_by_profile['Bob']] == expected_scores(bob, jobs)
+    assert not any(job.get('scoring_failed') for jobs in jobs_by_profile.values() for job in jobs)
+
+    # Later runs find Bob's single-profile scores and Alice's reply in the cache
+    for _ in range(2):
+        make_scorer().score_profiles({'Alice': [dict(job) for job in jobs], 'Bob': [dict(job) for job in jobs]})
+    assert fake_server.requests == 4
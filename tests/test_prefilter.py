@@ -0,0 +1,48 @@
+from job_store import JobStore
+from prefilter import SkillPrefilter
+
+
+def make_job(job_id: str, description: str) -> dict:
+    return {
+        'title': 'Engineer',
+        'company': 'Acme',
+        'location': 'Remote',
+        'description': description,
+        'url': f'https://www.linkedin.com/jobs/view/{job_id}'
+    }
+
+
+def test_prefilter_marks_mismatches_low_and_keeps_top_k():
+    jobs = [
+        make_job('1', 'We use Python, React and SQL every day'),
+        make_job('2', 'Python and SQL for data pipelines'),
+        make_job('3', 'Forklift certification required'),
+        make_job('4', 'No description available'),
+    ]
+
+    to_score = SkillPrefilter('Python, React, SQL', top_k=1).filter(jobs)
+
+    # The best match plus the job that can't be judged locally
+    assert to_score == [jobs[0], jobs[3]]
+    for job in (jobs[1], jobs[2]):
+        assert job['priority'] == 'LOW'
+        assert job['prefiltered']
+
+
+def test_prefiltered_verdicts_are_not_saved_as_scores(tmp_path):
+    path = str(tmp_path / 'jobs.sqlite3')
+    jobs = [make_job('1', 'Python and React'), make_job('2', 'Forklift certification required')]
+
+    store = JobStore(path, scoring_fingerprint='fp')
+    pending = store.upsert_jobs(jobs)
+    SkillPrefilter('Python, React').filter(pending)
+    jobs[0].update(priority='HIGH', reasoning='Strong match')
+    store.save_scores(pending)
+    store.close()
+
+    # A later run without the pre-filter still sends the pre-filtered job to the LLM
+    store = JobStore(path, scoring_fingerprint='fp')
+    pending = store.upsert_jobs([make_job('1', 'Python and React'), make_job('2', 'Forklift certification required')])
+    store.close()
+
+    assert [job['job_id'] for job in pending] == [jobs[1]['job_id']]
@@ -0,0 +1,61 @@
+import time
+
+import requests
+
+from linkedin_fetcher import LinkedInJobFetcher
+from rate_limiter import RateLimiter
+
+URL = 'https://www.linkedin.com/jobs/search'
+
+
+def test_burst_is_free_then_requests_are_spaced_by_the_rate():
+    limiter = RateLimiter(rate_per_second=20, burst=3)
+
+    start = time.monotonic()
+    waits = [limiter.acquire(URL) for _ in range(5)]
+    elapsed = time.monotonic() - start
+
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert all(0 < wait <= 0.05 for wait in waits[3:])
+    # Two requests past the burst at 20 per second
+    assert 0.09 <= elapsed < 0.5
+
+
+def test_hosts_have_separate_buckets():
+    limiter = RateLimiter(rate_per_second=1, burst=1)
+
+    assert limiter.acquire(URL) == 0.0
+    assert limiter.acquire('https://example.com/jobs') == 0.0
+
+
+def test_throttling_halves_the_rate_and_success_recovers_it():
+    limiter = RateLimiter(rate_per_second=10, burst=1, min_rate_per_second=2)
+
+    for _ in range(5):
+        limiter.penalize(URL, retry_after=0)
+    assert limiter.current_rate(URL) == 2
+
+    for _ in range(100):
+        limiter.reward(URL)
+    assert limiter.current_rate(URL) == 10
+
+
+def test_throttled_requests_are_retried_after_retry_after():
+    throttled = requests.Response()
+    throttled.status_code = 429
+    throttled.headers['Retry-After'] = '0'
+    ok = requests.Response()
+    ok.status_code = 200
+    responses = [throttled, ok]
+
+    class Session:
+        def get(self, url, params=None, headers=None, timeout=None):
+            return responses.pop(0)
+
+    limiter = RateLimiter(rate_per_second=100, burst=1)
+    fetcher = LinkedInJobFetcher(['python'], 'Israel', rate_limiter=limiter, session=Session())
+
+    start = time.monotonic()
+    assert fetcher._get(URL).status_code == 200
+    assert time.monotonic() - start < 1
+    assert limiter.current_rate(URL) < 100
@@ -0,0 +1,29 @@
+from linkedin_fetcher import canonicalize_job_url, extract_job_id
+from seen_index import SeenIndex
+
+
+def test_url_variants_share_one_job_id():
+    urls = [
+        'https://www.linkedin.com/jobs/view/junior-developer-at-acme-3901234567?refId=abc&trackingId=xyz',
+        'https://il.linkedin.com/jobs/view/3901234567/',
+        'https://www.linkedin.com/jobs/search/?currentJobId=3901234567&keywords=python',
+    ]
+
+    assert {extract_job_id(url) for url in urls} == {'3901234567'}
+    assert {canonicalize_job_url(url) for url in urls} == {'https://www.linkedin.com/jobs/view/3901234567/'}
+
+
+def test_seen_ids_persist_across_reopen(tmp_path):
+    path = str(tmp_path / 'seen.bloom')
+    index = SeenIndex(path, capacity=1000)
+    index.add_many(str(job_id) for job_id in range(100))
+    index.close()
+
+    index = SeenIndex(path)
+    try:
+        assert all(str(job_id) in index for job_id in range(100))
+        assert len(index) == 100
+        # Far below capacity, so false positives are rare
+        assert sum(str(job_id) in index for job_id in range(1000, 2000)) < 10
+    finally:
+        index.close()